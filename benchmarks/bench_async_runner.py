@@ -0,0 +1,63 @@
+"""
+Compares per item setup cost of async case providers of sync tests run by native runner & by pytest-asyncio.
+
+Usage: python -m benchmarks.bench_async_runner [--cases N] [--loop-factory SPEC ...]
+"""
+
+import argparse
+
+from benchmarks.utils import print_table, run_pytest
+
+TESTFILE_TEMPLATE = """
+import asyncio
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func()
+def test_tiny(number: int) -> None:
+    assert number >= 0
+
+
+def build_case(value: int):
+    async def case() -> int:
+        await asyncio.sleep(0)
+        return value
+
+    return case
+
+
+for i in range({cases}):
+    test_tiny.append(build_case(i), name=f"case_{{i}}")
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=5_000)
+    parser.add_argument("--loop-factory", nargs="*", default=["asyncio", "auto"])
+    ns = parser.parse_args()
+
+    source = TESTFILE_TEMPLATE.format(cases=ns.cases)
+
+    baseline = run_pytest(source, "--asyncio-mode=auto", "--case-async-runner=plugin")
+    rows: list[tuple[object, ...]] = [
+        ("pytest-asyncio", f"{baseline:.2f}", f"{baseline / ns.cases * 1e6:.0f}", "1.0x"),
+    ]
+
+    for loop_factory in ns.loop_factory:
+        elapsed = run_pytest(source, "--case-async-runner=native", f"--case-loop-factory={loop_factory}")
+        rows.append(
+            (
+                f"native ({loop_factory})",
+                f"{elapsed:.2f}",
+                f"{elapsed / ns.cases * 1e6:.0f}",
+                f"{baseline / elapsed:.1f}x",
+            )
+        )
+
+    print_table(["runner", "seconds", "us/item", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compares run time of many tiny cases executed as separate items & as batches of cases.
+
+Usage: python -m benchmarks.bench_batch [--cases N] [--batch N ...]
+"""
+
+import argparse
+
+from benchmarks.utils import print_table, run_pytest
+
+TESTFILE_TEMPLATE = """
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func({options})
+def test_tiny(number: int) -> None:
+    assert number >= 0
+
+
+def build_case(value: int):
+    def case() -> int:
+        return value
+
+    return case
+
+
+for i in range({cases}):
+    test_tiny.append(build_case(i), name=f"case_{{i}}")
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, nargs="*", default=[10, 100, 1000])
+    ns = parser.parse_args()
+
+    baseline = run_pytest(TESTFILE_TEMPLATE.format(options="", cases=ns.cases))
+    rows: list[tuple[object, ...]] = [("none", f"{baseline:.2f}", f"{ns.cases / baseline:.0f}", "1.0x")]
+
+    for batch in ns.batch:
+        elapsed = run_pytest(TESTFILE_TEMPLATE.format(options=f"batch={batch}", cases=ns.cases))
+        rows.append((batch, f"{elapsed:.2f}", f"{ns.cases / elapsed:.0f}", f"{baseline / elapsed:.1f}x"))
+
+    print_table(["batch", "seconds", "cases/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares collection time of huge case sets with `metafunc.parametrize` & with direct item generation.
+
+Usage: python -m benchmarks.bench_items [--cases N ...]
+"""
+
+import argparse
+
+from benchmarks.utils import print_table, run_pytest
+
+TESTFILE_TEMPLATE = """
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func()
+def test_number(number: int) -> None:
+    assert number >= 0
+
+
+def build_case(value: int):
+    def case() -> int:
+        return value
+
+    return case
+
+
+for i in range({cases}):
+    test_number.append(build_case(i), name=f"case_{{i}}")
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, nargs="*", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    ns = parser.parse_args()
+
+    rows = list[tuple[object, ...]]()
+    for cases in ns.cases:
+        source = TESTFILE_TEMPLATE.format(cases=cases)
+        # NOTE: `-qq` doesn't print each collected item, so the output doesn't distort collection time.
+        baseline = min(run_pytest(source, "-q", "--collect-only") for _ in range(ns.repeat))
+        elapsed = min(run_pytest(source, "-q", "--collect-only", "--case-direct-items") for _ in range(ns.repeat))
+        rows.append(
+            (
+                cases,
+                f"{baseline:.2f}",
+                f"{elapsed:.2f}",
+                f"{cases / baseline:.0f}",
+                f"{cases / elapsed:.0f}",
+                f"{baseline / elapsed:.1f}x",
+            )
+        )
+
+    print_table(["cases", "parametrize s", "direct s", "parametrize items/s", "direct items/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
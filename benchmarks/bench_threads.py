@@ -0,0 +1,57 @@
+"""
+Compares run time of CPU bound cases executed one by one & in threads (`threads=N`).
+
+Threads speed cases up only on free-threaded python builds (e.g. `python3.13t` with `PYTHON_GIL=0`), cases are run one
+by one when the GIL is enabled.
+
+Usage: python -m benchmarks.bench_threads [--cases N] [--work N] [--threads N ...]
+"""
+
+import argparse
+import sys
+
+from benchmarks.utils import print_table, run_pytest
+
+TESTFILE_TEMPLATE = """
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func({options})
+def test_cpu_bound(number: int) -> None:
+    assert sum(i * i for i in range({work})) >= number
+
+
+def build_case(value: int):
+    def case() -> int:
+        return value
+
+    return case
+
+
+for i in range({cases}):
+    test_cpu_bound.append(build_case(i), name=f"case_{{i}}")
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=64)
+    parser.add_argument("--work", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, nargs="*", default=[1, 2, 4, 8])
+    ns = parser.parse_args()
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+
+    baseline = run_pytest(TESTFILE_TEMPLATE.format(options="", cases=ns.cases, work=ns.work))
+    rows: list[tuple[object, ...]] = [("none", f"{baseline:.2f}", f"{ns.cases / baseline:.0f}", "1.0x")]
+
+    for threads in ns.threads:
+        elapsed = run_pytest(TESTFILE_TEMPLATE.format(options=f"threads={threads}", cases=ns.cases, work=ns.work))
+        rows.append((threads, f"{elapsed:.2f}", f"{ns.cases / elapsed:.0f}", f"{baseline / elapsed:.1f}x"))
+
+    print_table(["threads", "seconds", "cases/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+
+def run_pytest(source: str, *args: str) -> float:
+    """Run pytest in a subprocess against a temporary test module, returns wall clock time in seconds."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "test_bench.py"
+        path.write_text(source)
+
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-o", "addopts=", *args, str(path)],
+            cwd=tmpdir,
+            check=False,
+            capture_output=True,
+        )
+        return time.perf_counter() - start
+
+
+def print_table(header: t.Sequence[str], rows: t.Sequence[t.Sequence[object]]) -> None:
+    widths = [max(len(str(cell)) for cell in column) for column in zip(header, *rows)]
+    for row in (header, *rows):
+        print("  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)))
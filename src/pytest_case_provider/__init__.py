@@ -1,9 +1,17 @@
 __all__ = [
+    "CasePool",
+    "CasePoolStats",
+    "CaseResource",
     "CaseStorage",
+    "CaseTable",
+    "CaseTableRow",
     "CompositeCaseStorage",
     "inject_cases_func",
     "inject_cases_method",
 ]
 
 from pytest_case_provider.case.decorator import inject_cases_func, inject_cases_method
+from pytest_case_provider.case.pool import CasePool, CasePoolStats
+from pytest_case_provider.case.resource import CaseResource
 from pytest_case_provider.case.storage import CaseStorage, CompositeCaseStorage
+from pytest_case_provider.case.table import CaseTable, CaseTableRow
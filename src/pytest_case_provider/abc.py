@@ -2,8 +2,12 @@ import abc
 import inspect
 import typing as t
 
+from _pytest.python import FunctionDefinition
+
 from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.options import CaseBatchOptions
 
+T = t.TypeVar("T")
 V_co = t.TypeVar("V_co", covariant=True)
 
 
@@ -27,3 +31,12 @@ class CaseParametrizer(CaseCollector[V_co], metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def get_case_param(self) -> inspect.Parameter:
         raise NotImplementedError
+
+    def get_batch_options(self) -> t.Optional[CaseBatchOptions]:
+        return None
+
+
+class CaseReorderer(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def reorder(self, definition: FunctionDefinition, cases: t.Sequence[CaseInfo[T]]) -> t.Sequence[CaseInfo[T]]:
+        raise NotImplementedError
@@ -0,0 +1,561 @@
+import asyncio
+import inspect
+import sys
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager, nullcontext
+from dataclasses import dataclass
+
+import pytest
+from _pytest._code import ExceptionInfo
+from _pytest._code.code import TerminalRepr
+from _pytest.config import Config
+from _pytest.fixtures import SubRequest
+from _pytest.mark import KeywordMatcher, Mark, MarkDecorator
+from _pytest.mark.expression import Expression
+from _pytest.nodes import Item
+from _pytest.outcomes import Exit, OutcomeException, Skipped, XFailed
+from _pytest.python import Metafunc
+from _pytest.reports import TestReport
+from _pytest.skipping import Xfail, evaluate_condition, evaluate_xfail_marks
+from typing_extensions import override
+
+from pytest_case_provider.case.budget import get_case_provision_budget
+from pytest_case_provider.case.info import CaseInfo, get_item_definition_id, set_report_case
+from pytest_case_provider.case.options import CaseBatchOptions
+from pytest_case_provider.case.runner import get_case_async_runner
+
+
+@dataclass(frozen=True)
+class CaseRunStart:
+    """Start of the case run: epoch time for the report & performance counter for precise duration."""
+
+    time: float
+    counter: float
+
+    @classmethod
+    def now(cls) -> "CaseRunStart":
+        return cls(time.time(), time.perf_counter())
+
+
+@dataclass(frozen=True)
+class CaseBatchFailure:
+    case: CaseInfo[object]
+    excinfo: ExceptionInfo[BaseException]
+    longrepr: t.Union[str, TerminalRepr]
+
+
+class CaseBatchError(Exception):
+    """Raised when some cases of the batch failed, holds failure info of each case."""
+
+    def __init__(self, total: int, failures: t.Sequence[CaseBatchFailure]) -> None:
+        super().__init__(total, failures)
+        self.total = total
+        self.failures = failures
+
+    @override
+    def __str__(self) -> str:
+        lines = [f"{len(self.failures)} of {self.total} cases failed"]
+
+        for failure in self.failures:
+            lines.append("")
+            lines.append(f"[{failure.case.name}] {failure.excinfo.exconly().strip()}")
+            lines.append(str(failure.longrepr))
+
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class CaseBatch:
+    """A chunk of cases to run within one pytest item."""
+
+    cases: t.Sequence[CaseInfo[object]]
+    options: CaseBatchOptions
+
+    @property
+    def id(self) -> str:
+        first, last = self.cases[0], self.cases[-1]
+        return first.name if first is last else f"{first.name}..{last.name}"
+
+
+class CaseBatchRunner:
+    """
+    Provides cases of the batch & passes them to the test function within one pytest item.
+
+    Cases are run one by one, cases of async test function are run concurrently when batch concurrency is set. Cases
+    of sync test function are run in threads when batch threads are set & the GIL is disabled (free-threaded build),
+    case providers access fixtures, so they are run one at a time, and cases are reported from the calling thread.
+    Failed cases are raised as `CaseBatchError` unless each case is reported separately.
+    """
+
+    def __init__(self, batch: CaseBatch, request: SubRequest) -> None:
+        self.__cases = batch.cases
+        self.__options = batch.options
+        self.__request = request
+        self.__item: Item = request.node
+        self.__budget = get_case_provision_budget(request.config)
+        self.__async_runner = get_case_async_runner(request.config)
+        self.__provision_lock = threading.Lock()
+
+    @override
+    def __str__(self) -> str:
+        return f"<{self.__class__.__name__}: {', '.join(case.name for case in self.__cases)}>"
+
+    def run(
+        self,
+        func: t.Callable[..., object],
+        name: str,
+        args: t.Sequence[object],
+        kwargs: t.Mapping[str, object],
+    ) -> t.Optional[t.Coroutine[None, None, None]]:
+        if inspect.iscoroutinefunction(func):
+            return self.__run_async(func, name, args, kwargs)
+
+        self.__run_sync(func, name, args, kwargs)
+        return None
+
+    def __run_sync(
+        self,
+        func: t.Callable[..., object],
+        name: str,
+        args: t.Sequence[object],
+        kwargs: t.Mapping[str, object],
+    ) -> None:
+        if self.__options.threads > 1 and not is_gil_enabled():
+            results = self.__run_sync_threads(func, name, args, kwargs)
+
+        else:
+            results = [
+                self.__finish_case(case, *self.__call_case_sync(func, name, args, kwargs, case))
+                for case in self.__cases
+            ]
+
+        self.__raise_failures(results)
+
+    def __run_sync_threads(
+        self,
+        func: t.Callable[..., object],
+        name: str,
+        args: t.Sequence[object],
+        kwargs: t.Mapping[str, object],
+    ) -> t.Sequence[t.Optional[CaseBatchFailure]]:
+        results = dict[int, t.Optional[CaseBatchFailure]]()
+
+        with ThreadPoolExecutor(max_workers=self.__options.threads, thread_name_prefix="case-batch") as pool:
+            futures = {
+                pool.submit(self.__call_case_sync, func, name, args, kwargs, case): i
+                for i, case in enumerate(self.__cases)
+            }
+
+            # NOTE: pytest reporting (and output capturing) is not thread safe, so cases are reported by this thread.
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = self.__finish_case(self.__cases[i], *future.result())
+
+        return [results[i] for i in range(len(self.__cases))]
+
+    def __call_case_sync(
+        self,
+        func: t.Callable[..., object],
+        name: str,
+        args: t.Sequence[object],
+        kwargs: t.Mapping[str, object],
+        case: CaseInfo[object],
+    ) -> tuple[CaseRunStart, t.Optional[ExceptionInfo[BaseException]]]:
+        start = CaseRunStart.now()
+
+        try:
+            self.__check_skipped(case)
+            with self.__provide_sync_locked(case) as value:
+                func(*args, **{**kwargs, name: value})
+
+        # NOTE: `pytest.exit` stops the session, other outcomes (e.g. `pytest.fail`) are outcomes of the case.
+        except Exit:
+            raise
+
+        except (Exception, OutcomeException) as err:  # noqa: BLE001
+            return start, ExceptionInfo.from_exception(err)
+
+        return start, None
+
+    def __finish_case(
+        self,
+        case: CaseInfo[object],
+        start: CaseRunStart,
+        excinfo: t.Optional[ExceptionInfo[BaseException]],
+    ) -> t.Optional[CaseBatchFailure]:
+        if excinfo is not None and isinstance(excinfo.value, XFailed):
+            reason = str(excinfo.value.msg)
+            self.__report_skipped(case, start, reason, wasxfail=reason)
+            return None
+
+        xfail = self.__evaluate_xfail(case) if excinfo is None or not isinstance(excinfo.value, Skipped) else None
+        if xfail is not None:
+            return self.__handle_xfail(case, start, excinfo, xfail)
+
+        if excinfo is not None:
+            return self.__handle_exception(case, start, excinfo)
+
+        self.__report_passed(case, start)
+        return None
+
+    async def __run_async(
+        self,
+        func: t.Callable[..., t.Awaitable[object]],
+        name: str,
+        args: t.Sequence[object],
+        kwargs: t.Mapping[str, object],
+    ) -> None:
+        if self.__options.concurrency > 1:
+            # NOTE: cases of the batch are independent, so they are run as tasks & awaits of one case overlap others.
+            semaphore = asyncio.Semaphore(self.__options.concurrency)
+
+            async def run_case(case: CaseInfo[object]) -> t.Optional[CaseBatchFailure]:
+                async with semaphore:
+                    return await self.__run_case_async(func, name, args, kwargs, case)
+
+            # NOTE: case failures (`pytest.fail` too) are caught per case, other errors (e.g. `pytest.exit`) stop the
+            #  batch, so cases left running are cancelled & awaited to finalize their values.
+            tasks = [asyncio.ensure_future(run_case(case)) for case in self.__cases]
+            try:
+                results = await asyncio.gather(*tasks)
+
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        else:
+            results = [await self.__run_case_async(func, name, args, kwargs, case) for case in self.__cases]
+
+        self.__raise_failures(results)
+
+    async def __run_case_async(
+        self,
+        func: t.Callable[..., t.Awaitable[object]],
+        name: str,
+        args: t.Sequence[object],
+        kwargs: t.Mapping[str, object],
+        case: CaseInfo[object],
+    ) -> t.Optional[CaseBatchFailure]:
+        start = CaseRunStart.now()
+
+        try:
+            self.__check_skipped(case)
+            async with self.__budget.provide_async(case, self.__request) as value:
+                await func(*args, **{**kwargs, name: value})
+
+        except Exit:
+            raise
+
+        except (Exception, OutcomeException):  # noqa: BLE001
+            return self.__finish_case(case, start, ExceptionInfo.from_current())
+
+        return self.__finish_case(case, start, None)
+
+    def __raise_failures(self, results: t.Sequence[t.Optional[CaseBatchFailure]]) -> None:
+        # NOTE: failed cases reported separately fail the session on their own, the batch item doesn't repeat them.
+        failures = [failure for failure in results if failure is not None]
+        if failures and not self.__options.subtests:
+            raise CaseBatchError(len(self.__cases), failures)
+
+    @contextmanager
+    def __provide_sync_locked(self, case: CaseInfo[object]) -> t.Iterator[object]:
+        stack = ExitStack()
+        with self.__provision_lock:
+            value = stack.enter_context(self.__provide_sync(case))
+
+        try:
+            yield value
+
+        finally:
+            with self.__provision_lock:
+                stack.close()
+
+    def __provide_sync(self, case: CaseInfo[object]) -> t.ContextManager[object]:
+        if case.provider.is_async and self.__async_runner is not None:
+            return self.__async_runner.provide(case, self.__request)
+
+        return self.__budget.provide_sync(case, self.__request)
+
+    def __check_skipped(self, case: CaseInfo[object]) -> None:
+        # NOTE: case marks are not applied to the batch item, thus skip marks have to be evaluated for each case.
+        for mark in (mark.mark if isinstance(mark, MarkDecorator) else mark for mark in case.marks):
+            reason = self.__evaluate_skip_mark(mark)
+            if reason is not None:
+                pytest.skip(reason)
+
+        xfail = self.__evaluate_xfail(case)
+        if xfail is not None and not xfail.run:
+            pytest.xfail(f"[NOTRUN] {xfail.reason}")
+
+    def __evaluate_skip_mark(self, mark: Mark) -> t.Optional[str]:
+        if mark.name == "skip":
+            return str(mark.kwargs.get("reason", mark.args[0] if mark.args else "unconditional skip"))
+
+        if mark.name == "skipif":
+            conditions = mark.args if "condition" not in mark.kwargs else (mark.kwargs["condition"],)
+            if not conditions:
+                return str(mark.kwargs.get("reason", ""))
+
+            for condition in conditions:
+                result, reason = evaluate_condition(self.__item, mark, condition)
+                if result:
+                    return reason
+
+        return None
+
+    def __evaluate_xfail(self, case: CaseInfo[object]) -> t.Optional[Xfail]:
+        if self.__item.config.option.runxfail:
+            return None
+
+        # NOTE: case marks are not applied to the batch item, so xfail marks are evaluated on the item with case marks.
+        return evaluate_xfail_marks(t.cast("Item", _CaseMarkedItem(self.__item, case)))
+
+    def __handle_xfail(
+        self,
+        case: CaseInfo[object],
+        start: CaseRunStart,
+        excinfo: t.Optional[ExceptionInfo[BaseException]],
+        xfail: Xfail,
+    ) -> t.Optional[CaseBatchFailure]:
+        if excinfo is None:
+            if xfail.strict:
+                try:
+                    pytest.fail(f"[XPASS(strict)] {xfail.reason}", pytrace=False)
+
+                except pytest.fail.Exception:
+                    return self.__handle_exception(case, start, ExceptionInfo.from_current())
+
+            self.__report_passed(case, start, wasxfail=xfail.reason)
+            return None
+
+        if not _is_expected_failure(excinfo.value, xfail):
+            return self.__handle_exception(case, start, excinfo)
+
+        self.__report_skipped(case, start, excinfo.exconly(), wasxfail=xfail.reason)
+        return None
+
+    def __handle_exception(
+        self,
+        case: CaseInfo[object],
+        start: CaseRunStart,
+        excinfo: ExceptionInfo[BaseException],
+    ) -> t.Optional[CaseBatchFailure]:
+        if isinstance(excinfo.value, Skipped):
+            self.__report_skipped(case, start, str(excinfo.value.msg))
+            return None
+
+        failure = CaseBatchFailure(case, excinfo, self.__item.repr_failure(excinfo))
+        if self.__options.subtests:
+            self.__report(case, start, "failed", failure.longrepr)
+
+        return failure
+
+    def __report_passed(self, case: CaseInfo[object], start: CaseRunStart, wasxfail: t.Optional[str] = None) -> None:
+        if self.__options.subtests:
+            self.__report(case, start, "passed", None, wasxfail)
+
+    def __report_skipped(
+        self,
+        case: CaseInfo[object],
+        start: CaseRunStart,
+        reason: str,
+        wasxfail: t.Optional[str] = None,
+    ) -> None:
+        if self.__options.subtests:
+            self.__report(case, start, "skipped", (str(self.__item.path), 0, f"Skipped: {reason}"), wasxfail)
+
+    def __report(
+        self,
+        case: CaseInfo[object],
+        start: CaseRunStart,
+        outcome: t.Literal["passed", "failed", "skipped"],
+        longrepr: t.Union[None, tuple[str, int, str], str, TerminalRepr],
+        wasxfail: t.Optional[str] = None,
+    ) -> None:
+        report = build_case_report(self.__item, case, start, outcome, longrepr, wasxfail=wasxfail)
+
+        # NOTE: case is reported during item call, so output capturing should be disabled to show the report.
+        capman = self.__item.config.pluginmanager.getplugin("capturemanager")
+        with capman.global_and_fixture_disabled() if capman is not None else nullcontext():
+            self.__item.ihook.pytest_runtest_logreport(report=report)
+
+
+def build_case_report(  # noqa: PLR0913
+    item: Item,
+    case: CaseInfo[object],
+    start: CaseRunStart,
+    outcome: t.Literal["passed", "failed", "skipped"],
+    longrepr: t.Union[None, tuple[str, int, str], str, TerminalRepr],
+    *,
+    wasxfail: t.Optional[str] = None,
+) -> TestReport:
+    """
+    Build a report of a single case that was run within the item, the case is reported with own node id.
+
+    Start & stop of the report are epoch times (as of pytest reports), the duration is measured by performance counter.
+    """
+    path, lineno, domain = item.location
+    duration = time.perf_counter() - start.counter
+    report = TestReport(
+        nodeid=get_case_report_nodeid(item, case),
+        location=(path, lineno, f"{domain}[{case.name}]"),
+        keywords={**dict.fromkeys(item.keywords, 1), case.name: 1},
+        outcome=outcome,
+        longrepr=longrepr,
+        when="call",
+        duration=duration,
+        start=start.time,
+        stop=start.time + duration,
+    )
+    set_report_case(report, get_item_definition_id(item), case.name)
+
+    # NOTE: pytest checks presence of `wasxfail` attribute to report xfailed & xpassed outcomes.
+    if wasxfail is not None:
+        report.wasxfail = wasxfail
+
+    return report
+
+
+def get_case_report_nodeid(item: Item, case: CaseInfo[object]) -> str:
+    """Get node id of the case that was run within the item (e.g. to select it with `--lf`)."""
+    return f"{item.nodeid}[{case.name}]"
+
+
+def find_item_case_batch(item: Item) -> t.Optional[CaseBatch]:
+    """Find the case batch injected into pytest item, returns `None` if item is not batch parametrized."""
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+
+    return next((value for value in callspec.params.values() if isinstance(value, CaseBatch)), None)
+
+
+def select_batch_cases(metafunc: Metafunc, cases: t.Sequence[CaseInfo[object]]) -> t.Sequence[CaseInfo[object]]:
+    """
+    Select cases of batched test function by `-k` expression & cases failed last run (`--lf`).
+
+    Cases of a batch are not pytest items, so pytest can't select them, the batch items are built of selected cases.
+    All cases are kept when none of them is selected, so pytest selects (or deselects) the items as usual.
+    """
+    selected = cases
+
+    keyword = metafunc.config.option.keyword.lstrip()
+    if keyword:
+        expression = Expression.compile(keyword)
+        names = KeywordMatcher.from_item(metafunc.definition)._names  # noqa: SLF001
+        selected = [case for case in selected if expression.evaluate(KeywordMatcher({*names, case.name}))]
+
+    # NOTE: `--lf` option is not defined when the cache provider plugin is disabled.
+    if metafunc.config.getoption("lf", default=False):
+        failed = _find_last_failed_case_names(metafunc.config, metafunc.definition.nodeid)
+        selected = [case for case in selected if case.name in failed] or selected
+
+    return selected or cases
+
+
+class CaseBatchReporter:
+    """
+    Reports batches which cases are reported separately as these cases.
+
+    The batch item is not counted (its cases are), and the batch item is selected by `--lf` & `--ff` when any of its
+    cases failed last run.
+    """
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config: Config, items: t.Sequence[Item]) -> None:
+        lastfailed = _get_last_failed(config)
+        if lastfailed is None:
+            return
+
+        for item in items:
+            batch = find_item_case_batch(item)
+            if batch is None:
+                continue
+
+            failed = _find_last_failed_case_names(config, get_item_definition_id(item))
+            if any(case.name in failed for case in batch.cases):
+                lastfailed[item.nodeid] = True
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        # NOTE: progress of the run is counted by reported node ids, the batch item reports a node id of each case.
+        for item in session.items:
+            batch = find_item_case_batch(item)
+            if batch is not None and batch.options.subtests:
+                session.testscollected += len(batch.cases) - 1
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item: Item) -> t.Generator[None, TestReport, TestReport]:
+        report = yield
+
+        batch = find_item_case_batch(item)
+        if batch is not None and batch.options.subtests and report.when == "call" and report.passed:
+            report.case_batch = True  # type: ignore[attr-defined]
+
+        return report
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_report_teststatus(self, report: TestReport) -> t.Optional[tuple[str, str, str]]:
+        if getattr(report, "case_batch", False):
+            return "", "", ""
+
+        return None
+
+
+def is_gil_enabled() -> bool:
+    """Check if the GIL is enabled, it is always enabled before python 3.13."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return bool(check()) if check is not None else True
+
+
+def _get_last_failed(config: Config) -> t.Optional[dict[str, bool]]:
+    lfplugin = config.pluginmanager.getplugin("lfplugin")
+    if lfplugin is None or not getattr(lfplugin, "active", False):
+        return None
+
+    return t.cast("dict[str, bool]", lfplugin.lastfailed)
+
+
+def _find_last_failed_case_names(config: Config, definition_id: str) -> t.Collection[str]:
+    lastfailed = _get_last_failed(config)
+    if not lastfailed:
+        return ()
+
+    # NOTE: the case name is the last id of the node id, e.g. `test.py::test_func[case_one..case_two][case_two]`.
+    return {
+        nodeid[:-1].rsplit("[", 1)[-1]
+        for nodeid in lastfailed
+        if nodeid.startswith(f"{definition_id}[") and nodeid.endswith("]")
+    }
+
+
+class _CaseMarkedItem:
+    """The item with marks of the case (case marks are not applied to the batch item)."""
+
+    def __init__(self, item: Item, case: CaseInfo[object]) -> None:
+        self.__item = item
+        self.__marks = [mark.mark if isinstance(mark, MarkDecorator) else mark for mark in case.marks]
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.__item, name)
+
+    def iter_markers(self, name: t.Optional[str] = None) -> t.Iterator[Mark]:
+        return (mark for mark in self.__marks if name is None or mark.name == name)
+
+
+def _is_expected_failure(error: BaseException, xfail: Xfail) -> bool:
+    raises = xfail.raises
+    if raises is None:
+        return True
+
+    if isinstance(raises, (type, tuple)):
+        return isinstance(error, raises)
+
+    # NOTE: `pytest.RaisesExc` matchers (pytest 8.4+).
+    return bool(raises.matches(error))
@@ -0,0 +1,213 @@
+import inspect
+import json
+import statistics
+import time
+import typing as t
+import warnings
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config
+from _pytest.python import Function
+from _pytest.terminal import TerminalReporter
+
+from pytest_case_provider.case.info import find_item_case_info, get_item_definition_id
+
+_BENCHMARK_WORKER_OUTPUT_KEY: t.Final[str] = "case_benchmark"
+# NOTE: a round should be much longer than the timer resolution, so fast test bodies are repeated within each round.
+_MIN_ROUND_TIME: t.Final[float] = 1e-3
+_MIN_ROUNDS: t.Final[int] = 5
+_MAX_ROUNDS: t.Final[int] = 1_000
+# NOTE: a regression should also exceed the noise of both measurements.
+_NOISE_MADS: t.Final[float] = 3.0
+
+CaseBenchmarkResults = dict[str, dict[str, "CaseBenchmarkStats"]]
+
+
+class CaseBenchmarkWarning(pytest.PytestWarning):
+    """Case run time regressed past the threshold compared to the baseline."""
+
+
+@dataclass(frozen=True)
+class CaseBenchmarkStats:
+    """
+    Run time of one test body call with the case (in seconds).
+
+    :param mad: median absolute deviation of the call time, a robust measure of the noise.
+    :param loops: number of calls within each measured round.
+    """
+
+    median: float
+    mad: float
+    min: float
+    rounds: int
+    loops: int
+
+    @classmethod
+    def from_rounds(cls, times: t.Sequence[float], loops: int) -> "CaseBenchmarkStats":
+        median = statistics.median(times)
+        return cls(
+            median=median,
+            mad=statistics.median(abs(value - median) for value in times),
+            min=min(times),
+            rounds=len(times),
+            loops=loops,
+        )
+
+    def is_regressed(self, baseline: "CaseBenchmarkStats", threshold: float) -> bool:
+        noise = _NOISE_MADS * max(self.mad, baseline.mad)
+        return self.median - baseline.median > max(threshold * baseline.median, noise)
+
+
+class CaseBenchmark:
+    """
+    Benchmarks the test body of each case parametrized item.
+
+    The test body is called once (a failure fails the item as usual), then the number of calls per round is
+    calibrated (calibration calls are the warmup) and rounds are measured until the time budget is spent. The case
+    value & fixtures are reused by all calls, so the test body should not mutate them. Batched items & async test
+    functions are run as usual, without benchmarking.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        config: Config,
+        time_budget: float = 0.5,
+        path: t.Optional[Path] = None,
+        baseline_path: t.Optional[Path] = None,
+        threshold: float = 0.1,
+        *,
+        fail_on_regression: bool = False,
+    ) -> None:
+        self.__time_budget = time_budget
+        self.__path = path
+        self.__threshold = threshold
+        self.__fail_on_regression = fail_on_regression
+        self.__baseline = load_case_benchmark_results(baseline_path) if baseline_path is not None else {}
+        self.__results: CaseBenchmarkResults = {}
+        self.__regressions = set[tuple[str, str]]()
+        self.__workeroutput: t.Optional[dict[str, object]] = getattr(config, "workeroutput", None)
+
+    @property
+    def results(self) -> t.Mapping[str, t.Mapping[str, CaseBenchmarkStats]]:
+        return self.__results
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem: Function) -> t.Optional[bool]:
+        case = find_item_case_info(pyfuncitem)
+        if case is None or inspect.iscoroutinefunction(pyfuncitem.obj):
+            return None
+
+        func = pyfuncitem.obj
+        kwargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}  # noqa: SLF001
+
+        def call() -> None:
+            func(**kwargs)
+
+        call()
+
+        definition_id = get_item_definition_id(pyfuncitem)
+        stats = self.__results.setdefault(definition_id, {})[case.name] = self.__measure(call)
+
+        baseline = self.__baseline.get(definition_id, {}).get(case.name)
+        if baseline is not None and stats.is_regressed(baseline, self.__threshold):
+            self.__regressions.add((definition_id, case.name))
+            msg = (
+                f"case {case.name} regressed: median {_format_time(stats.median)} vs baseline "
+                f"{_format_time(baseline.median)} ({stats.median / baseline.median - 1:+.1%})"
+            )
+            if self.__fail_on_regression:
+                pytest.fail(msg, pytrace=False)
+
+            warnings.warn(CaseBenchmarkWarning(msg), stacklevel=1)
+
+        return True
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        # NOTE: pytest-xdist controller receives results of the worker when it's finished.
+        workeroutput = getattr(node, "workeroutput", None) or {}
+        for definition_id, cases in _parse_results(workeroutput.get(_BENCHMARK_WORKER_OUTPUT_KEY, {})).items():
+            self.__results.setdefault(definition_id, {}).update(cases)
+
+    def pytest_sessionfinish(self) -> None:
+        if self.__workeroutput is not None:
+            self.__workeroutput[_BENCHMARK_WORKER_OUTPUT_KEY] = _dump_results(self.__results)
+            return
+
+        if self.__path is not None and self.__results:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            self.__path.write_text(json.dumps({"benchmarks": _dump_results(self.__results)}, indent=2))
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        if not self.__results:
+            return
+
+        terminalreporter.write_sep("=", "case benchmark")
+        for definition_id, cases in self.__results.items():
+            for name, stats in cases.items():
+                baseline = self.__baseline.get(definition_id, {}).get(name)
+                change = f"{stats.median / baseline.median - 1:+8.1%}" if baseline is not None else " " * 8
+                mark = "  REGRESSED" if (definition_id, name) in self.__regressions else ""
+                terminalreporter.write_line(
+                    f"{_format_time(stats.median):>10} ±{_format_time(stats.mad):>9} {change}  "
+                    f"{definition_id}[{name}]{mark}"
+                )
+
+        if self.__path is not None:
+            terminalreporter.write_line(f"case benchmark results: {self.__path}")
+
+    def __measure(self, call: t.Callable[[], None]) -> CaseBenchmarkStats:
+        loops = 1
+        while (elapsed := _time_round(call, loops)) < _MIN_ROUND_TIME:
+            loops = max(loops * 2, int(loops * _MIN_ROUND_TIME / max(elapsed, 1e-9)))
+
+        times = list[float]()
+        deadline = time.perf_counter() + self.__time_budget
+        while len(times) < _MIN_ROUNDS or (len(times) < _MAX_ROUNDS and time.perf_counter() < deadline):
+            times.append(_time_round(call, loops) / loops)
+
+        return CaseBenchmarkStats.from_rounds(times, loops)
+
+
+def load_case_benchmark_results(path: Path) -> CaseBenchmarkResults:
+    """Load results written with `--case-benchmark-json`, missing file is an error."""
+    try:
+        raw = json.loads(path.read_text())
+
+    except (OSError, ValueError) as err:
+        msg = f"can't load case benchmark baseline: {path}: {err}"
+        raise pytest.UsageError(msg) from err
+
+    return _parse_results(raw.get("benchmarks", {}) if isinstance(raw, dict) else {})
+
+
+def _time_round(call: t.Callable[[], None], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        call()
+
+    return time.perf_counter() - start
+
+
+def _dump_results(results: CaseBenchmarkResults) -> dict[str, dict[str, dict[str, object]]]:
+    return {
+        definition_id: {name: asdict(stats) for name, stats in cases.items()}
+        for definition_id, cases in results.items()
+    }
+
+
+def _parse_results(raw: t.Mapping[str, t.Mapping[str, t.Mapping[str, t.Any]]]) -> CaseBenchmarkResults:
+    return {
+        definition_id: {name: CaseBenchmarkStats(**stats) for name, stats in cases.items()}
+        for definition_id, cases in raw.items()
+    }
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f}{unit}"
+
+    return f"{seconds / 1e-9:.1f}ns"
@@ -0,0 +1,145 @@
+import asyncio
+import time
+import typing as t
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+
+import pytest
+from _pytest.config import Config
+from _pytest.fixtures import SubRequest
+from typing_extensions import override
+
+from pytest_case_provider.case.hooks import CaseProvisionHooks
+from pytest_case_provider.case.info import CaseInfo
+
+T = t.TypeVar("T")
+
+
+class CaseProviderTimeoutError(TimeoutError):
+    """Raised when case provider runs longer than the timeout."""
+
+    def __init__(self, case: str, timeout: float, elapsed: float, stage: str = "setup") -> None:
+        super().__init__(case, timeout, elapsed, stage)
+        self.case = case
+        self.timeout = timeout
+        self.elapsed = elapsed
+        self.stage = stage
+
+    @override
+    def __str__(self) -> str:
+        return (
+            f"case {self.case!r} provider {self.stage} timed out: elapsed {self.elapsed:.3f}s, "
+            f"timeout {self.timeout:.3f}s"
+        )
+
+
+class CaseProvisionBudget:
+    """
+    Limits time & concurrency of case providers.
+
+    Async providers are cancelled on timeout. Sync providers can't be interrupted, thus the timeout error is raised
+    after sync provider returns. The concurrency limit is applied to the construction of async case values (not to
+    their lifetime), one semaphore is used for each event loop.
+    """
+
+    def __init__(self, timeout: t.Optional[float] = None, concurrency: t.Optional[int] = None) -> None:
+        if concurrency is not None and concurrency < 1:
+            msg = f"concurrency must be positive, got: {concurrency}"
+            raise ValueError(msg)
+
+        self.__timeout = timeout
+        self.__concurrency = concurrency
+        self.__semaphores = weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]()
+
+    @contextmanager
+    def provide_sync(self, case: CaseInfo[T], request: SubRequest) -> t.Iterator[T]:
+        timeout = self.__get_timeout(case)
+        hooks = CaseProvisionHooks(request.node, case)
+
+        start = hooks.provide_start()
+        with case.provider.provide_sync(request) as value:
+            hooks.provide_finish(start)
+            if timeout is not None:
+                self.__check_elapsed(case, timeout, start, "setup")
+
+            yield value
+            start = time.perf_counter()
+
+        hooks.teardown(start)
+        if timeout is not None:
+            self.__check_elapsed(case, timeout, start, "teardown")
+
+    @asynccontextmanager
+    async def provide_async(self, case: CaseInfo[T], request: SubRequest) -> t.AsyncIterator[T]:
+        timeout = self.__get_timeout(case)
+        hooks = CaseProvisionHooks(request.node, case)
+        provision = case.provider.provide_async(request)
+
+        async with self.__acquire():
+            start = hooks.provide_start()
+            value = await self.__wait(provision.__aenter__(), case.name, timeout, "setup")
+
+        hooks.provide_finish(start)
+
+        try:
+            # NOTE: sync providers may block the event loop, so `wait_for` can't cancel them in time.
+            if timeout is not None:
+                self.__check_elapsed(case, timeout, start, "setup")
+
+            yield value
+
+        except BaseException as err:
+            if not await provision.__aexit__(type(err), err, err.__traceback__):
+                raise
+
+        else:
+            start = time.perf_counter()
+            await self.__wait(provision.__aexit__(None, None, None), case.name, timeout, "teardown")
+            hooks.teardown(start)
+
+    def __get_timeout(self, case: CaseInfo[T]) -> t.Optional[float]:
+        return case.timeout if case.timeout is not None else self.__timeout
+
+    def __check_elapsed(self, case: CaseInfo[T], timeout: float, start: float, stage: str) -> None:
+        elapsed = time.perf_counter() - start
+        if elapsed > timeout:
+            raise CaseProviderTimeoutError(case.name, timeout, elapsed, stage)
+
+    async def __wait(
+        self,
+        coro: t.Coroutine[None, None, T],
+        name: str,
+        timeout: t.Optional[float],
+        stage: str,
+    ) -> T:
+        if timeout is None:
+            return await coro
+
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(coro, timeout)
+
+        except asyncio.TimeoutError:
+            raise CaseProviderTimeoutError(name, timeout, time.perf_counter() - start, stage) from None
+
+    def __acquire(self) -> t.AsyncContextManager[object]:
+        if self.__concurrency is None:
+            return AsyncExitStack()
+
+        loop = asyncio.get_running_loop()
+        semaphore = self.__semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self.__semaphores[loop] = asyncio.Semaphore(self.__concurrency)
+
+        return semaphore
+
+
+CASE_PROVISION_BUDGET_KEY = pytest.StashKey[CaseProvisionBudget]()
+
+
+def get_case_provision_budget(config: Config) -> CaseProvisionBudget:
+    budget = config.stash.get(CASE_PROVISION_BUDGET_KEY, None)
+    if budget is None:
+        budget = config.stash[CASE_PROVISION_BUDGET_KEY] = CaseProvisionBudget()
+
+    return budget
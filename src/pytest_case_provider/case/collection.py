@@ -0,0 +1,176 @@
+import json
+import tracemalloc
+import typing as t
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config
+from _pytest.python import FunctionDefinition, PyCollector
+from _pytest.terminal import TerminalReporter
+
+from pytest_case_provider.abc import CaseCollector
+from pytest_case_provider.case.derive import DerivedCaseCollector
+from pytest_case_provider.case.memory import format_memory_size
+from pytest_case_provider.case.storage import CompositeCaseStorage
+
+_COLLECT_STATS_WORKER_OUTPUT_KEY: t.Final[str] = "case_collect_stats"
+_TERMINAL_TOP: t.Final[int] = 20
+
+
+@dataclass(frozen=True)
+class CaseCollectStats:
+    """
+    Collection stats of the case parametrized test function (durations in seconds).
+
+    :param depth: length of the longest include chain of the storage (1 if the storage includes nothing).
+    :param fanout: max number of collectors included by one storage of the include graph.
+    :param collect: time spent in `collect_cases` of the storage.
+    :param parametrize: time spent in `metafunc.parametrize`.
+    :param fixtures: time spent in synthesis of the case fixture definition.
+    :param memory: memory retained after the items of the test function were generated (in bytes).
+    """
+
+    nodeid: str
+    cases: int
+    depth: int
+    fanout: int
+    collect: float
+    parametrize: float
+    fixtures: float
+    memory: int = 0
+
+    @property
+    def total(self) -> float:
+        return self.collect + self.parametrize + self.fixtures
+
+
+class CaseCollectStatsRecorder:
+    """
+    Records collection stats of each case parametrized test function & reports the slowest ones.
+
+    Memory is traced with `tracemalloc` during collection, thus collection is slower than usual while stats are
+    recorded, compare durations of the test functions with each other.
+    """
+
+    def __init__(self, config: Config, path: t.Optional[Path] = None) -> None:
+        self.__path = path
+        self.__stats = dict[str, CaseCollectStats]()
+        self.__memory = dict[str, int]()
+        self.__started_tracing = False
+        self.__workeroutput: t.Optional[dict[str, object]] = getattr(config, "workeroutput", None)
+
+    @property
+    def stats(self) -> t.Sequence[CaseCollectStats]:
+        return sorted(self.__stats.values(), key=lambda stats: stats.total, reverse=True)
+
+    def record(  # noqa: PLR0913
+        self,
+        definition: FunctionDefinition,
+        storage: CaseCollector[object],
+        cases: int,
+        collect: float,
+        parametrize: float,
+        fixtures: float,
+    ) -> None:
+        depth, fanout = measure_include_graph(storage)
+        self.__stats[definition.nodeid] = CaseCollectStats(
+            nodeid=definition.nodeid,
+            cases=cases,
+            depth=depth,
+            fanout=fanout,
+            collect=collect,
+            parametrize=parametrize,
+            fixtures=fixtures,
+        )
+
+    def pytest_collection(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracing = True
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_pycollect_makeitem(self, collector: PyCollector, name: str) -> t.Generator[None, object, object]:
+        # NOTE: items of the test function are generated within this hook, right after `pytest_generate_tests`.
+        before = tracemalloc.get_traced_memory()[0]
+        result = yield
+        self.__memory[f"{collector.nodeid}::{name}"] = tracemalloc.get_traced_memory()[0] - before
+        return result
+
+    def pytest_collection_finish(self) -> None:
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
+
+        for nodeid, stats in self.__stats.items():
+            self.__stats[nodeid] = CaseCollectStats(**{**asdict(stats), "memory": self.__memory.get(nodeid, 0)})
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        # NOTE: each pytest-xdist worker collects all tests, so stats of the workers are the same.
+        workeroutput = getattr(node, "workeroutput", None) or {}
+        for raw in workeroutput.get(_COLLECT_STATS_WORKER_OUTPUT_KEY, ()):
+            stats = CaseCollectStats(**raw)
+            self.__stats.setdefault(stats.nodeid, stats)
+
+    def pytest_sessionfinish(self) -> None:
+        if self.__workeroutput is not None:
+            self.__workeroutput[_COLLECT_STATS_WORKER_OUTPUT_KEY] = [asdict(stats) for stats in self.stats]
+            return
+
+        if self.__path is not None:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            self.__path.write_text(json.dumps([{**asdict(stats), "total": stats.total} for stats in self.stats]))
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        stats = self.stats
+        if not stats:
+            return
+
+        terminalreporter.write_sep("=", "case collection stats")
+        terminalreporter.write_line(
+            f"{'total':>9} {'collect':>9} {'param':>9} {'fixture':>9} {'memory':>9} {'cases':>7} {'depth':>5} "
+            f"{'fanout':>6}  test"
+        )
+        for entry in stats[:_TERMINAL_TOP]:
+            terminalreporter.write_line(
+                f"{entry.total:8.3f}s {entry.collect:8.3f}s {entry.parametrize:8.3f}s {entry.fixtures:8.3f}s "
+                f"{format_memory_size(entry.memory):>9} {entry.cases:>7} {entry.depth:>5} {entry.fanout:>6}  "
+                f"{entry.nodeid}"
+            )
+
+        if len(stats) > _TERMINAL_TOP:
+            terminalreporter.write_line(f"... {len(stats) - _TERMINAL_TOP} more case parametrized tests")
+
+        if self.__path is not None:
+            terminalreporter.write_line(f"case collection stats: {self.__path}")
+
+
+def measure_include_graph(collector: CaseCollector[object]) -> tuple[int, int]:
+    """Measure depth & fan-out of the include graph of the collector (see `CaseCollectStats`)."""
+    measured = dict[int, tuple[int, int]]()
+
+    def measure(node: CaseCollector[object], path: frozenset[int]) -> tuple[int, int]:
+        key = id(node)
+        if key in measured:
+            return measured[key]
+
+        includes = [include for include in _get_includes(node) if id(include) not in path]
+        children = [measure(include, path | {key}) for include in includes]
+        measured[key] = (
+            1 + max((depth for depth, _ in children), default=0),
+            max([len(includes), *(fanout for _, fanout in children)]),
+        )
+        return measured[key]
+
+    return measure(collector, frozenset())
+
+
+def _get_includes(collector: CaseCollector[object]) -> t.Sequence[CaseCollector[object]]:
+    if isinstance(collector, CompositeCaseStorage):
+        return collector.includes
+
+    if isinstance(collector, DerivedCaseCollector):
+        return [collector.upstream]
+
+    return ()
@@ -0,0 +1,23 @@
+import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from _pytest.config import Config
+
+_COLLECTION_CONFIG = ContextVar[t.Optional[Config]]("case_collection_config", default=None)
+
+
+@contextmanager
+def case_collection_context(config: Config) -> t.Iterator[None]:
+    """Make pytest config available to case collectors during case collection."""
+    token = _COLLECTION_CONFIG.set(config)
+    try:
+        yield
+
+    finally:
+        _COLLECTION_CONFIG.reset(token)
+
+
+def get_case_collection_config() -> t.Optional[Config]:
+    """Get pytest config of the current case collection, returns `None` outside of pytest's collection."""
+    return _COLLECTION_CONFIG.get()
@@ -1,4 +1,5 @@
 import inspect
+import sys
 import typing as t
 from functools import WRAPPER_ASSIGNMENTS, partial, update_wrapper, wraps
 
@@ -6,6 +7,9 @@ from _pytest.mark import MarkDecorator
 from typing_extensions import Concatenate, ParamSpec, Self, override
 
 from pytest_case_provider.abc import CaseCollector, CaseParametrizer
+from pytest_case_provider.case.batch import CaseBatchRunner
+from pytest_case_provider.case.module import CaseModuleCollector
+from pytest_case_provider.case.options import CaseBatchOptions
 from pytest_case_provider.case.storage import CompositeCaseStorage
 
 U = ParamSpec("U")
@@ -23,8 +27,14 @@ class FuncDecorator:
     def __init__(
         self,
         marks: t.Optional[t.Sequence[MarkDecorator]] = None,
+        batch: t.Optional[CaseBatchOptions] = None,
     ) -> None:
         self.__marks = marks
+        self.__batch = batch
+
+    @property
+    def batch(self) -> t.Optional[CaseBatchOptions]:
+        return self.__batch
 
     def apply(self, func: F) -> F:
         for mark in self.__marks or ():
@@ -42,9 +52,14 @@ class FuncCaseStorage(CompositeCaseStorage[T_co], CaseParametrizer[T_co], t.Gene
     During pytest test run this object delegates the call to actual test function.
     """
 
-    def __init__(self, testfunc: t.Callable[Concatenate[T_co, U], V_co]) -> None:
+    def __init__(
+        self,
+        testfunc: t.Callable[Concatenate[T_co, U], V_co],
+        batch: t.Optional[CaseBatchOptions] = None,
+    ) -> None:
         super().__init__()
         self.__testfunc = testfunc
+        self.__batch = batch
 
         update_wrapper(self, self.__testfunc, assigned=_TEST_FUNC_WRAPPER_ASSIGNMENT)
         if inspect.iscoroutinefunction(self.__testfunc):
@@ -56,12 +71,22 @@ class FuncCaseStorage(CompositeCaseStorage[T_co], CaseParametrizer[T_co], t.Gene
 
     def __call__(self, *args: U.args, **kwargs: U.kwargs) -> V_co:
         # NOTE: `T` should be provided in `kwargs` by pytest fixture injection
+        if self.__batch is not None:
+            name = self.get_case_param().name
+            batch = kwargs.get(name)
+            if isinstance(batch, CaseBatchRunner):
+                return t.cast("V_co", batch.run(self.__testfunc, name, args, kwargs))
+
         return self.__testfunc(*args, **kwargs)  # type: ignore[arg-type]
 
     @override
     def get_case_param(self) -> inspect.Parameter:
         return next(iter(inspect.signature(self.__testfunc).parameters.values()))
 
+    @override
+    def get_batch_options(self) -> t.Optional[CaseBatchOptions]:
+        return self.__batch
+
 
 class MethodCaseStorage(CompositeCaseStorage[T_co], CaseParametrizer[T_co], t.Generic[U, V_co, T_co, S_contra]):
     """
@@ -72,9 +97,14 @@ class MethodCaseStorage(CompositeCaseStorage[T_co], CaseParametrizer[T_co], t.Ge
     During pytest test run this object delegates the call to actual test method.
     """
 
-    def __init__(self, testmethod: t.Callable[Concatenate[S_contra, T_co, U], V_co]) -> None:
+    def __init__(
+        self,
+        testmethod: t.Callable[Concatenate[S_contra, T_co, U], V_co],
+        batch: t.Optional[CaseBatchOptions] = None,
+    ) -> None:
         super().__init__()
         self.__testmethod = testmethod
+        self.__batch = batch
 
         update_wrapper(self, self.__testmethod)
         if inspect.iscoroutinefunction(self.__testmethod):
@@ -103,6 +133,12 @@ class MethodCaseStorage(CompositeCaseStorage[T_co], CaseParametrizer[T_co], t.Ge
 
     def __call__(self, instance: S_contra, *args: U.args, **kwargs: U.kwargs) -> V_co:
         # NOTE: `T` should be provided in `kwargs` by pytest fixture injection
+        if self.__batch is not None:
+            name = self.get_case_param().name
+            batch = kwargs.get(name)
+            if isinstance(batch, CaseBatchRunner):
+                return t.cast("V_co", batch.run(self.__testmethod, name, [instance, *args], kwargs))
+
         return self.__testmethod(instance, *args, **kwargs)  # type: ignore[arg-type]
 
     @override
@@ -111,6 +147,10 @@ class MethodCaseStorage(CompositeCaseStorage[T_co], CaseParametrizer[T_co], t.Ge
         _ = next(params)  # skip `self`
         return next(params)
 
+    @override
+    def get_batch_options(self) -> t.Optional[CaseBatchOptions]:
+        return self.__batch
+
 
 class FuncCaseStorageProvider(t.Generic[T_co]):
     """Provides `FuncCaseStorage` objects of a specific `T_co` case type."""
@@ -124,7 +164,7 @@ class FuncCaseStorageProvider(t.Generic[T_co]):
         self.__includes = list(includes)
 
     def __call__(self, testfunc: t.Callable[Concatenate[T_co, U], V_co]) -> FuncCaseStorage[U, V_co, T_co]:
-        storage = FuncCaseStorage[U, V_co, T_co](self.__decorators.apply(testfunc))
+        storage = FuncCaseStorage[U, V_co, T_co](self.__decorators.apply(testfunc), batch=self.__decorators.batch)
         storage.include(*self.__includes)
         return storage
 
@@ -144,7 +184,10 @@ class MethodCaseStorageProvider(t.Generic[T_co]):
         self,
         testmethod: t.Callable[Concatenate[S_contra, T_co, U], V_co],
     ) -> MethodCaseStorage[U, V_co, T_co, S_contra]:
-        storage = MethodCaseStorage[U, V_co, T_co, S_contra](self.__decorators.apply(testmethod))
+        storage = MethodCaseStorage[U, V_co, T_co, S_contra](
+            self.__decorators.apply(testmethod),
+            batch=self.__decorators.batch,
+        )
         storage.include(*self.__includes)
         return storage
 
@@ -152,21 +195,23 @@ class MethodCaseStorageProvider(t.Generic[T_co]):
 class FuncCaseStorageProviderPlaceholder:
     """A helper to infer `FuncCaseStorageProvider` type vars when test function is wrapped with python `@` syntax."""
 
-    def __init__(self, decorators: FuncDecorator) -> None:
+    def __init__(self, decorators: FuncDecorator, includes: t.Sequence[CaseCollector[t.Any]] = ()) -> None:
         self.__decorators = decorators
+        self.__includes = includes
 
     def __call__(self, testfunc: t.Callable[Concatenate[T_co, U], V_co]) -> FuncCaseStorage[U, V_co, T_co]:
         return self.include()(testfunc)
 
     def include(self, *others: CaseCollector[T_co]) -> FuncCaseStorageProvider[T_co]:
-        return FuncCaseStorageProvider[T_co](decorators=self.__decorators, includes=others)
+        return FuncCaseStorageProvider[T_co](decorators=self.__decorators, includes=[*self.__includes, *others])
 
 
 class MethodCaseStorageProviderPlaceholder:
     """A helper to infer `MethodCaseStorageProvider` type vars when test function is wrapped with python `@` syntax."""
 
-    def __init__(self, decorators: FuncDecorator) -> None:
+    def __init__(self, decorators: FuncDecorator, includes: t.Sequence[CaseCollector[t.Any]] = ()) -> None:
         self.__decorators = decorators
+        self.__includes = includes
 
     def __call__(
         self,
@@ -175,16 +220,30 @@ class MethodCaseStorageProviderPlaceholder:
         return self.include()(testmethod)
 
     def include(self, *others: CaseCollector[T_co]) -> MethodCaseStorageProvider[T_co]:
-        return MethodCaseStorageProvider[T_co](decorators=self.__decorators, includes=others)
+        return MethodCaseStorageProvider[T_co](decorators=self.__decorators, includes=[*self.__includes, *others])
 
 
-def inject_cases_func(
+def inject_cases_func(  # noqa: PLR0913
     marks: t.Optional[t.Sequence[MarkDecorator]] = None,
+    *,
+    batch: t.Optional[int] = None,
+    subtests: bool = False,
+    concurrent: t.Optional[int] = None,
+    threads: t.Optional[int] = None,
+    cases: t.Union[str, t.Sequence[str], None] = None,
 ) -> FuncCaseStorageProviderPlaceholder:
     """
     Setup case provider injection into the test function.
 
     :param marks: list of pytest marks to apply on test function (useful when marks are not well annotated for MyPy).
+    :param batch: run up to this number of cases within one pytest item (reduces per item overhead of tiny cases).
+    :param subtests: report outcome of each case of the batch separately.
+    :param concurrent: run up to this number of cases of async test function at once within one pytest item (cases
+        are batched, all cases form one batch by default, and each case outcome is reported separately).
+    :param threads: run up to this number of cases of sync test function at once in threads within one pytest item on
+        free-threaded python builds, cases are run one by one when the GIL is enabled (batched like `concurrent`).
+    :param cases: dotted path (or `fnmatch` pattern) of the modules with `case_*` provider functions, the modules are
+        scanned without import at collection & imported at setup of the first item that uses their cases.
     :return: a placeholder object that can wrap the test function.
 
     Usage:
@@ -205,16 +264,34 @@ def inject_cases_func(
     ... def case_bar() -> str:
     ...     return "Bar"
     """
-    return FuncCaseStorageProviderPlaceholder(FuncDecorator(marks))
+    return FuncCaseStorageProviderPlaceholder(
+        FuncDecorator(marks, _build_batch_options(batch, subtests=subtests, concurrent=concurrent, threads=threads)),
+        [CaseModuleCollector(pattern) for pattern in ([cases] if isinstance(cases, str) else cases or ())],
+    )
 
 
-def inject_cases_method(
+def inject_cases_method(  # noqa: PLR0913
     marks: t.Optional[t.Sequence[MarkDecorator]] = None,
+    *,
+    batch: t.Optional[int] = None,
+    subtests: bool = False,
+    concurrent: t.Optional[int] = None,
+    threads: t.Optional[int] = None,
+    cases: t.Union[str, t.Sequence[str], None] = None,
 ) -> MethodCaseStorageProviderPlaceholder:
     """
     Setup case provider injection into the test method.
 
     :param marks: list of pytest marks to apply on test method (useful when marks are not well annotated for MyPy).
+    :param batch: run up to this number of cases within one pytest item (reduces per item overhead of tiny cases).
+    :param subtests: report outcome of each case of the batch separately.
+    :param concurrent: run up to this number of cases of async test method at once within one pytest item (cases are
+        batched, all cases form one batch by default, and each case outcome is reported separately).
+    :param threads: run up to this number of cases of sync test method at once in threads within one pytest item on
+        free-threaded python builds, cases are run one by one when the GIL is enabled (batched like `concurrent`).
+    :param cases: dotted path (or `fnmatch` pattern) of the modules with `case_*` provider functions, the modules are
+        scanned without import at collection & imported at setup of the first item that uses their cases (provider
+        functions get the test class instance as the first argument, like provider methods).
     :return: a placeholder object that can wrap the test method.
 
     Usage:
@@ -236,4 +313,29 @@ def inject_cases_method(
     ...     def case_bar(self) -> str:
     ...         return "Bar"
     """
-    return MethodCaseStorageProviderPlaceholder(FuncDecorator(marks))
+    return MethodCaseStorageProviderPlaceholder(
+        FuncDecorator(marks, _build_batch_options(batch, subtests=subtests, concurrent=concurrent, threads=threads)),
+        [CaseModuleCollector(pattern) for pattern in ([cases] if isinstance(cases, str) else cases or ())],
+    )
+
+
+def _build_batch_options(
+    batch: t.Optional[int],
+    *,
+    subtests: bool,
+    concurrent: t.Optional[int],
+    threads: t.Optional[int],
+) -> t.Optional[CaseBatchOptions]:
+    if concurrent is not None and threads is not None:
+        msg = "cases can't be run both concurrently & in threads"
+        raise ValueError(msg)
+
+    if concurrent is not None or threads is not None:
+        return CaseBatchOptions(
+            size=batch if batch is not None else sys.maxsize,
+            subtests=True,
+            concurrency=concurrent or 1,
+            threads=threads or 1,
+        )
+
+    return CaseBatchOptions(size=batch, subtests=subtests) if batch is not None else None
@@ -0,0 +1,213 @@
+import inspect
+import typing as t
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+
+import pytest
+from _pytest.fixtures import SubRequest, get_scope_node
+from _pytest.nodes import Node
+from _pytest.scope import Scope
+from typing_extensions import override
+
+from pytest_case_provider.abc import CaseCollector
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.provider import CaseProvider
+
+T = t.TypeVar("T")
+R = t.TypeVar("R")
+V_co = t.TypeVar("V_co", covariant=True)
+
+DeriveFunc = t.Callable[[T], t.Union[R, t.Awaitable[R]]]
+
+_DERIVED_CASE_VALUES_KEY = pytest.StashKey[dict[object, object]]()
+
+
+class DerivedCaseCollector(CaseCollector[R]):
+    """
+    Collects cases derived from upstream cases by the function.
+
+    Derived collectors form a DAG: each node (upstream case & each derived case) is evaluated at most once per scope on
+    first use, so a pipeline of stages shared by many tests computes each intermediate value only once. The scope of
+    the chain is the narrowest scope of the fixtures its root upstream provider requests (session if it requests none).
+
+    :param name: format of derived case names, `{case}` is replaced with the upstream case name (default: the upstream
+        case name as is).
+    """
+
+    def __init__(self, upstream: CaseCollector[T], func: DeriveFunc[T, R], name: t.Optional[str] = None) -> None:
+        self.__upstream = upstream
+        self.__derive = func
+        self.__name = name
+        self.__nodes = dict[str, object]()
+
+    @property
+    def upstream(self) -> CaseCollector[t.Any]:
+        return self.__upstream
+
+    @override
+    def collect_cases(self) -> t.Iterable[CaseInfo[R]]:
+        for case in self.__upstream.collect_cases():
+            # NOTE: upstream collectors may build new case infos on each collection, so the nodes are keyed by name.
+            node = self.__nodes.setdefault(case.name, object())
+            yield CaseInfo(
+                name=self.__name.format(case=case.name) if self.__name is not None else case.name,
+                provider=DerivedCaseProvider(case, self.__derive, node),
+                marks=case.marks,
+                timeout=case.timeout,
+            )
+
+    @t.overload
+    def derive(
+        self,
+        func: t.Callable[[R], t.Awaitable[T]],
+        name: t.Optional[str] = None,
+    ) -> "DerivedCaseCollector[T]": ...
+
+    @t.overload
+    def derive(self, func: t.Callable[[R], T], name: t.Optional[str] = None) -> "DerivedCaseCollector[T]": ...
+
+    def derive(self, func: DeriveFunc[R, T], name: t.Optional[str] = None) -> "DerivedCaseCollector[T]":
+        return DerivedCaseCollector(self, func, name)
+
+
+class DerivedCaseProvider(CaseProvider[V_co]):
+    """
+    Provides the value derived from the upstream case, values of the whole chain are memoized for the chain scope.
+
+    Derived values are shared by tests, they are not copied. The chain scope is the narrowest scope of the fixtures
+    the root upstream provider requests, so values are rebuilt for each scope node (e.g. for each test when the root
+    provider uses `tmp_path`) and the upstream teardown runs at the teardown of that node. Async upstream providers are
+    finalized on the event loop, so their values are kept for the lifetime of the derived case only.
+    """
+
+    def __init__(self, upstream: CaseInfo[t.Any], func: DeriveFunc[t.Any, V_co], node: object) -> None:
+        super().__init__(t.cast("t.Any", func))
+        self.__upstream = upstream
+        self.__derive = func
+        self.__node = node
+
+    @property
+    def upstream(self) -> CaseInfo[t.Any]:
+        return self.__upstream
+
+    @property
+    @override
+    def is_async(self) -> bool:
+        return self.__upstream.provider.is_async or inspect.iscoroutinefunction(self.__derive)
+
+    @property
+    @override
+    def signature(self) -> inspect.Signature:
+        # NOTE: only the root provider of the chain requests fixtures.
+        return self.__upstream.provider.signature
+
+    @override
+    @contextmanager
+    def provide_sync(self, request: SubRequest) -> t.Iterator[V_co]:
+        yield self.evaluate_sync(request)
+
+    @override
+    @asynccontextmanager
+    async def provide_async(self, request: SubRequest) -> t.AsyncIterator[V_co]:
+        async with AsyncExitStack() as stack:
+            yield await self.evaluate_async(request, stack)
+
+    def evaluate_sync(self, request: SubRequest) -> V_co:
+        values = _get_derived_case_values(request, _find_chain_scope(self.__upstream, request))
+        if self.__node not in values:
+            value = self.__derive(_evaluate_upstream_sync(self.__upstream, request))
+            if inspect.isawaitable(value):
+                msg = f"async derive function can't be evaluated synchronously: {self.__derive}"
+                raise TypeError(msg)
+
+            values[self.__node] = value
+
+        return t.cast("V_co", values[self.__node])
+
+    async def evaluate_async(self, request: SubRequest, stack: AsyncExitStack) -> V_co:
+        """Evaluate the chain, async upstream contexts are kept open on the stack (i.e. until the derived case ends)."""
+        values = _get_derived_case_values(request, _find_chain_scope(self.__upstream, request))
+        if self.__node not in values:
+            value = self.__derive(await _evaluate_upstream_async(self.__upstream, request, stack))
+            values[self.__node] = await value if inspect.isawaitable(value) else value
+
+        return t.cast("V_co", values[self.__node])
+
+
+def _evaluate_upstream_sync(case: CaseInfo[T], request: SubRequest) -> T:
+    if isinstance(case.provider, DerivedCaseProvider):
+        return t.cast("T", case.provider.evaluate_sync(request))
+
+    scope = _find_chain_scope(case, request)
+    values = _get_derived_case_values(request, scope)
+    if case.provider not in values:
+        stack = ExitStack()
+        values[case.provider] = stack.enter_context(case.provider.provide_sync(request))
+        _get_scope_node(request, scope).addfinalizer(stack.close)
+
+    return t.cast("T", values[case.provider])
+
+
+async def _evaluate_upstream_async(case: CaseInfo[T], request: SubRequest, stack: AsyncExitStack) -> T:
+    if isinstance(case.provider, DerivedCaseProvider):
+        return t.cast("T", await case.provider.evaluate_async(request, stack))
+
+    if not case.provider.is_async:
+        return _evaluate_upstream_sync(case, request)
+
+    values = _get_derived_case_values(request, _find_chain_scope(case, request))
+    if case.provider not in values:
+        values[case.provider] = await stack.enter_async_context(case.provider.provide_async(request))
+
+    return t.cast("T", values[case.provider])
+
+
+def _find_chain_scope(case: CaseInfo[t.Any], request: SubRequest) -> Scope:
+    while isinstance(case.provider, DerivedCaseProvider):
+        case = case.provider.upstream
+
+    # NOTE: async upstream contexts & instances of test classes (`self` of provider methods) live for a test only.
+    if case.provider.is_async or request.instance is not None:
+        return Scope.Function
+
+    fixture_manager = request.session._fixturemanager  # noqa: SLF001
+    queue = list(case.provider.signature.parameters)
+    seen = set[str]()
+    scope = Scope.Session
+
+    while queue:
+        name = queue.pop()
+        if name in seen:
+            continue
+
+        seen.add(name)
+        fixture_defs = fixture_manager.getfixturedefs(name, request.node)
+        if not fixture_defs:
+            # NOTE: `request` & direct parameters of the test.
+            return Scope.Function
+
+        fixture_def = fixture_defs[-1]
+        scope = min(scope, Scope(fixture_def.scope))
+        queue.extend(fixture_def.argnames)
+
+    return scope
+
+
+def _get_scope_node(request: SubRequest, scope: Scope) -> Node:
+    node = get_scope_node(request.node, scope)
+    while node is None and scope is not Scope.Session:
+        # NOTE: e.g. class scope of a module level test function.
+        scope = scope.next_higher()
+        node = get_scope_node(request.node, scope)
+
+    return node if node is not None else request.session
+
+
+def _get_derived_case_values(request: SubRequest, scope: Scope) -> dict[object, object]:
+    node = _get_scope_node(request, scope)
+    values = node.stash.get(_DERIVED_CASE_VALUES_KEY, None)
+    if values is None:
+        values = node.stash[_DERIVED_CASE_VALUES_KEY] = {}
+        # NOTE: values of the node are released at its teardown, narrow scope nodes (e.g. items) live until the end.
+        node.addfinalizer(values.clear)
+
+    return values
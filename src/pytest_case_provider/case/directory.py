@@ -0,0 +1,172 @@
+import fnmatch
+import hashlib
+import os
+import typing as t
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+from _pytest.mark import Mark, MarkDecorator
+from typing_extensions import override
+
+from pytest_case_provider.abc import CaseCollector
+from pytest_case_provider.case.context import get_case_collection_config
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.provider import CaseProvider, CaseProviderFunc
+
+if t.TYPE_CHECKING:
+    from _pytest.cacheprovider import Cache
+
+T = t.TypeVar("T")
+
+_INDEX_CACHE_KEY_PREFIX: t.Final[str] = "case_provider/directory"
+
+
+@dataclass(frozen=True)
+class DirectoryIndex:
+    """
+    Files of the directory tree that match the pattern.
+
+    :param dirs: modification time of each directory of the tree, files can't be added, removed or renamed without
+        changing the modification time of their directory, so the index is valid while these times are the same.
+    :param files: relative paths of matching files (contents of files are read by case providers, so they don't
+        affect the index).
+    """
+
+    dirs: t.Mapping[str, int]
+    files: t.Sequence[str]
+
+    def is_valid(self, root: Path) -> bool:
+        try:
+            return all((root / path).stat().st_mtime_ns == mtime_ns for path, mtime_ns in self.dirs.items())
+
+        except OSError:
+            return False
+
+    def to_json(self) -> object:
+        return {"dirs": dict(self.dirs), "files": list(self.files)}
+
+    @classmethod
+    def from_json(cls, raw: object) -> t.Optional["DirectoryIndex"]:
+        if not isinstance(raw, dict):
+            return None
+
+        try:
+            dirs = {str(path): int(mtime_ns) for path, mtime_ns in raw["dirs"].items()}
+            files = list(raw["files"])
+
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+        if not all(isinstance(path, str) for path in files):
+            return None
+
+        return cls(dirs=dirs, files=files)
+
+
+class DirectoryCaseCollector(CaseCollector[T]):
+    """
+    Collects a case for each file of the directory tree that matches the pattern.
+
+    Cases are named by file paths relative to the directory, the loader reads the case value from the file during item
+    setup. The directory index is stored in pytest's cache & reused while the directory tree is not changed, the tree
+    is scanned in parallel when the index is stale.
+
+    :param pattern: `fnmatch` pattern of relative file paths (with `/` separators), `*` matches files at any depth.
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, Path],
+        pattern: str,
+        loader: t.Callable[[Path], T],
+        marks: t.Optional[t.Sequence[t.Union[Mark, MarkDecorator]]] = None,
+    ) -> None:
+        self.__root = Path(path).absolute()
+        self.__pattern = pattern
+        self.__loader = loader
+        self.__marks = tuple(marks or ())
+        self.__index: t.Optional[DirectoryIndex] = None
+
+    @override
+    def collect_cases(self) -> t.Iterable[CaseInfo[T]]:
+        for path in self.__get_index().files:
+            yield CaseInfo(
+                name=path,
+                provider=CaseProvider(self.__build_provider(self.__root / path)),
+                marks=self.__marks,
+            )
+
+    def __get_index(self) -> DirectoryIndex:
+        if self.__index is not None and self.__index.is_valid(self.__root):
+            return self.__index
+
+        config = get_case_collection_config()
+        cache: t.Optional[Cache] = getattr(config, "cache", None) if config is not None else None
+        key = self.__build_cache_key()
+
+        index = DirectoryIndex.from_json(cache.get(key, None)) if cache is not None else None
+        if index is None or not index.is_valid(self.__root):
+            index = scan_directory(self.__root, self.__pattern)
+            if cache is not None:
+                cache.set(key, index.to_json())
+
+        self.__index = index
+        return index
+
+    def __build_cache_key(self) -> str:
+        digest = hashlib.sha1(f"{self.__root}\0{self.__pattern}".encode(), usedforsecurity=False).hexdigest()
+        return f"{_INDEX_CACHE_KEY_PREFIX}/{digest}"
+
+    def __build_provider(self, path: Path) -> CaseProviderFunc[[], T]:
+        def load_file() -> T:
+            return self.__loader(path)
+
+        return load_file
+
+
+def scan_directory(root: Path, pattern: str, max_workers: t.Optional[int] = None) -> DirectoryIndex:
+    """Scan directory tree with `os.scandir`, subdirectories are scanned in parallel by the thread pool."""
+    dirs = dict[str, int]()
+    files = list[str]()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="case-directory-scan") as pool:
+        pending: set[Future[tuple[str, int, list[str], list[str]]]] = {
+            pool.submit(_scan_directory_level, root, "", pattern),
+        }
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, mtime_ns, subdirs, level_files = future.result()
+                dirs[path] = mtime_ns
+                files.extend(level_files)
+                pending.update(pool.submit(_scan_directory_level, root, subdir, pattern) for subdir in subdirs)
+
+    files.sort()
+    return DirectoryIndex(dirs=dirs, files=files)
+
+
+def _scan_directory_level(
+    root: Path,
+    path: str,
+    pattern: str,
+) -> tuple[str, int, list[str], list[str]]:
+    subdirs = list[str]()
+    files = list[str]()
+
+    directory = root / path if path else root
+    # NOTE: the directory is changed during the scan when its modification time is taken after, the index would be
+    # valid then despite the missed change, so the time is taken before.
+    mtime_ns = directory.stat().st_mtime_ns
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            relpath = f"{path}/{entry.name}" if path else entry.name
+
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(relpath)
+
+            elif entry.is_file() and fnmatch.fnmatchcase(relpath, pattern):
+                files.append(relpath)
+
+    return path or ".", mtime_ns, subdirs, files
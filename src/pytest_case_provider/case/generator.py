@@ -1,17 +1,38 @@
+import inspect
+import time
 import typing as t
 
 from _pytest.fixtures import SubRequest
 from _pytest.mark import ParameterSet
 from _pytest.python import Metafunc
 
-from pytest_case_provider.abc import CaseParametrizer
-from pytest_case_provider.case.provider import CaseProvider
-from pytest_case_provider.fixture import parametrize_metafunc_with_fixture_params
+from pytest_case_provider.abc import CaseParametrizer, CaseReorderer
+from pytest_case_provider.case.batch import CaseBatch, CaseBatchRunner, select_batch_cases
+from pytest_case_provider.case.budget import get_case_provision_budget
+from pytest_case_provider.case.collection import CaseCollectStatsRecorder
+from pytest_case_provider.case.context import case_collection_context
+from pytest_case_provider.case.hooks import notify_case_collect
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.items import defer_case_parametrization
+from pytest_case_provider.case.options import CaseBatchOptions
+from pytest_case_provider.case.result import CaseResultCache
+from pytest_case_provider.case.runner import get_case_async_runner
+from pytest_case_provider.fixture import register_metafunc_fixture_def
 
 
 class CaseParametrizedTestGenerator:
     """Generates test functions for each case accordingly using pytest's parametrize feature."""
 
+    def __init__(
+        self,
+        reorderers: t.Optional[t.Sequence[CaseReorderer]] = None,
+        result_cache: t.Optional[CaseResultCache] = None,
+        collect_stats: t.Optional[CaseCollectStatsRecorder] = None,
+    ) -> None:
+        self.__reorderers = list(reorderers or ())
+        self.__result_cache = result_cache
+        self.__collect_stats = collect_stats
+
     def generate(self, metafunc: Metafunc) -> None:
         func = metafunc.function
 
@@ -19,38 +40,194 @@ class CaseParametrizedTestGenerator:
 
         if isinstance(func, CaseParametrizer):
             # TODO: deduplicate cases
-            cases = list(func.collect_cases())
+            start = time.perf_counter()
+            with case_collection_context(metafunc.config):
+                cases: t.Sequence[CaseInfo[object]] = list(func.collect_cases())
+
+            collected = time.perf_counter()
+            notify_case_collect(metafunc.config, metafunc.definition, func, cases, start)
+
+            if self.__result_cache is not None:
+                cases = self.__result_cache.select(metafunc, cases)
+
+            for reorderer in self.__reorderers:
+                cases = reorderer.reorder(metafunc.definition, cases)
+
             case_param = func.get_case_param()
             is_async = any(case.provider.is_async for case in cases)
 
-            parametrize_metafunc_with_fixture_params(
-                metafunc=metafunc,
-                name=case_param.name,
-                fixture_func=_invoke_provider_async if is_async else _invoke_provider,
-                params=[
-                    ParameterSet.param(
-                        case.provider,
-                        id=case.name,
-                        marks=case.marks,
-                    )
-                    for case in cases
-                ],
-            )
+            batch = func.get_batch_options()
+            if batch is not None:
+                parametrize_duration, fixture_duration = self.__parametrize_batches(
+                    metafunc, case_param, cases, batch, is_async=is_async
+                )
+
+            else:
+                parametrize_duration, fixture_duration = self.__parametrize(
+                    metafunc=metafunc,
+                    name=case_param.name,
+                    fixture_func=self.__get_provider_fixture(metafunc, is_async=is_async),
+                    params=[
+                        ParameterSet.param(
+                            case,
+                            id=case.name,
+                            marks=case.marks,
+                        )
+                        for case in cases
+                    ],
+                )
+
+            if self.__collect_stats is not None:
+                self.__collect_stats.record(
+                    metafunc.definition,
+                    func,
+                    len(cases),
+                    collect=collected - start,
+                    parametrize=parametrize_duration,
+                    fixtures=fixture_duration,
+                )
+
+    def __parametrize_batches(
+        self,
+        metafunc: Metafunc,
+        case_param: inspect.Parameter,
+        cases: t.Sequence[CaseInfo[object]],
+        options: CaseBatchOptions,
+        *,
+        is_async: bool,
+    ) -> tuple[float, float]:
+        if is_async and not inspect.iscoroutinefunction(metafunc.function) and not self.__has_async_runner(metafunc):
+            msg = f"batched sync test function can't use async case providers: {metafunc.function}"
+            raise TypeError(msg)
+
+        if options.concurrency > 1 and not inspect.iscoroutinefunction(metafunc.function):
+            msg = f"only async test functions can run cases concurrently: {metafunc.function}"
+            raise TypeError(msg)
+
+        if options.threads > 1 and inspect.iscoroutinefunction(metafunc.function):
+            msg = f"only sync test functions can run cases in threads: {metafunc.function}"
+            raise TypeError(msg)
+
+        if options.threads > 1:
+            # NOTE: cases of the batch share fixture values of the item, function scoped ones would be used by threads
+            # at once.
+            shared = _find_function_scoped_fixtures(metafunc, case_param.name, cases)
+            if shared:
+                msg = (
+                    f"cases running in threads can't share function scoped fixtures {', '.join(shared)}: "
+                    f"{metafunc.function}"
+                )
+                raise TypeError(msg)
+
+        cases = select_batch_cases(metafunc, cases)
+        batches = [CaseBatch(cases[i : i + options.size], options) for i in range(0, len(cases), options.size)]
+
+        return self.__parametrize(
+            metafunc=metafunc,
+            name=case_param.name,
+            fixture_func=_invoke_case_batch,
+            params=[ParameterSet.param(batch, id=batch.id) for batch in batches],
+        )
+
+    def __parametrize(
+        self,
+        metafunc: Metafunc,
+        name: str,
+        fixture_func: t.Callable[..., object],
+        params: t.Sequence[ParameterSet],
+    ) -> tuple[float, float]:
+        """Parametrize the case fixture, returns durations of the parametrization & the fixture definition synthesis."""
+        start = time.perf_counter()
+        if not defer_case_parametrization(metafunc, name, params):
+            metafunc.parametrize(name, params, indirect=True)
+
+        parametrized = time.perf_counter()
+        register_metafunc_fixture_def(metafunc, name, fixture_func)
+
+        return parametrized - start, time.perf_counter() - parametrized
+
+    def __get_provider_fixture(self, metafunc: Metafunc, *, is_async: bool) -> t.Callable[..., object]:
+        if not is_async:
+            return _invoke_provider
+
+        # NOTE: async test functions share the event loop with async providers, so the async pytest plugin runs both.
+        if inspect.iscoroutinefunction(metafunc.function) or not self.__has_async_runner(metafunc):
+            return _invoke_provider_async
+
+        return _invoke_provider_native
+
+    def __has_async_runner(self, metafunc: Metafunc) -> bool:
+        return get_case_async_runner(metafunc.config) is not None
+
+
+def _find_function_scoped_fixtures(
+    metafunc: Metafunc,
+    case_param: str,
+    cases: t.Sequence[CaseInfo[object]],
+) -> t.Sequence[str]:
+    fixture_manager = metafunc.definition.session._fixturemanager  # noqa: SLF001
+    # NOTE: only fixtures requested by the test function & providers are shared, autouse ones are set up for the item
+    #  only. `self` of case provider methods is not a fixture.
+    argnames = metafunc.definition._fixtureinfo.argnames  # noqa: SLF001
+    queue = [name for name in argnames if name != case_param]
+    for case in cases:
+        queue.extend(list(case.provider.signature.parameters)[int(metafunc.cls is not None) :])
+
+    seen = set[str]()
+    shared = list[str]()
+
+    while queue:
+        name = queue.pop()
+        if name in seen:
+            continue
+
+        seen.add(name)
+        fixture_defs = fixture_manager.getfixturedefs(name, metafunc.definition)
+        if not fixture_defs:
+            continue
+
+        fixture_def = fixture_defs[-1]
+        if fixture_def.scope == "function":
+            shared.append(name)
+
+        queue.extend(fixture_def.argnames)
+
+    return sorted(shared)
 
 
 async def _invoke_provider_async(request: SubRequest) -> t.AsyncIterator[object]:
-    provider = request.param
+    case = request.param
     # NOTE: test generator parametrizes this fixture, thus this check should always pass
-    assert isinstance(provider, CaseProvider), f"CaseProvider type was expected, got: {provider}"
+    assert isinstance(case, CaseInfo), f"CaseInfo type was expected, got: {case}"
 
-    async with provider.provide_async(request) as case:
-        yield case
+    async with get_case_provision_budget(request.config).provide_async(case, request) as value:
+        yield value
 
 
 def _invoke_provider(request: SubRequest) -> t.Iterator[object]:
-    provider = request.param
+    case = request.param
+    # NOTE: test generator parametrizes this fixture, thus this check should always pass
+    assert isinstance(case, CaseInfo), f"CaseInfo type was expected, got: {case}"
+
+    with get_case_provision_budget(request.config).provide_sync(case, request) as value:
+        yield value
+
+
+def _invoke_provider_native(request: SubRequest) -> t.Iterator[object]:
+    case = request.param
+    # NOTE: test generator parametrizes this fixture, thus this check should always pass
+    assert isinstance(case, CaseInfo), f"CaseInfo type was expected, got: {case}"
+
+    runner = get_case_async_runner(request.config)
+    assert runner is not None, "native async runner is not configured"
+
+    with runner.provide(case, request) as value:
+        yield value
+
+
+def _invoke_case_batch(request: SubRequest) -> CaseBatchRunner:
+    batch = request.param
     # NOTE: test generator parametrizes this fixture, thus this check should always pass
-    assert isinstance(provider, CaseProvider), f"CaseProvider type was expected, got: {provider}"
+    assert isinstance(batch, CaseBatch), f"CaseBatch type was expected, got: {batch}"
 
-    with provider.provide_sync(request) as case:
-        yield case
+    return CaseBatchRunner(batch, request)
@@ -0,0 +1,50 @@
+import time
+import typing as t
+
+from _pytest.config import Config
+from _pytest.nodes import Item
+from _pytest.python import FunctionDefinition
+
+from pytest_case_provider.case.info import CaseInfo
+
+if t.TYPE_CHECKING:
+    from pytest_case_provider.abc import CaseParametrizer
+
+
+def notify_case_collect(
+    config: Config,
+    definition: FunctionDefinition,
+    storage: "CaseParametrizer[object]",
+    cases: t.Sequence[CaseInfo[object]],
+    start: float,
+) -> None:
+    hook = config.hook.pytest_case_collect
+    if hook.get_hookimpls():
+        hook(definition=definition, storage=storage, cases=cases, duration=time.perf_counter() - start)
+
+
+class CaseProvisionHooks:
+    """Fires case provision hooks for the item, hooks are skipped when they have no implementations."""
+
+    def __init__(self, item: Item, case: CaseInfo[t.Any]) -> None:
+        self.__item = item
+        self.__case = case
+
+        hook = item.config.hook
+        self.__start = hook.pytest_case_provide_start if hook.pytest_case_provide_start.get_hookimpls() else None
+        self.__finish = hook.pytest_case_provide_finish if hook.pytest_case_provide_finish.get_hookimpls() else None
+        self.__teardown = hook.pytest_case_teardown if hook.pytest_case_teardown.get_hookimpls() else None
+
+    def provide_start(self) -> float:
+        if self.__start is not None:
+            self.__start(item=self.__item, case_info=self.__case)
+
+        return time.perf_counter()
+
+    def provide_finish(self, start: float) -> None:
+        if self.__finish is not None:
+            self.__finish(item=self.__item, case_info=self.__case, duration=time.perf_counter() - start)
+
+    def teardown(self, start: float) -> None:
+        if self.__teardown is not None:
+            self.__teardown(item=self.__item, case_info=self.__case, duration=time.perf_counter() - start)
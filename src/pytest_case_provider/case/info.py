@@ -2,6 +2,8 @@ import typing as t
 from dataclasses import dataclass, field
 
 from _pytest.mark import Mark, MarkDecorator
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
 
 from pytest_case_provider.case.provider import CaseProvider
 
@@ -13,3 +15,36 @@ class CaseInfo(t.Generic[T]):
     name: str
     provider: CaseProvider[T]
     marks: t.Sequence[t.Union[Mark, MarkDecorator]] = field(default_factory=tuple)
+    timeout: t.Optional[float] = None
+
+
+def find_item_case_info(item: Item) -> t.Optional[CaseInfo[object]]:
+    """Find the case injected into pytest item, returns `None` if item is not case parametrized."""
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+
+    return next((value for value in callspec.params.values() if isinstance(value, CaseInfo)), None)
+
+
+def get_item_definition_id(item: Item) -> str:
+    """Get node id of the test function definition the item was generated from (i.e. without parameter ids)."""
+    parent = item.parent
+    assert parent is not None, f"item has no parent: {item}"
+    return f"{parent.nodeid}::{getattr(item, 'originalname', item.name)}"
+
+
+def set_report_case(report: TestReport, definition_id: str, case_name: str) -> None:
+    """Mark the report as a report of the case run, marks are kept when pytest-xdist sends the report to controller."""
+    report.case_definition_id = definition_id  # type: ignore[attr-defined]
+    report.case_name = case_name  # type: ignore[attr-defined]
+
+
+def get_report_case(report: TestReport) -> t.Optional[tuple[str, str]]:
+    """Get definition id & name of the case the report was marked with, returns `None` for other reports."""
+    definition_id = getattr(report, "case_definition_id", None)
+    name = getattr(report, "case_name", None)
+    if not isinstance(definition_id, str) or not isinstance(name, str):
+        return None
+
+    return definition_id, name
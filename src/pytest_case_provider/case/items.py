@@ -0,0 +1,155 @@
+import typing as t
+
+import pytest
+from _pytest.mark import ParameterSet
+from _pytest.mark.structures import normalize_mark_list
+from _pytest.python import CallSpec2, Class, Function, FunctionDefinition, Metafunc, Module, PyCollector
+from _pytest.scope import Scope
+
+from pytest_case_provider.abc import CaseParametrizer
+
+_CASE_DEFERRED_PARAMS_KEY = pytest.StashKey[t.Optional[tuple[str, t.Sequence[ParameterSet]]]]()
+
+
+class CaseItemGenerator:
+    """
+    Generates items of case parametrized test functions directly from the collected cases.
+
+    `metafunc.parametrize` builds a callspec for each case by copying the callspecs built so far & checks ids of all
+    cases for duplicates. Here the case fixture is parametrized once per test function: each item gets its own small
+    callspec and all items share the fixture info of the test function. Test functions that have other
+    parametrizations (or cases with duplicate / non ASCII ids) are parametrized by pytest as usual.
+    """
+
+    def __init__(self) -> None:
+        self.__direct = 0
+        self.__fallback = 0
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pycollect_makeitem(self, collector: PyCollector, name: str, obj: object) -> t.Optional[list[Function]]:
+        if not isinstance(obj, CaseParametrizer) or not collector.istestfunction(obj, name):
+            return None
+
+        if not getattr(obj, "__test__", True):
+            return None
+
+        definition = FunctionDefinition.from_parent(collector, name=name, callobj=obj)
+        if any(definition.iter_markers("parametrize")):
+            self.__fallback += 1
+            return None
+
+        return list(self.__generate_items(collector, definition))
+
+    def pytest_report_collectionfinish(self) -> t.Optional[str]:
+        if not self.__direct and not self.__fallback:
+            return None
+
+        return f"case items: {self.__direct} tests generated directly, {self.__fallback} parametrized by pytest"
+
+    def __generate_items(self, collector: PyCollector, definition: FunctionDefinition) -> t.Iterator[Function]:
+        fixtureinfo = definition._fixtureinfo  # noqa: SLF001
+        module = collector.getparent(Module)
+        clscol = collector.getparent(Class)
+        metafunc = Metafunc(
+            definition=definition,
+            fixtureinfo=fixtureinfo,
+            config=collector.config,
+            cls=clscol.obj if clscol is not None else None,
+            module=module.obj if module is not None else None,
+            _ispytest=True,
+        )
+
+        # NOTE: the same hook call as in `PyCollector._genfunctions`, case parametrization is deferred via the stash.
+        methods = list[t.Callable[..., object]]()
+        if hasattr(metafunc.module, "pytest_generate_tests"):
+            methods.append(metafunc.module.pytest_generate_tests)
+        if metafunc.cls is not None and hasattr(metafunc.cls, "pytest_generate_tests"):
+            methods.append(metafunc.cls().pytest_generate_tests)
+
+        definition.stash[_CASE_DEFERRED_PARAMS_KEY] = None
+        collector.ihook.pytest_generate_tests.call_extra(methods, {"metafunc": metafunc})
+
+        deferred = definition.stash[_CASE_DEFERRED_PARAMS_KEY]
+        if deferred is not None and not metafunc._calls and _has_plain_ids(deferred[1]):  # noqa: SLF001
+            self.__direct += 1
+            fixtureinfo.prune_dependency_tree()
+            yield from _build_items(collector, definition, *deferred)
+            return
+
+        self.__fallback += 1
+        if deferred is not None:
+            metafunc.parametrize(deferred[0], deferred[1], indirect=True)
+
+        yield from _build_parametrized_items(collector, definition.name, metafunc)
+
+
+def defer_case_parametrization(metafunc: Metafunc, name: str, params: t.Sequence[ParameterSet]) -> bool:
+    """Keep case params to generate items directly, returns `False` if items of the test are generated by pytest."""
+    if _CASE_DEFERRED_PARAMS_KEY not in metafunc.definition.stash:
+        return False
+
+    metafunc.definition.stash[_CASE_DEFERRED_PARAMS_KEY] = (name, params)
+    return True
+
+
+def _has_plain_ids(params: t.Sequence[ParameterSet]) -> bool:
+    # NOTE: pytest escapes non ASCII ids & makes duplicate ids unique, such params are left for pytest.
+    ids = set[str]()
+    for param in params:
+        if not isinstance(param.id, str) or not param.id.isascii() or not param.id.isprintable() or param.id in ids:
+            return False
+
+        ids.add(param.id)
+
+    return bool(ids)
+
+
+def _build_items(
+    collector: PyCollector,
+    definition: FunctionDefinition,
+    argname: str,
+    params: t.Sequence[ParameterSet],
+) -> t.Iterator[Function]:
+    name = definition.name
+    fixtureinfo = definition._fixtureinfo  # noqa: SLF001
+    # NOTE: items of a test method get the method of their own class instance, so it's looked up for each of them.
+    extra = {"callobj": definition.obj} if not isinstance(collector, Class) else {}
+
+    for index, param in enumerate(params):
+        case_id = t.cast("str", param.id)
+        yield Function.from_parent(
+            collector,
+            name=f"{name}[{case_id}]",
+            callspec=CallSpec2(
+                params={argname: param.values[0]},
+                indices={argname: index},
+                _arg2scope={argname: Scope.Function},
+                _idlist=(case_id,),
+                marks=list(normalize_mark_list(param.marks)) if param.marks else [],
+            ),
+            fixtureinfo=fixtureinfo,
+            keywords={case_id: True},
+            originalname=name,
+            **extra,
+        )
+
+
+def _build_parametrized_items(collector: PyCollector, name: str, metafunc: Metafunc) -> t.Iterator[Function]:
+    # NOTE: repeat `PyCollector._genfunctions` logic
+    fixtureinfo = metafunc.definition._fixtureinfo  # noqa: SLF001
+    if not metafunc._calls:  # noqa: SLF001
+        yield Function.from_parent(collector, name=name, fixtureinfo=fixtureinfo)
+        return
+
+    metafunc._recompute_direct_params_indices()  # noqa: SLF001
+    fixtureinfo.prune_dependency_tree()
+
+    for callspec in metafunc._calls:  # noqa: SLF001
+        yield Function.from_parent(
+            collector,
+            name=f"{name}[{callspec.id}]" if callspec._idlist else name,  # noqa: SLF001
+            callspec=callspec,
+            fixtureinfo=fixtureinfo,
+            keywords={callspec.id: True},
+            originalname=name,
+        )
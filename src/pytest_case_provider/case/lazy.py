@@ -0,0 +1,291 @@
+import asyncio
+import math
+import operator
+import typing as t
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+
+from _pytest.fixtures import SubRequest
+from typing_extensions import override
+
+from pytest_case_provider.case.provider import CaseProvider
+from pytest_case_provider.case.runner import get_case_async_runner, resolve_provider_fixtures
+
+V_co = t.TypeVar("V_co", covariant=True)
+
+_UNRESOLVED: t.Final = object()
+
+
+class LazyCaseProxy:
+    """
+    Transparent proxy of the case value, the value is built on first access (attribute, item, operator, etc.).
+
+    Operators (in place ones change mutable values themselves), context manager & async protocols are forwarded to the
+    value.
+
+    `isinstance` checks are forwarded to the value too, use `unwrap_lazy_case` to get the value itself (e.g. to pass it
+    to C extensions).
+    """
+
+    __slots__ = ("__resolve", "__value")
+
+    def __init__(self, resolve: t.Callable[[], object]) -> None:
+        object.__setattr__(self, "_LazyCaseProxy__resolve", resolve)
+        object.__setattr__(self, "_LazyCaseProxy__value", _UNRESOLVED)
+
+    @property
+    def __is_resolved(self) -> bool:
+        return self.__value is not _UNRESOLVED
+
+    def __get(self) -> t.Any:
+        if self.__value is _UNRESOLVED:
+            object.__setattr__(self, "_LazyCaseProxy__value", self.__resolve())
+
+        return self.__value
+
+    @property  # type: ignore[misc]
+    @override
+    def __class__(self) -> type[object]:  # type: ignore[override]
+        return type(self.__get())
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self.__get(), name)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> None:
+        setattr(self.__get(), name, value)
+
+    @override
+    def __delattr__(self, name: str) -> None:
+        delattr(self.__get(), name)
+
+    @override
+    def __repr__(self) -> str:
+        if not self.__is_resolved:
+            return f"<{LazyCaseProxy.__name__}: unresolved>"
+
+        return repr(self.__value)
+
+    @override
+    def __str__(self) -> str:
+        return str(self.__get())
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        return bool(self.__get() == other)
+
+    @override
+    def __ne__(self, other: object) -> bool:
+        return bool(self.__get() != other)
+
+    @override
+    def __hash__(self) -> int:
+        return hash(self.__get())
+
+    def __bool__(self) -> bool:
+        return bool(self.__get())
+
+    def __len__(self) -> int:
+        return len(self.__get())
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return iter(self.__get())
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.__get()
+
+    def __getitem__(self, key: object) -> t.Any:
+        return self.__get()[key]
+
+    def __setitem__(self, key: object, value: object) -> None:
+        self.__get()[key] = value
+
+    def __delitem__(self, key: object) -> None:
+        del self.__get()[key]
+
+    def __call__(self, *args: object, **kwargs: object) -> t.Any:
+        return self.__get()(*args, **kwargs)
+
+    def __int__(self) -> int:
+        return int(self.__get())
+
+    def __float__(self) -> float:
+        return float(self.__get())
+
+    def __index__(self) -> int:
+        return operator.index(self.__get())
+
+    def __complex__(self) -> complex:
+        return complex(self.__get())
+
+    def __round__(self, ndigits: t.Optional[int] = None) -> t.Any:
+        return round(self.__get()) if ndigits is None else round(self.__get(), ndigits)
+
+    def __reversed__(self) -> t.Any:
+        return reversed(self.__get())
+
+    def __next__(self) -> t.Any:
+        return next(self.__get())
+
+    def __enter__(self) -> t.Any:
+        return self.__get().__enter__()
+
+    def __exit__(self, *exc_info: object) -> t.Any:
+        return self.__get().__exit__(*exc_info)
+
+    def __await__(self) -> t.Any:
+        return self.__get().__await__()
+
+    def __aiter__(self) -> t.Any:
+        return self.__get().__aiter__()
+
+    def __anext__(self) -> t.Any:
+        return self.__get().__anext__()
+
+    def __aenter__(self) -> t.Any:
+        return self.__get().__aenter__()
+
+    def __aexit__(self, *exc_info: object) -> t.Any:
+        return self.__get().__aexit__(*exc_info)
+
+
+_BINARY_OPERATORS: t.Final[t.Mapping[str, t.Callable[[t.Any, t.Any], object]]] = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "matmul": operator.matmul,
+    "truediv": operator.truediv,
+    "floordiv": operator.floordiv,
+    "mod": operator.mod,
+    "divmod": divmod,
+    "pow": operator.pow,
+    "lshift": operator.lshift,
+    "rshift": operator.rshift,
+    "and": operator.and_,
+    "or": operator.or_,
+    "xor": operator.xor,
+}
+_COMPARISON_OPERATORS: t.Final[t.Mapping[str, t.Callable[[t.Any, t.Any], object]]] = {
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+_UNARY_OPERATORS: t.Final[t.Mapping[str, t.Callable[[t.Any], object]]] = {
+    "neg": operator.neg,
+    "pos": operator.pos,
+    "abs": operator.abs,
+    "invert": operator.invert,
+    "trunc": math.trunc,
+    "floor": math.floor,
+    "ceil": math.ceil,
+}
+
+
+def _add_operators() -> None:
+    for name, op in _COMPARISON_OPERATORS.items():
+        setattr(LazyCaseProxy, f"__{name}__", _build_binary_operator(op, reflected=False))
+
+    for name, op in _BINARY_OPERATORS.items():
+        setattr(LazyCaseProxy, f"__{name}__", _build_binary_operator(op, reflected=False))
+        setattr(LazyCaseProxy, f"__r{name}__", _build_binary_operator(op, reflected=True))
+
+        # NOTE: `divmod` has no in place form.
+        inplace_op = getattr(operator, f"i{name}", None)
+        if inplace_op is not None:
+            setattr(LazyCaseProxy, f"__i{name}__", _build_inplace_operator(inplace_op))
+
+    for name, unary_op in _UNARY_OPERATORS.items():
+        setattr(LazyCaseProxy, f"__{name}__", _build_unary_operator(unary_op))
+
+
+def _build_binary_operator(
+    op: t.Callable[[t.Any, t.Any], object],
+    *,
+    reflected: bool,
+) -> t.Callable[[LazyCaseProxy, object], object]:
+    def method(self: LazyCaseProxy, other: object) -> object:
+        value = unwrap_lazy_case(self)
+        return op(other, value) if reflected else op(value, other)
+
+    return method
+
+
+def _build_inplace_operator(op: t.Callable[[t.Any, t.Any], object]) -> t.Callable[[LazyCaseProxy, object], object]:
+    def method(self: LazyCaseProxy, other: object) -> object:
+        value = unwrap_lazy_case(self)
+        result = op(value, other)
+        # NOTE: mutable values are changed in place, the name stays bound to the proxy then.
+        return self if result is value else result
+
+    return method
+
+
+def _build_unary_operator(op: t.Callable[[t.Any], object]) -> t.Callable[[LazyCaseProxy], object]:
+    def method(self: LazyCaseProxy) -> object:
+        return op(unwrap_lazy_case(self))
+
+    return method
+
+
+_add_operators()
+
+
+def unwrap_lazy_case(value: object) -> t.Any:
+    """Get the case value of the lazy proxy (the value is built if it wasn't yet), other values are returned as is."""
+    if type(value) is LazyCaseProxy:
+        return value._LazyCaseProxy__get()  # noqa: SLF001
+
+    return value
+
+
+class LazyCaseProvider(CaseProvider[V_co]):
+    """
+    Provides a lazy proxy of the case value, the inner provider runs on first access to the value.
+
+    The value is finalized at item teardown. Async providers are run with the native async runner, so they can be lazy
+    only for sync test functions. Provider timeouts are not applied to lazily built values.
+    """
+
+    def __init__(self, provider: CaseProvider[V_co]) -> None:
+        super().__init__(provider.func)
+        self.__provider = provider
+
+    @property
+    @override
+    def is_async(self) -> bool:
+        # NOTE: the proxy is created synchronously, the inner async provider is run by the native runner on access.
+        return False
+
+    @override
+    @contextmanager
+    def provide_sync(self, request: SubRequest) -> t.Iterator[V_co]:
+        with ExitStack() as stack:
+            yield t.cast("V_co", LazyCaseProxy(lambda: stack.enter_context(self.__open(request))))
+
+    @override
+    @asynccontextmanager
+    async def provide_async(self, request: SubRequest) -> t.AsyncIterator[V_co]:
+        with self.provide_sync(request) as value:
+            yield value
+
+    def __open(self, request: SubRequest) -> t.ContextManager[V_co]:
+        if not self.__provider.is_async:
+            return self.__provider.provide_sync(request)
+
+        runner = get_case_async_runner(request.config)
+        if runner is None or _is_event_loop_running():
+            msg = f"lazy async case provider can be used only by sync test functions with native async runner: {self}"
+            raise TypeError(msg)
+
+        resolve_provider_fixtures(self.__provider, request)
+        return runner.enter(self.__provider.provide_async(request))
+
+
+def _is_event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+
+    except RuntimeError:
+        return False
+
+    return True
@@ -0,0 +1,69 @@
+import typing as t
+
+import pytest
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+from _pytest.terminal import TerminalReporter
+
+from pytest_case_provider.case.batch import CaseBatch
+from pytest_case_provider.case.info import CaseInfo, get_item_definition_id
+
+
+class CaseMaxFailGuard:
+    """
+    Skips remaining cases of a case parametrized test function after the given number of its cases failed.
+
+    Cases are skipped at setup, before their providers are invoked, with the same reason reported at the location of
+    the test function, so `-rs` summary shows a single line for each stopped test function. Other test functions keep
+    running, session wide `--maxfail` counts failed items only and is not affected.
+    """
+
+    def __init__(self, maxfail: int) -> None:
+        self.__maxfail = maxfail
+        self.__failures = dict[str, int]()
+        self.__skipped = dict[str, int]()
+        self.__failed_item: t.Optional[str] = None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item: Item) -> None:
+        if not _is_case_item(item):
+            return
+
+        definition_id = get_item_definition_id(item)
+        failures = self.__failures.get(definition_id, 0)
+        if failures < self.__maxfail:
+            return
+
+        self.__skipped[definition_id] = self.__skipped.get(definition_id, 0) + 1
+        reason = f"case maxfail: {failures} cases of the test failed, remaining cases are skipped"
+        raise pytest.skip.Exception(reason, _use_item_location=True)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item: Item) -> t.Generator[None, TestReport, TestReport]:
+        report = yield
+
+        # NOTE: an item is counted once, even if both call & teardown of it failed.
+        if report.failed and self.__failed_item != item.nodeid and _is_case_item(item):
+            self.__failed_item = item.nodeid
+            definition_id = get_item_definition_id(item)
+            self.__failures[definition_id] = self.__failures.get(definition_id, 0) + 1
+
+        return report
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        if not self.__skipped:
+            return
+
+        terminalreporter.write_sep("-", "case maxfail")
+        for definition_id, skipped in self.__skipped.items():
+            terminalreporter.write_line(
+                f"{definition_id}: {skipped} cases skipped after {self.__failures[definition_id]} failures"
+            )
+
+
+def _is_case_item(item: Item) -> bool:
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return False
+
+    return any(isinstance(value, (CaseInfo, CaseBatch)) for value in callspec.params.values())
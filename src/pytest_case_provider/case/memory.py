@@ -0,0 +1,140 @@
+import tracemalloc
+import typing as t
+from dataclasses import dataclass, field
+
+from _pytest.nodes import Item
+from _pytest.terminal import TerminalReporter
+
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.provider import CaseProvider
+
+# NOTE: pytest keeps a few objects (e.g. reports) after each item, thus small growths are ignored.
+_LEAK_GROWTH_THRESHOLD: t.Final[int] = 1024
+
+
+@dataclass
+class CaseMemoryStats:
+    """
+    Memory allocated by the case provider over all its provisions (in bytes).
+
+    :param peak: max peak of memory allocated during case value construction.
+    :param retained: max memory held after case value construction (i.e. the case value).
+    :param growths: memory left allocated after each case value teardown.
+    """
+
+    name: str
+    provisions: int = 0
+    peak: int = 0
+    retained: int = 0
+    growths: list[int] = field(default_factory=list)
+
+    @property
+    def growth(self) -> int:
+        return sum(self.growths)
+
+    @property
+    def is_growing(self) -> bool:
+        return len(self.growths) > 1 and all(growth > _LEAK_GROWTH_THRESHOLD for growth in self.growths)
+
+
+class CaseMemoryRecorder:
+    """
+    Records memory allocated by case providers with `tracemalloc` & reports the heaviest providers.
+
+    Peak of traced memory is reset before each provision, so peaks of overlapping (concurrent) provisions are not
+    separated. Providers that leave memory allocated after each teardown are reported as possible leaks.
+    """
+
+    def __init__(self, top: int = 10) -> None:
+        self.__top = top
+        self.__stats = dict[CaseProvider[object], CaseMemoryStats]()
+        self.__starts = dict[tuple[str, str], int]()
+        self.__teardowns = dict[str, list[tuple[CaseInfo[object], int]]]()
+        self.__started_tracing = False
+
+    @property
+    def stats(self) -> t.Sequence[CaseMemoryStats]:
+        return list(self.__stats.values())
+
+    def pytest_configure(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracing = True
+
+    def pytest_unconfigure(self) -> None:
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
+
+    def pytest_case_provide_start(self, item: Item, case_info: CaseInfo[object]) -> None:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        self.__starts[item.nodeid, case_info.name] = current
+
+    def pytest_case_provide_finish(self, item: Item, case_info: CaseInfo[object]) -> None:
+        start = self.__starts.get((item.nodeid, case_info.name))
+        if start is None:
+            return
+
+        current, peak = tracemalloc.get_traced_memory()
+
+        stats = self.__get_stats(case_info)
+        stats.provisions += 1
+        stats.peak = max(stats.peak, peak - start)
+        stats.retained = max(stats.retained, current - start)
+
+    def pytest_case_teardown(self, item: Item, case_info: CaseInfo[object]) -> None:
+        start = self.__starts.pop((item.nodeid, case_info.name), None)
+        if start is None:
+            return
+
+        # NOTE: pytest keeps references to fixture values until the item is finished, so the growth is measured later.
+        self.__teardowns.setdefault(item.nodeid, []).append((case_info, start))
+
+    def pytest_runtest_logfinish(self, nodeid: str) -> None:
+        teardowns = self.__teardowns.pop(nodeid, None)
+        if not teardowns:
+            return
+
+        current, _ = tracemalloc.get_traced_memory()
+        for case, start in teardowns:
+            self.__get_stats(case).growths.append(current - start)
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        if not self.__stats:
+            return
+
+        terminalreporter.write_sep("=", "case memory")
+
+        heaviest = sorted(self.__stats.values(), key=lambda stats: (stats.peak, stats.retained), reverse=True)
+        for stats in heaviest[: self.__top]:
+            terminalreporter.write_line(
+                f"{format_memory_size(stats.peak):>10} peak {format_memory_size(stats.retained):>10} retained "
+                f"{format_memory_size(stats.growth):>10} growth  {stats.name} ({stats.provisions} provisions)"
+            )
+
+        growing = [stats for stats in self.__stats.values() if stats.is_growing]
+        for stats in sorted(growing, key=lambda stats: stats.growth, reverse=True):
+            terminalreporter.write_line(
+                f"possible leak: {stats.name} retained {format_memory_size(stats.growth)} after "
+                f"{len(stats.growths)} teardowns",
+                yellow=True,
+            )
+
+    def __get_stats(self, case: CaseInfo[object]) -> CaseMemoryStats:
+        stats = self.__stats.get(case.provider)
+        if stats is None:
+            stats = self.__stats[case.provider] = CaseMemoryStats(case.name)
+
+        return stats
+
+
+def format_memory_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:  # noqa: PLR2004
+            return f"{value:.1f} {unit}" if unit != "B" else f"{size} B"
+
+        value /= 1024
+
+    return f"{value:.1f} GiB"
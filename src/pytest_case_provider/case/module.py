@@ -0,0 +1,241 @@
+import ast
+import fnmatch
+import importlib
+import inspect
+import sys
+import typing as t
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from _pytest.fixtures import SubRequest
+from _pytest.mark import MarkDecorator
+from _pytest.mark.structures import get_unpacked_marks
+from typing_extensions import override
+
+from pytest_case_provider.abc import CaseCollector
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.provider import CaseProvider, CaseProviderFunc
+
+V_co = t.TypeVar("V_co", covariant=True)
+
+_CASE_PREFIX: t.Final[str] = "case_"
+_GLOB_CHARS: t.Final[frozenset[str]] = frozenset("*?[")
+
+
+@dataclass(frozen=True)
+class CaseModuleEntry:
+    """Case provider function found in the module source."""
+
+    name: str
+    is_async: bool
+    marks: t.Sequence[MarkDecorator]
+
+
+class CaseModuleCollector(CaseCollector[V_co]):
+    """
+    Collects `case_*` provider functions of the modules without importing them.
+
+    Modules (a dotted module path, `fnmatch` patterns are allowed in each part) are found on `sys.path` & their source
+    is scanned with `ast`, so only case names & marks are known at collection. The module is imported at the setup of
+    the first item that uses one of its cases. Modules that are imported already are not scanned. A module is imported
+    during collection when marks of its providers can't be evaluated statically, i.e. when provider decorators are not
+    `pytest.mark.*` ones with literal arguments.
+    """
+
+    def __init__(self, pattern: str) -> None:
+        self.__pattern = pattern
+        self.__cases: t.Optional[t.Sequence[CaseInfo[V_co]]] = None
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__pattern!r})"
+
+    @override
+    def collect_cases(self) -> t.Iterable[CaseInfo[V_co]]:
+        if self.__cases is None:
+            self.__cases = list(self.__find_cases())
+
+        return self.__cases
+
+    def __find_cases(self) -> t.Iterator[CaseInfo[V_co]]:
+        modules = find_case_modules(self.__pattern)
+        if not modules:
+            msg = f"no case modules found: {self.__pattern!r}"
+            raise LookupError(msg)
+
+        for module, path in modules:
+            entries = scan_case_module(path) if module not in sys.modules else None
+
+            if entries is None:
+                yield from self.__import_cases(module)
+                continue
+
+            for entry in entries:
+                yield CaseInfo(
+                    name=entry.name,
+                    provider=LazyModuleCaseProvider(module, entry.name, is_async=entry.is_async),
+                    marks=entry.marks,
+                )
+
+    def __import_cases(self, module: str) -> t.Iterator[CaseInfo[V_co]]:
+        for name, func in vars(importlib.import_module(module)).items():
+            if name.startswith(_CASE_PREFIX) and inspect.isfunction(func):
+                yield CaseInfo(
+                    name=name,
+                    provider=CaseProvider(t.cast("CaseProviderFunc[t.Any, V_co]", func)),
+                    marks=get_unpacked_marks(func),
+                )
+
+
+class LazyModuleCaseProvider(CaseProvider[V_co]):
+    """Provides the case with the provider function of the module, the module is imported on first use."""
+
+    def __init__(self, module: str, name: str, *, is_async: bool) -> None:
+        # NOTE: the provider function is not known until the module is imported, all base methods are overridden.
+        super().__init__(t.cast("t.Any", None))
+        self.__module = module
+        self.__name = name
+        self.__is_async = is_async
+        self.__provider: t.Optional[CaseProvider[V_co]] = None
+
+    @override
+    def __str__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.__module}:{self.__name}>"
+
+    @property
+    @override
+    def func(self) -> CaseProviderFunc[t.Any, V_co]:
+        return self.__load().func
+
+    @property
+    @override
+    def is_async(self) -> bool:
+        return self.__is_async
+
+    @property
+    @override
+    def signature(self) -> inspect.Signature:
+        return self.__load().signature
+
+    @override
+    @contextmanager
+    def provide_sync(self, request: SubRequest) -> t.Iterator[V_co]:
+        with self.__load().provide_sync(request) as value:
+            yield value
+
+    @override
+    @asynccontextmanager
+    async def provide_async(self, request: SubRequest) -> t.AsyncIterator[V_co]:
+        async with self.__load().provide_async(request) as value:
+            yield value
+
+    def __load(self) -> CaseProvider[V_co]:
+        if self.__provider is None:
+            func = getattr(importlib.import_module(self.__module), self.__name)
+            self.__provider = CaseProvider(func)
+
+        return self.__provider
+
+
+def find_case_modules(pattern: str) -> t.Sequence[tuple[str, Path]]:
+    """Find source files of the modules matching the dotted pattern on `sys.path` (without importing them)."""
+    found = dict[str, Path]()
+
+    for entry in sys.path:
+        for module, path in _find_modules(Path(entry or "."), pattern.split(".")):
+            found.setdefault(module, path)
+
+    return sorted(found.items())
+
+
+def _find_modules(directory: Path, parts: t.Sequence[str], prefix: str = "") -> t.Iterator[tuple[str, Path]]:
+    part, rest = parts[0], parts[1:]
+
+    if _GLOB_CHARS.isdisjoint(part):
+        names = [part]
+    else:
+        try:
+            names = sorted({child.stem if child.suffix == ".py" else child.name for child in directory.iterdir()})
+        except OSError:
+            return
+
+        # NOTE: skip `__init__` & `__pycache__`, packages are matched by their directory names.
+        names = [
+            name
+            for name in names
+            if name.isidentifier() and not name.startswith("__") and fnmatch.fnmatchcase(name, part)
+        ]
+
+    for name in names:
+        module = f"{prefix}{name}"
+        package = directory / name
+
+        if rest:
+            if (package / "__init__.py").is_file():
+                yield from _find_modules(package, rest, f"{module}.")
+
+        elif (package / "__init__.py").is_file():
+            yield module, package / "__init__.py"
+
+        elif (directory / f"{name}.py").is_file():
+            yield module, directory / f"{name}.py"
+
+
+def scan_case_module(path: Path) -> t.Optional[t.Sequence[CaseModuleEntry]]:
+    """Find `case_*` functions in the module source, returns `None` if their marks can't be evaluated statically."""
+    entries = list[CaseModuleEntry]()
+
+    for node in ast.parse(path.read_bytes(), str(path)).body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) or not node.name.startswith(_CASE_PREFIX):
+            continue
+
+        marks = list[MarkDecorator]()
+        for decorator in node.decorator_list:
+            mark = _evaluate_mark(decorator)
+            if mark is None:
+                return None
+
+            marks.append(mark)
+
+        # NOTE: decorators are applied bottom up, pytest keeps marks in the same order.
+        entries.append(CaseModuleEntry(node.name, isinstance(node, ast.AsyncFunctionDef), marks[::-1]))
+
+    return entries
+
+
+def _evaluate_mark(node: ast.expr) -> t.Optional[MarkDecorator]:
+    call = node if isinstance(node, ast.Call) else None
+    target = call.func if call is not None else node
+
+    # NOTE: `pytest.mark.<name>` or `mark.<name>`.
+    if not isinstance(target, ast.Attribute):
+        return None
+
+    owner = target.value
+    is_mark = (isinstance(owner, ast.Name) and owner.id == "mark") or (
+        isinstance(owner, ast.Attribute)
+        and owner.attr == "mark"
+        and isinstance(owner.value, ast.Name)
+        and owner.value.id == "pytest"
+    )
+    if not is_mark:
+        return None
+
+    mark: MarkDecorator = getattr(pytest.mark, target.attr)
+    if call is None:
+        return mark
+
+    try:
+        args = [ast.literal_eval(arg) for arg in call.args]
+        kwargs = {keyword.arg: ast.literal_eval(keyword.value) for keyword in call.keywords if keyword.arg is not None}
+
+    # NOTE: `literal_eval` fails with other errors on literals it can't build, e.g. `{[1]: 2}` or too deep nesting.
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+    if len(kwargs) != len(call.keywords):
+        return None
+
+    return t.cast("MarkDecorator", mark(*args, **kwargs))
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CaseBatchOptions:
+    """
+    Options of batched case execution.
+
+    :param size: max number of cases to run within one pytest item.
+    :param subtests: report outcome of each case separately with own node id (the batch item is not reported then).
+    :param concurrency: max number of cases of async test function to run at once as tasks of the event loop.
+    :param threads: max number of cases of sync test function to run at once in threads (when the GIL is disabled).
+    """
+
+    size: int
+    subtests: bool = False
+    concurrency: int = 1
+    threads: int = 1
+
+    def __post_init__(self) -> None:
+        if self.size < 1:
+            msg = f"batch size must be positive, got: {self.size}"
+            raise ValueError(msg)
+
+        if self.concurrency < 1:
+            msg = f"batch concurrency must be positive, got: {self.concurrency}"
+            raise ValueError(msg)
+
+        if self.threads < 1:
+            msg = f"batch threads must be positive, got: {self.threads}"
+            raise ValueError(msg)
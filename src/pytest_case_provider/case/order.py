@@ -0,0 +1,43 @@
+import typing as t
+
+from _pytest.python import FunctionDefinition
+from typing_extensions import override
+
+from pytest_case_provider.abc import CaseReorderer
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.outcome import CaseOutcome, CaseOutcomeStore
+
+T = t.TypeVar("T")
+
+
+class FailedFirstCaseReorderer(CaseReorderer):
+    """
+    Moves cases that failed on the last run to the front, then cases that failed before (flaky ones).
+
+    Cases that failed more often go first, ties are broken by the last run duration, so quick to fail cases go before
+    historically slow ones (failures show up sooner). Cases are reordered with a stable sort, so the rest of cases keep
+    their original order.
+    """
+
+    def __init__(self, store: CaseOutcomeStore) -> None:
+        self.__store = store
+
+    @override
+    def reorder(self, definition: FunctionDefinition, cases: t.Sequence[CaseInfo[T]]) -> t.Sequence[CaseInfo[T]]:
+        outcomes = self.__store.get(definition.nodeid)
+        if not outcomes:
+            return cases
+
+        return sorted(cases, key=lambda case: self.__get_priority(outcomes.get(case.name)))
+
+    def __get_priority(self, outcome: t.Optional[CaseOutcome]) -> tuple[int, int, float]:
+        if outcome is None:
+            return 2, 0, 0.0
+
+        if outcome.failed:
+            return 0, -outcome.failures, outcome.duration
+
+        if outcome.failures > 0:
+            return 1, -outcome.failures, outcome.duration
+
+        return 2, 0, 0.0
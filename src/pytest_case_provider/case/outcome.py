@@ -0,0 +1,140 @@
+import typing as t
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+import pytest
+from _pytest.cacheprovider import Cache
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+
+from pytest_case_provider.case.info import get_item_definition_id, get_report_case
+
+
+@dataclass(frozen=True)
+class CaseOutcome:
+    failed: bool
+    failures: int = 0
+    duration: float = 0.0
+
+
+class CaseOutcomeStore:
+    """Keeps per-case outcomes of previous runs in pytest's cache."""
+
+    KEY: t.Final[str] = "case_provider/outcomes"
+
+    def __init__(self, cache: Cache) -> None:
+        self.__cache = cache
+        self.__outcomes: t.Optional[dict[str, dict[str, CaseOutcome]]] = None
+
+    def get(self, definition_id: str) -> t.Mapping[str, CaseOutcome]:
+        return self.__load().get(definition_id, {})
+
+    def update(self, definition_id: str, case_name: str, *, failed: bool, duration: float) -> None:
+        outcomes = self.__load().setdefault(definition_id, {})
+        prev = outcomes.get(case_name, CaseOutcome(failed=False))
+        outcomes[case_name] = replace(
+            prev,
+            failed=failed,
+            failures=prev.failures + int(failed),
+            duration=duration,
+        )
+
+    def prune(self, exists: t.Callable[[str], bool]) -> None:
+        """Drop outcomes of test functions that don't exist anymore."""
+        outcomes = self.__load()
+        for definition_id in [definition_id for definition_id in outcomes if not exists(definition_id)]:
+            del outcomes[definition_id]
+
+    def save(self) -> None:
+        if self.__outcomes is None:
+            return
+
+        self.__cache.set(
+            self.KEY,
+            {
+                definition_id: {name: asdict(outcome) for name, outcome in outcomes.items()}
+                for definition_id, outcomes in self.__outcomes.items()
+            },
+        )
+
+    def __load(self) -> dict[str, dict[str, CaseOutcome]]:
+        if self.__outcomes is None:
+            raw = self.__cache.get(self.KEY, {})
+            # NOTE: stale or corrupt entries of the cache are skipped, the cache is rewritten at the end of the run.
+            self.__outcomes = {
+                definition_id: {
+                    name: outcome
+                    for name, outcome in ((name, _parse_outcome(outcome)) for name, outcome in outcomes.items())
+                    if outcome is not None
+                }
+                for definition_id, outcomes in (raw.items() if isinstance(raw, dict) else ())
+                if isinstance(outcomes, dict)
+            }
+
+        return self.__outcomes
+
+
+class CaseOutcomeRecorder:
+    """
+    A pytest plugin that records outcomes of case runs into the store.
+
+    Outcomes are recorded from reports of case runs, so with pytest-xdist the controller records reports of all workers
+    (the recorder should not be registered on workers, these would overwrite results of each other in the cache).
+
+    Outcomes of test functions whose file was removed are dropped, as well as outcomes of test functions that were not
+    collected from their module, when whole modules are collected (i.e. no node ids are selected & no `--lf`).
+    """
+
+    def __init__(self, store: CaseOutcomeStore, rootpath: Path, *, prune_modules: bool) -> None:
+        self.__store = store
+        self.__rootpath = rootpath
+        self.__prune_modules = prune_modules
+        self.__runs = dict[tuple[str, str], tuple[bool, float]]()
+        self.__definitions = set[str]()
+        self.__modules = set[str]()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, items: t.Sequence[Item]) -> None:
+        # NOTE: items are seen before deselection (e.g. by `-k`), deselected test functions still exist.
+        for item in items:
+            self.__definitions.add(get_item_definition_id(item))
+            self.__modules.add(item.nodeid.split("::", 1)[0])
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        key = get_report_case(report)
+        if key is not None:
+            failed, duration = self.__runs.get(key, (False, 0.0))
+            self.__runs[key] = (failed or report.failed, duration + report.duration)
+
+    def pytest_sessionfinish(self) -> None:
+        for (definition_id, case_name), (failed, duration) in self.__runs.items():
+            self.__store.update(definition_id, case_name, failed=failed, duration=duration)
+
+        self.__store.prune(self.__exists)
+        self.__store.save()
+
+    def __exists(self, definition_id: str) -> bool:
+        if definition_id in self.__definitions:
+            return True
+
+        path = definition_id.split("::", 1)[0]
+        if not (self.__rootpath / path).exists():
+            return False
+
+        return not (self.__prune_modules and path in self.__modules)
+
+
+def _parse_outcome(raw: object) -> t.Optional[CaseOutcome]:
+    if not isinstance(raw, dict):
+        return None
+
+    failed, failures, duration = raw.get("failed"), raw.get("failures", 0), raw.get("duration", 0.0)
+    if (
+        not isinstance(failed, bool)
+        or not isinstance(failures, int)
+        or isinstance(failures, bool)
+        or not isinstance(duration, (int, float))
+    ):
+        return None
+
+    return CaseOutcome(failed=failed, failures=failures, duration=float(duration))
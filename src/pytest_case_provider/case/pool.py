@@ -0,0 +1,343 @@
+import asyncio
+import threading
+import time
+import typing as t
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+
+from _pytest.terminal import TerminalReporter
+from typing_extensions import override
+
+T = t.TypeVar("T")
+
+# NOTE: pools are created at import of test modules, they are reported & closed by the plugin at the session end.
+_POOLS: "weakref.WeakSet[CasePool[t.Any]]" = weakref.WeakSet()
+
+
+@dataclass(frozen=True)
+class CasePoolStats:
+    """
+    Usage of the pool resources.
+
+    :param size: number of resources in the pool (idle & in use).
+    :param peak: max number of resources in use at once.
+    :param busy_time: total time resources were in use.
+    :param alive_time: total time resources existed, so `busy_time / alive_time` is the utilization of the pool.
+    """
+
+    name: str
+    size: int
+    peak: int
+    created: int
+    discarded: int
+    acquisitions: int
+    waits: int
+    wait_time: float
+    max_wait: float
+    busy_time: float
+    alive_time: float
+
+    @property
+    def utilization(self) -> float:
+        return self.busy_time / self.alive_time if self.alive_time > 0 else 0.0
+
+
+class CasePool(t.Generic[T]):
+    """
+    Pool of reusable resources (e.g. database files, stand-in servers, populated directories) for case providers.
+
+    A case provider acquires a resource for the case & the resource gets back to the pool after the case, the cheap
+    `reset` hook is called on release, so the next case gets a clean resource without creating it again. The pool
+    grows up to `max_size` resources, then acquisitions wait for a released resource. `warm` resources are created
+    ahead, before the test run (or on the first acquisition of the pool created during the run). Resources that failed
+    to reset are closed & discarded. The pool is thread safe, so cases of batches running in threads can share it.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        factory: t.Callable[[], T],
+        *,
+        reset: t.Optional[t.Callable[[T], object]] = None,
+        close: t.Optional[t.Callable[[T], object]] = None,
+        max_size: int = 1,
+        warm: int = 0,
+        name: t.Optional[str] = None,
+    ) -> None:
+        if max_size < 1:
+            msg = f"max_size should be a positive number, got: {max_size}"
+            raise ValueError(msg)
+
+        if not 0 <= warm <= max_size:
+            msg = f"warm should be between 0 and max_size ({max_size}), got: {warm}"
+            raise ValueError(msg)
+
+        self.__factory = factory
+        self.__reset = reset
+        self.__close = close
+        self.__max_size = max_size
+        self.__warm = warm
+        self.__name: str = name or str(getattr(factory, "__qualname__", factory))
+
+        self.__condition = threading.Condition()
+        self.__idle = list[T]()
+        self.__born = dict[int, float]()
+        self.__size = 0
+        self.__in_use = 0
+
+        self.__peak = 0
+        self.__created = 0
+        self.__discarded = 0
+        self.__acquisitions = 0
+        self.__waits = 0
+        self.__wait_time = 0.0
+        self.__max_wait = 0.0
+        self.__busy_time = 0.0
+        self.__dead_time = 0.0
+
+        _POOLS.add(self)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__name!r}, max_size={self.__max_size})"
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def stats(self) -> CasePoolStats:
+        with self.__condition:
+            now = time.perf_counter()
+            return CasePoolStats(
+                name=self.__name,
+                size=self.__size,
+                peak=self.__peak,
+                created=self.__created,
+                discarded=self.__discarded,
+                acquisitions=self.__acquisitions,
+                waits=self.__waits,
+                wait_time=self.__wait_time,
+                max_wait=self.__max_wait,
+                busy_time=self.__busy_time,
+                alive_time=self.__dead_time + sum(now - born for born in self.__born.values()),
+            )
+
+    def warmup(self) -> None:
+        """Create resources until the pool has `warm` ones."""
+        while True:
+            with self.__condition:
+                if self.__size >= self.__warm:
+                    return
+
+                self.__size += 1
+
+            try:
+                resource = self.__create()
+
+            except BaseException:
+                with self.__condition:
+                    self.__size -= 1
+                    self.__condition.notify()
+                raise
+
+            with self.__condition:
+                self.__idle.append(resource)
+                self.__condition.notify()
+
+    @contextmanager
+    def acquire(self, timeout: t.Optional[float] = None) -> t.Iterator[T]:
+        """Get a resource from the pool for the time of the context, waits (up to `timeout`) if all are in use."""
+        self.warmup()
+        resource = self.__take(self.__wait(timeout))
+        start = time.perf_counter()
+        try:
+            yield resource
+
+        finally:
+            self.__release(resource, start)
+
+    @asynccontextmanager
+    async def acquire_async(self, timeout: t.Optional[float] = None) -> t.AsyncIterator[T]:
+        """Same as `acquire`, but the waiting for a released resource doesn't block the event loop."""
+        self.warmup()
+        slot = self.__try_reserve()
+        if slot is None:
+            future = asyncio.get_running_loop().run_in_executor(None, self.__wait, timeout)
+            try:
+                slot = await asyncio.shield(future)
+
+            except asyncio.CancelledError:
+                # NOTE: the waiting thread can't be interrupted, the slot it gets is given back to the pool.
+                future.add_done_callback(self.__cancel_reservation)
+                raise
+
+        resource = self.__take(slot)
+        start = time.perf_counter()
+        try:
+            yield resource
+
+        finally:
+            self.__release(resource, start)
+
+    def close(self) -> None:
+        """Close idle resources, the pool creates new ones on the next acquisitions."""
+        with self.__condition:
+            idle, self.__idle = self.__idle, []
+
+        for resource in idle:
+            self.__discard(resource, counted=False)
+
+    def __try_reserve(self) -> t.Optional["_Slot[T]"]:
+        with self.__condition:
+            return self.__reserve()
+
+    def __wait(self, timeout: t.Optional[float]) -> "_Slot[T]":
+        start = time.perf_counter()
+        deadline = start + timeout if timeout is not None else None
+
+        with self.__condition:
+            slot = self.__reserve()
+            if slot is not None:
+                return slot
+
+            while slot is None:
+                remaining = deadline - time.perf_counter() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    msg = f"no resource of {self!r} was released in {timeout} seconds"
+                    raise TimeoutError(msg)
+
+                self.__condition.wait(remaining)
+                slot = self.__reserve()
+
+            waited = time.perf_counter() - start
+            self.__waits += 1
+            self.__wait_time += waited
+            self.__max_wait = max(self.__max_wait, waited)
+
+        return slot
+
+    def __reserve(self) -> t.Optional["_Slot[T]"]:
+        # NOTE: called under the lock, a slot is either an idle resource or a permission to create a new one.
+        if self.__idle:
+            slot = _Slot(self.__idle.pop())
+
+        elif self.__size < self.__max_size:
+            self.__size += 1
+            slot = _Slot[T]()
+
+        else:
+            return None
+
+        self.__acquisitions += 1
+        self.__in_use += 1
+        self.__peak = max(self.__peak, self.__in_use)
+        return slot
+
+    def __cancel_reservation(self, future: "asyncio.Future[_Slot[T]]") -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        slot = future.result()
+        with self.__condition:
+            self.__in_use -= 1
+            if slot.has_resource:
+                self.__idle.append(slot.resource)
+            else:
+                self.__size -= 1
+
+            self.__condition.notify()
+
+    def __take(self, slot: "_Slot[T]") -> T:
+        if slot.has_resource:
+            return slot.resource
+
+        try:
+            return self.__create()
+
+        except BaseException:
+            with self.__condition:
+                self.__size -= 1
+                self.__in_use -= 1
+                self.__condition.notify()
+            raise
+
+    def __create(self) -> T:
+        resource = self.__factory()
+        with self.__condition:
+            self.__created += 1
+            self.__born[id(resource)] = time.perf_counter()
+
+        return resource
+
+    def __release(self, resource: T, start: float) -> None:
+        with self.__condition:
+            self.__in_use -= 1
+            self.__busy_time += time.perf_counter() - start
+
+        try:
+            if self.__reset is not None:
+                self.__reset(resource)
+
+        except BaseException:
+            self.__discard(resource)
+            raise
+
+        with self.__condition:
+            self.__idle.append(resource)
+            self.__condition.notify()
+
+    def __discard(self, resource: T, *, counted: bool = True) -> None:
+        with self.__condition:
+            self.__size -= 1
+            self.__discarded += int(counted)
+            self.__dead_time += time.perf_counter() - self.__born.pop(id(resource), time.perf_counter())
+            self.__condition.notify()
+
+        if self.__close is not None:
+            self.__close(resource)
+
+
+class CasePoolReporter:
+    """A pytest plugin that warms up case pools before the test run, reports their usage & closes them at exit."""
+
+    def pytest_collection_finish(self) -> None:
+        for pool in list(_POOLS):
+            pool.warmup()
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        stats = [pool.stats for pool in list(_POOLS)]
+        stats = sorted((item for item in stats if item.acquisitions), key=lambda item: item.name)
+        if not stats:
+            return
+
+        terminalreporter.write_sep("-", "case pools")
+        for item in stats:
+            terminalreporter.write_line(
+                f"{item.name}: {item.acquisitions} acquisitions of {item.created} created resources "
+                f"(peak {item.peak} in use, {item.discarded} discarded), {item.utilization:.0%} utilization, "
+                f"{item.waits} waits ({item.wait_time:.3f}s total, {item.max_wait:.3f}s max)"
+            )
+
+    def pytest_unconfigure(self) -> None:
+        for pool in list(_POOLS):
+            pool.close()
+
+
+class _Slot(t.Generic[T]):
+    __slots__ = ("__resource",)
+
+    def __init__(self, *resource: T) -> None:
+        self.__resource = resource
+
+    @property
+    def has_resource(self) -> bool:
+        return bool(self.__resource)
+
+    @property
+    def resource(self) -> T:
+        return self.__resource[0]
@@ -0,0 +1,129 @@
+import cProfile
+import heapq
+import pstats
+import re
+import time
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config
+from _pytest.nodes import Item
+from _pytest.terminal import TerminalReporter
+
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.provider import CaseProvider
+
+
+@dataclass(order=True)
+class CaseProfile:
+    elapsed: float
+    nodeid: str = field(compare=False)
+    case: str = field(compare=False)
+    stats: pstats.Stats = field(compare=False, repr=False)
+
+
+class CaseProfiler:
+    """
+    Profiles case value construction & test call of each case parametrized item with `cProfile`.
+
+    Only profiles of the slowest items are kept & written to the directory, profiles of all items are merged for each
+    case provider. Profiling starts when the first case of the item is being provided, thus other fixtures of the item
+    are not profiled.
+    """
+
+    def __init__(self, config: Config, path: Path, top: int = 10) -> None:
+        self.__path = path
+        self.__top = top
+        self.__active = dict[str, tuple[CaseInfo[object], cProfile.Profile, float]]()
+        self.__slowest = list[CaseProfile]()
+        self.__providers = dict[CaseProvider[object], tuple[str, pstats.Stats]]()
+
+        workerinput = getattr(config, "workerinput", None)
+        self.__suffix = f"-{workerinput['workerid']}" if workerinput is not None else ""
+
+    def pytest_case_provide_start(self, item: Item, case_info: CaseInfo[object]) -> None:
+        if item.nodeid in self.__active:
+            return
+
+        profile = cProfile.Profile()
+        self.__active[item.nodeid] = (case_info, profile, time.perf_counter())
+        profile.enable()
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: Item) -> t.Generator[None, None, None]:
+        try:
+            return (yield)
+
+        finally:
+            self.__finish(item)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_teardown(self, item: Item) -> t.Generator[None, None, None]:
+        # NOTE: item may fail before the call (e.g. provider error), the profile is finished anyway.
+        try:
+            return (yield)
+
+        finally:
+            self.__finish(item)
+
+    def pytest_sessionfinish(self) -> None:
+        if not self.__slowest and not self.__providers:
+            return
+
+        self.__path.mkdir(parents=True, exist_ok=True)
+
+        for profile in self.__slowest:
+            profile.stats.dump_stats(self.__path / f"{_to_filename(profile.nodeid)}{self.__suffix}.prof")
+
+        names = set[str]()
+        for name, stats in self.__providers.values():
+            filename = f"provider-{_to_filename(name)}"
+            i = 1
+            while filename in names:
+                filename, i = f"provider-{_to_filename(name)}-{i}", i + 1
+
+            names.add(filename)
+            stats.dump_stats(self.__path / f"{filename}{self.__suffix}.prof")
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        if not self.__slowest:
+            return
+
+        terminalreporter.write_sep("=", f"case profile: {self.__path}")
+        for profile in sorted(self.__slowest, reverse=True):
+            terminalreporter.write_line(f"{profile.elapsed:10.3f}s  {profile.nodeid}")
+
+    def __finish(self, item: Item) -> None:
+        active = self.__active.pop(item.nodeid, None)
+        if active is None:
+            return
+
+        case, profile, start = active
+        profile.disable()
+        elapsed = time.perf_counter() - start
+
+        stats = pstats.Stats(profile)
+        self.__add_provider_stats(case, stats)
+
+        if self.__top <= 0:
+            return
+
+        entry = CaseProfile(elapsed, item.nodeid, case.name, stats)
+        if len(self.__slowest) < self.__top:
+            heapq.heappush(self.__slowest, entry)
+        elif entry > self.__slowest[0]:
+            heapq.heapreplace(self.__slowest, entry)
+
+    def __add_provider_stats(self, case: CaseInfo[object], stats: pstats.Stats) -> None:
+        merged = self.__providers.get(case.provider)
+        if merged is None:
+            # NOTE: item stats may be dumped separately, thus they are added to an empty stats instead of being reused.
+            merged = self.__providers[case.provider] = (case.name, pstats.Stats())
+
+        merged[1].add(stats)
+
+
+def _to_filename(value: str) -> str:
+    return re.sub(r"[^\w.\-\[\]]+", "_", value).strip("_")
@@ -30,6 +30,10 @@ class CaseProvider(t.Generic[V_co]):
     def __str__(self) -> str:
         return f"<{self.__class__.__name__}: {self.__func}>"
 
+    @property
+    def func(self) -> CaseProviderFunc[t.Any, V_co]:
+        return self.__func
+
     @property
     def is_async(self) -> bool:
         return inspect.iscoroutinefunction(self.__func) or inspect.isasyncgenfunction(self.__func)
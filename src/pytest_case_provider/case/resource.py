@@ -0,0 +1,158 @@
+import mmap
+import os
+import typing as t
+from pathlib import Path
+
+from _pytest.mark import Mark, MarkDecorator
+from typing_extensions import override
+
+from pytest_case_provider.abc import CaseCollector
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.provider import CaseProvider, CaseProviderFunc
+
+
+class CaseResource:
+    """
+    File mapped into memory with `mmap` on first access, the mapping is shared by all cases & tests that use it.
+
+    Cases get read only `memoryview` slices of the mapping, so the file is read once (lazily, by OS pages) and is never
+    copied.
+    """
+
+    def __init__(self, path: t.Union[str, "os.PathLike[str]"]) -> None:
+        self.__path = Path(path)
+        self.__view: t.Optional[memoryview] = None
+        self.__records = dict[bytes, t.Sequence[tuple[int, int]]]()
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.__path)!r})"
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def view(self, start: int = 0, stop: t.Optional[int] = None) -> memoryview:
+        if self.__view is None:
+            self.__view = self.__map()
+
+        return self.__view[start:stop]
+
+    def records(self, delimiter: bytes) -> t.Sequence[tuple[int, int]]:
+        """Find `(start, stop)` regions of the records separated by the delimiter (empty trailing record is skipped)."""
+        records = self.__records.get(delimiter)
+        if records is None:
+            records = self.__records[delimiter] = list(self.__find_records(delimiter))
+
+        return records
+
+    def cases(
+        self,
+        name: t.Optional[str] = None,
+        delimiter: t.Optional[bytes] = None,
+        marks: t.Optional[t.Sequence[t.Union[Mark, MarkDecorator]]] = None,
+    ) -> "CaseResourceCollector":
+        """
+        Create collector of the resource cases: the whole file is a case or each record of the file is a case.
+
+        :param name: name of the case (file name by default), records are named as `<name>#<index>`.
+        """
+        collector = CaseResourceCollector(marks=marks)
+        collector.add(self, name=name, delimiter=delimiter)
+        return collector
+
+    @classmethod
+    def directory(
+        cls,
+        path: t.Union[str, "os.PathLike[str]"],
+        pattern: str = "*",
+        delimiter: t.Optional[bytes] = None,
+        marks: t.Optional[t.Sequence[t.Union[Mark, MarkDecorator]]] = None,
+    ) -> "CaseResourceCollector":
+        """
+        Create collector of the cases of each file in the directory found by the glob pattern (e.g. `**/*.bin`).
+
+        Cases are named by relative file paths, files are opened when their cases are used (or collected if delimiter
+        is set, because records have to be found).
+        """
+        root = Path(path)
+        collector = CaseResourceCollector(marks=marks)
+        for file in sorted(root.glob(pattern)):
+            if file.is_file():
+                collector.add(cls(file), name=file.relative_to(root).as_posix(), delimiter=delimiter)
+
+        return collector
+
+    def __map(self) -> memoryview:
+        with self.__path.open("rb") as fd:
+            if os.fstat(fd.fileno()).st_size == 0:
+                # NOTE: empty files can't be mapped.
+                return memoryview(b"")
+
+            return memoryview(mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __find_records(self, delimiter: bytes) -> t.Iterator[tuple[int, int]]:
+        if not delimiter:
+            msg = "record delimiter must not be empty"
+            raise ValueError(msg)
+
+        view = self.view()
+        # NOTE: mmap can search without copying the data.
+        data = view.obj if isinstance(view.obj, mmap.mmap) else bytes(view)
+
+        start = 0
+        while start < len(view):
+            stop = data.find(delimiter, start)
+            if stop == -1:
+                yield start, len(view)
+                return
+
+            yield start, stop
+            start = stop + len(delimiter)
+
+
+class CaseResourceCollector(CaseCollector[memoryview]):
+    """Collects cases of mapped resources: the whole file or each record region of the file is a case."""
+
+    def __init__(self, marks: t.Optional[t.Sequence[t.Union[Mark, MarkDecorator]]] = None) -> None:
+        self.__entries = list[tuple[CaseResource, t.Optional[str], t.Optional[bytes]]]()
+        self.__marks = tuple(marks or ())
+
+    def add(self, resource: CaseResource, name: t.Optional[str] = None, delimiter: t.Optional[bytes] = None) -> None:
+        self.__entries.append((resource, name, delimiter))
+
+    @override
+    def collect_cases(self) -> t.Iterable[CaseInfo[memoryview]]:
+        for resource, name, delimiter in self.__entries:
+            case_name = name if name is not None else resource.path.name
+
+            if delimiter is None:
+                yield self.__build_case(case_name, resource, 0, None)
+                continue
+
+            for index, (start, stop) in enumerate(resource.records(delimiter)):
+                yield self.__build_case(f"{case_name}#{index}", resource, start, stop)
+
+    def __build_case(
+        self,
+        name: str,
+        resource: CaseResource,
+        start: int,
+        stop: t.Optional[int],
+    ) -> CaseInfo[memoryview]:
+        return CaseInfo(
+            name=name,
+            provider=CaseProvider(self.__build_provider(resource, start, stop)),
+            marks=self.__marks,
+        )
+
+    def __build_provider(
+        self,
+        resource: CaseResource,
+        start: int,
+        stop: t.Optional[int],
+    ) -> CaseProviderFunc[[], memoryview]:
+        def provide_resource() -> memoryview:
+            return resource.view(start, stop)
+
+        return provide_resource
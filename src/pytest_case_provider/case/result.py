@@ -0,0 +1,442 @@
+import functools
+import hashlib
+import inspect
+import pickle
+import sys
+import types
+import typing as t
+from pathlib import Path, PurePath
+
+import pytest
+from _pytest.cacheprovider import Cache
+from _pytest.config import Config
+from _pytest.nodes import Item
+from _pytest.python import Metafunc
+from _pytest.reports import TestReport
+from _pytest.terminal import TerminalReporter
+
+from pytest_case_provider.case.info import CaseInfo, find_item_case_info, get_item_definition_id, get_report_case
+
+T = t.TypeVar("T")
+
+CaseResultCacheMode = t.Literal["skip", "verify"]
+
+_SIMPLE_TYPES: t.Final[tuple[type, ...]] = (type(None), bool, int, float, complex, str, bytes, PurePath)
+_PICKLE_PROTOCOL: t.Final[int] = 4
+_RESULT_CACHE_WORKER_OUTPUT_KEY: t.Final[str] = "case_result_cache"
+
+
+class CaseFingerprinter:
+    """
+    Builds fingerprints of the code & data a case run depends on.
+
+    The fingerprint covers code of the test function, the case provider & the fixtures they request, the case name and
+    module level dependencies of the code: project functions & classes (with all their attributes & bases) are followed
+    recursively, project modules are hashed by their source files, other values (constants, containers, objects, data
+    captured by closures) by their contents. Code of installed packages is identified by name only. Cases that depend
+    on values that can't be hashed (neither by their attributes nor by pickle) are uncacheable.
+    """
+
+    def __init__(self, rootpath: Path) -> None:
+        self.__rootpath = rootpath
+        self.__digests = dict[object, bytes]()
+        self.__uncacheable = set[object]()
+        # NOTE: values are kept along with their digests, so ids of the values are not reused during the session.
+        self.__values = dict[int, tuple[object, t.Optional[bytes]]]()
+        self.__visiting = set[int]()
+        self.__files = dict[str, bytes]()
+
+    def fingerprint(self, metafunc: Metafunc, case: CaseInfo[T]) -> t.Optional[str]:
+        """Build the fingerprint of the case run, returns `None` if the case is uncacheable."""
+        digest = hashlib.sha256()
+        digest.update(case.name.encode())
+
+        try:
+            digest.update(self.__digest_value(inspect.unwrap(metafunc.function)))
+            digest.update(self.__digest_value(case.provider.func))
+
+            # NOTE: `self` of case provider methods is not a fixture.
+            params = list(case.provider.signature.parameters)[int(metafunc.cls is not None) :]
+            for func in self.__find_fixture_funcs(metafunc, [*metafunc.fixturenames, *params]):
+                digest.update(self.__digest_value(func))
+
+        except _UncacheableValueError:
+            return None
+
+        return digest.hexdigest()
+
+    def __find_fixture_funcs(self, metafunc: Metafunc, names: t.Sequence[str]) -> t.Sequence[object]:
+        fixture_manager = metafunc.definition.session._fixturemanager  # noqa: SLF001
+        queue = list(names)
+        seen = set[str]()
+        funcs = list[object]()
+
+        while queue:
+            name = queue.pop()
+            if name in seen:
+                continue
+
+            seen.add(name)
+            for fixture_def in fixture_manager.getfixturedefs(name, metafunc.definition) or ():
+                funcs.append(fixture_def.func)
+                queue.extend(fixture_def.argnames)
+
+        return funcs
+
+    def __digest_value(self, value: object) -> bytes:
+        if isinstance(value, _SIMPLE_TYPES):
+            return f"{type(value).__name__}:{value!r}".encode()
+
+        if isinstance(value, functools.partial):
+            return b"partial:" + self.__digest_value(value.func) + self.__digest_value((*value.args, *value.keywords))
+
+        if isinstance(value, types.MethodType):
+            return self.__digest_value(value.__func__) + self.__digest_value(value.__self__)
+
+        if not isinstance(value, (types.FunctionType, type, types.ModuleType)):
+            return self.__digest_data(value)
+
+        if value in self.__uncacheable:
+            raise _UncacheableValueError(value)
+
+        digest = self.__digests.get(value)
+        if digest is None:
+            # NOTE: recursive references are identified by name.
+            self.__digests[value] = self.__get_name(value).encode()
+            try:
+                digest = self.__digests[value] = self.__digest_object(value)
+
+            except _UncacheableValueError:
+                del self.__digests[value]
+                self.__uncacheable.add(value)
+                raise
+
+        return digest
+
+    def __digest_data(self, value: object) -> bytes:
+        key = id(value)
+        if key in self.__visiting:
+            return b"cycle"
+
+        known = self.__values.get(key)
+        if known is not None and known[0] is value:
+            if known[1] is None:
+                raise _UncacheableValueError(value)
+
+            return known[1]
+
+        self.__visiting.add(key)
+        try:
+            digest = self.__digest_contents(value)
+
+        except _UncacheableValueError:
+            self.__values[key] = (value, None)
+            raise
+
+        finally:
+            self.__visiting.discard(key)
+
+        self.__values[key] = (value, digest)
+        return digest
+
+    def __digest_contents(self, value: object) -> bytes:
+        digest = hashlib.sha256(f"{type(value).__module__}.{type(value).__qualname__}:".encode())
+
+        if isinstance(value, memoryview):
+            digest.update(f"{value.format}:{value.shape}:".encode())
+            digest.update(hashlib.sha256(value.tobytes()).digest())
+
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                digest.update(self.__digest_value(item))
+
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                digest.update(self.__digest_value(key))
+                digest.update(self.__digest_value(item))
+
+        elif isinstance(value, (set, frozenset)):
+            # NOTE: iteration order of sets depends on hash seed of the process.
+            for item_digest in sorted(self.__digest_value(item) for item in value):
+                digest.update(item_digest)
+
+        elif _has_plain_state(value):
+            digest.update(self.__digest_value(type(value)))
+            digest.update(self.__digest_value(vars(value)))
+
+        else:
+            try:
+                digest.update(pickle.dumps(value, protocol=_PICKLE_PROTOCOL))
+
+            except Exception as err:
+                raise _UncacheableValueError(value) from err
+
+        return digest.digest()
+
+    def __digest_object(self, value: t.Union[types.FunctionType, type, types.ModuleType]) -> bytes:
+        name = self.__get_name(value).encode()
+        path = self.__find_project_file(value)
+        if path is None and isinstance(value, types.FunctionType) and (value.__closure__ or value.__defaults__):
+            # NOTE: installed functions are identified by name, but data they capture (e.g. table columns) by contents.
+            digest = hashlib.sha256(name)
+            digest.update(self.__digest_value(value.__defaults__))
+            for cell in value.__closure__ or ():
+                digest.update(self.__digest_value(_get_cell_contents(cell)))
+
+            return digest.digest()
+
+        if path is None:
+            return name
+
+        if isinstance(value, types.ModuleType):
+            return name + self.__digest_file(path)
+
+        if isinstance(value, type):
+            return self.__digest_class(name, value)
+
+        digest = hashlib.sha256(name)
+        digest.update(self.__digest_code(value.__code__))
+        digest.update(self.__digest_value(value.__defaults__))
+        for dep in self.__find_globals(value):
+            digest.update(self.__digest_value(dep))
+
+        for cell in value.__closure__ or ():
+            digest.update(self.__digest_value(_get_cell_contents(cell)))
+
+        return digest.digest()
+
+    def __digest_class(self, name: bytes, value: type) -> bytes:
+        digest = hashlib.sha256(name)
+        # NOTE: class attributes (e.g. constants) are the class data, inherited ones are digested with the bases.
+        for base in value.__bases__:
+            digest.update(self.__digest_value(base))
+
+        for attr_name, attr in vars(value).items():
+            # NOTE: slot & `__dict__` descriptors are built by python for the class, they don't hold class data, and
+            #  the line of the class definition is not a part of its code (like line numbers of functions).
+            descriptor = isinstance(attr, (types.GetSetDescriptorType, types.MemberDescriptorType))
+            if descriptor or attr_name == "__firstlineno__":
+                continue
+
+            func = attr.__func__ if isinstance(attr, (staticmethod, classmethod)) else attr
+            digest.update(attr_name.encode())
+            if isinstance(func, property):
+                digest.update(self.__digest_value((func.fget, func.fset, func.fdel)))
+
+            else:
+                digest.update(self.__digest_value(func))
+
+        return digest.digest()
+
+    def __digest_code(self, code: types.CodeType) -> bytes:
+        digest = hashlib.sha256(code.co_code)
+        digest.update(repr((code.co_names, code.co_varnames, code.co_freevars)).encode())
+
+        for const in code.co_consts:
+            digest.update(self.__digest_code(const) if isinstance(const, types.CodeType) else repr(const).encode())
+
+        return digest.digest()
+
+    def __digest_file(self, path: str) -> bytes:
+        digest = self.__files.get(path)
+        if digest is None:
+            digest = self.__files[path] = hashlib.sha256(Path(path).read_bytes()).digest()
+
+        return digest
+
+    def __find_globals(self, func: types.FunctionType) -> t.Iterator[object]:
+        codes = [func.__code__]
+        while codes:
+            code = codes.pop()
+            codes.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+
+            for name in code.co_names:
+                if name in func.__globals__:
+                    yield func.__globals__[name]
+
+    def __find_project_file(self, value: t.Union[types.FunctionType, type, types.ModuleType]) -> t.Optional[str]:
+        path: t.Optional[str]
+        if isinstance(value, types.ModuleType):
+            path = getattr(value, "__file__", None)
+
+        elif isinstance(value, type):
+            path = getattr(sys.modules.get(value.__module__), "__file__", None)
+
+        else:
+            path = value.__code__.co_filename
+
+        if path is None or "site-packages" in Path(path).parts:
+            return None
+
+        try:
+            Path(path).resolve().relative_to(self.__rootpath)
+
+        except (OSError, ValueError):
+            return None
+
+        return path
+
+    def __get_name(self, value: t.Union[types.FunctionType, type, types.ModuleType]) -> str:
+        if isinstance(value, types.ModuleType):
+            return value.__name__
+
+        return f"{value.__module__}.{value.__qualname__}"
+
+
+class CaseResultCache:
+    """
+    Skips cases that passed last time, when the code their run depends on is unchanged (see `CaseFingerprinter`).
+
+    Cases are filtered out before parametrization. In `verify` mode each run also reruns a rotating part of cached
+    cases, so every cached case is rerun at least once per `1 / verify_ratio` runs.
+
+    Results are recorded from reports of case runs, so with pytest-xdist the controller records reports of all workers &
+    saves them once (fingerprints are computed by workers during collection & sent to the controller with reports).
+    """
+
+    KEY: t.Final[str] = "case_provider/results"
+
+    def __init__(
+        self,
+        cache: Cache,
+        fingerprinter: CaseFingerprinter,
+        mode: CaseResultCacheMode = "skip",
+        verify_ratio: float = 0.1,
+        workeroutput: t.Optional[dict[str, object]] = None,
+    ) -> None:
+        raw = cache.get(self.KEY, {})
+        self.__cache = cache
+        self.__fingerprinter = fingerprinter
+        self.__mode = mode
+        self.__period = max(1, round(1 / verify_ratio)) if verify_ratio > 0 else 0
+        self.__run = raw.get("run", 0) if isinstance(raw, dict) else 0
+        self.__passed: dict[str, dict[str, str]] = raw.get("passed", {}) if isinstance(raw, dict) else {}
+        self.__fingerprints = dict[tuple[str, str], str]()
+        self.__results = dict[tuple[str, str], tuple[bool, bool]]()
+        self.__emptied = set[str]()
+        self.__skipped = 0
+        self.__verified = 0
+        self.__uncacheable = 0
+        self.__workeroutput = workeroutput
+
+    def select(self, metafunc: Metafunc, cases: t.Sequence[CaseInfo[T]]) -> t.Sequence[CaseInfo[T]]:
+        definition_id = metafunc.definition.nodeid
+        passed = self.__passed.get(definition_id, {})
+        selected = list[CaseInfo[T]]()
+
+        for case in cases:
+            fingerprint = self.__fingerprinter.fingerprint(metafunc, case)
+            if fingerprint is None:
+                self.__uncacheable += 1
+                selected.append(case)
+                continue
+
+            self.__fingerprints[(definition_id, case.name)] = fingerprint
+
+            if passed.get(case.name) != fingerprint:
+                selected.append(case)
+
+            elif self.__is_verified(fingerprint):
+                self.__verified += 1
+                selected.append(case)
+
+            else:
+                self.__skipped += 1
+
+        if cases and not selected:
+            self.__emptied.add(definition_id)
+
+        return selected
+
+    def pytest_collection_modifyitems(self, config: Config, items: list[Item]) -> None:
+        # NOTE: pytest adds a skipped item for the test function without cases, it is deselected instead.
+        deselected = [
+            item
+            for item in items
+            if get_item_definition_id(item) in self.__emptied and find_item_case_info(item) is None
+        ]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item not in deselected]
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        key = get_report_case(report)
+        if key is None:
+            return
+
+        # NOTE: pytest-xdist worker sends the report to the controller after this hook, the fingerprint goes with it.
+        fingerprint = self.__fingerprints.get(key, getattr(report, "case_fingerprint", None))
+        if fingerprint is None:
+            return
+
+        report.case_fingerprint = fingerprint  # type: ignore[attr-defined]
+        if self.__workeroutput is not None:
+            return
+
+        # NOTE: the case passed if all its items were called & passed all phases.
+        self.__fingerprints[key] = fingerprint
+        passed, called = self.__results.get(key, (True, False))
+        self.__results[key] = (passed and report.passed, called or report.when == "call")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        # NOTE: each pytest-xdist worker collects all tests, so counts of the workers are the same.
+        workeroutput = getattr(node, "workeroutput", None) or {}
+        counts = workeroutput.get(_RESULT_CACHE_WORKER_OUTPUT_KEY)
+        if counts is not None:
+            self.__skipped, self.__verified, self.__uncacheable = counts
+
+    def pytest_sessionfinish(self) -> None:
+        if self.__workeroutput is not None:
+            self.__workeroutput[_RESULT_CACHE_WORKER_OUTPUT_KEY] = [self.__skipped, self.__verified, self.__uncacheable]
+            return
+
+        for (definition_id, case_name), (passed, called) in self.__results.items():
+            fingerprint = self.__fingerprints.get((definition_id, case_name))
+            if passed and called and fingerprint is not None:
+                self.__passed.setdefault(definition_id, {})[case_name] = fingerprint
+            else:
+                self.__passed.get(definition_id, {}).pop(case_name, None)
+
+        self.__cache.set(self.KEY, {"run": self.__run + 1, "passed": self.__passed})
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        line = f"case result cache: {self.__skipped} cases skipped as passed & unchanged since last run"
+        if self.__mode == "verify":
+            line += f", {self.__verified} cached cases verified"
+
+        if self.__uncacheable:
+            line += f", {self.__uncacheable} uncacheable cases run"
+
+        terminalreporter.write_line(line)
+
+    def __is_verified(self, fingerprint: str) -> bool:
+        if self.__mode != "verify" or self.__period == 0:
+            return False
+
+        return int(fingerprint[:8], 16) % self.__period == self.__run % self.__period
+
+
+def _get_cell_contents(cell: types.CellType) -> object:
+    try:
+        return cell.cell_contents
+
+    except ValueError:
+        # NOTE: the variable of the cell is not assigned yet.
+        return None
+
+
+class _UncacheableValueError(Exception):
+    """The value the case run depends on can't be hashed, so results of the case can't be cached."""
+
+
+def _has_plain_state(value: object) -> bool:
+    # NOTE: instances without custom pickling are hashed by their attributes, so project code they refer to is followed.
+    cls = type(value)
+    return (
+        hasattr(value, "__dict__")
+        and cls.__reduce_ex__ is object.__reduce_ex__
+        and cls.__reduce__ is object.__reduce__
+        and getattr(cls, "__getstate__", None) is getattr(object, "__getstate__", None)
+    )
@@ -0,0 +1,123 @@
+import asyncio
+import importlib
+import importlib.util
+import typing as t
+from contextlib import contextmanager
+
+import pytest
+from _pytest.config import Config
+from _pytest.fixtures import SubRequest
+
+from pytest_case_provider.case.budget import get_case_provision_budget
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.provider import CaseProvider
+
+T = t.TypeVar("T")
+
+EventLoopFactory = t.Callable[[], asyncio.AbstractEventLoop]
+
+
+class CaseAsyncRunner:
+    """
+    Runs async case providers of sync test functions on plugin's own event loop.
+
+    The loop is created on first use with the loop factory & reused by all items until the runner is closed (session
+    scope), so there is no per item loop setup overhead and no dependency on async pytest plugins.
+    """
+
+    def __init__(self, loop_factory: EventLoopFactory = asyncio.new_event_loop) -> None:
+        self.__loop_factory = loop_factory
+        self.__loop: t.Optional[asyncio.AbstractEventLoop] = None
+
+    def run(self, coro: t.Coroutine[None, None, T]) -> T:
+        return self.__get_loop().run_until_complete(coro)
+
+    @contextmanager
+    def provide(self, case: CaseInfo[T], request: SubRequest) -> t.Iterator[T]:
+        resolve_provider_fixtures(case.provider, request)
+
+        with self.enter(get_case_provision_budget(request.config).provide_async(case, request)) as value:
+            yield value
+
+    @contextmanager
+    def enter(self, context: t.AsyncContextManager[T]) -> t.Iterator[T]:
+        """Enter async context manager on the runner's loop."""
+        value = self.run(context.__aenter__())
+
+        try:
+            yield value
+
+        except BaseException as err:
+            if not self.run(context.__aexit__(type(err), err, err.__traceback__)):
+                raise
+
+        else:
+            self.run(context.__aexit__(None, None, None))
+
+    def close(self) -> None:
+        loop, self.__loop = self.__loop, None
+        if loop is None or loop.is_closed():
+            return
+
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+
+        finally:
+            loop.close()
+
+    def __get_loop(self) -> asyncio.AbstractEventLoop:
+        if self.__loop is None or self.__loop.is_closed():
+            self.__loop = self.__loop_factory()
+
+        return self.__loop
+
+
+def resolve_provider_fixtures(provider: CaseProvider[object], request: SubRequest) -> None:
+    """
+    Resolve fixtures of the provider before the runner's loop starts.
+
+    Async fixtures may be managed by other plugins with their own loops, which can't run while runner's loop is running.
+    """
+    params = list(provider.signature.parameters.values())[int(request.instance is not None) :]
+    for param in params:
+        request.getfixturevalue(param.name)
+
+
+def load_event_loop_factory(spec: str) -> EventLoopFactory:
+    """
+    Load event loop factory by spec.
+
+    :param spec: `asyncio`, `uvloop`, `auto` (`uvloop` if it's installed, `asyncio` otherwise) or `module:attribute`
+        path to a callable without arguments that returns a new event loop.
+    """
+    if spec == "auto":
+        spec = "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+
+    if spec == "asyncio":
+        return asyncio.new_event_loop
+
+    if spec == "uvloop":
+        spec = "uvloop:new_event_loop"
+
+    module_name, sep, attr = spec.partition(":")
+    if not sep or not module_name or not attr:
+        msg = f"invalid event loop factory: {spec!r}, expected asyncio, uvloop, auto or 'module:attribute' path"
+        raise pytest.UsageError(msg)
+
+    factory = importlib.import_module(module_name)
+    for name in attr.split("."):
+        factory = getattr(factory, name)
+
+    if not callable(factory):
+        msg = f"event loop factory is not callable: {spec!r}"
+        raise pytest.UsageError(msg)
+
+    return t.cast("EventLoopFactory", factory)
+
+
+CASE_ASYNC_RUNNER_KEY = pytest.StashKey[t.Optional[CaseAsyncRunner]]()
+
+
+def get_case_async_runner(config: Config) -> t.Optional[CaseAsyncRunner]:
+    """Get the plugin's async runner, returns `None` when async providers should be run by async pytest plugins."""
+    return config.stash.get(CASE_ASYNC_RUNNER_KEY, None)
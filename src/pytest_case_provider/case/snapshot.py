@@ -0,0 +1,164 @@
+import pickle
+import typing as t
+from contextlib import asynccontextmanager, contextmanager
+from decimal import Decimal
+from fractions import Fraction
+
+from _pytest.fixtures import SubRequest, get_scope_node
+from _pytest.scope import Scope
+from typing_extensions import override
+
+from pytest_case_provider.case.provider import CaseProvider, CaseProviderFunc
+
+V_co = t.TypeVar("V_co", covariant=True)
+T = t.TypeVar("T")
+
+CaseIsolation = t.Literal["snapshot"]
+
+_IMMUTABLE_TYPES: t.Final[tuple[type[object], ...]] = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    range,
+    Decimal,
+    Fraction,
+)
+
+
+class CaseSnapshot(t.Generic[V_co]):
+    """
+    Pickled case value (protocol 5), each restore returns a new copy of the value.
+
+    Large buffers are pickled out of band & kept once as read only buffers. Each restore gets writable copies of them
+    (a plain memory copy, no pickling), so types that use foreign buffers (e.g. numpy arrays) are writable as the
+    original value & tests can't corrupt the snapshot.
+    """
+
+    def __init__(self, value: V_co) -> None:
+        buffers = list[pickle.PickleBuffer]()
+        self.__data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        self.__buffers = [buffer.raw().toreadonly() for buffer in buffers]
+
+    def restore(self) -> V_co:
+        buffers = [bytearray(buffer) for buffer in self.__buffers]
+        return t.cast("V_co", pickle.loads(self.__data, buffers=buffers))  # noqa: S301
+
+
+class SnapshotCaseProvider(CaseProvider[V_co]):
+    """
+    Builds the case value once per fixture values it depends on & provides a restored snapshot of it to each test.
+
+    Snapshots are kept by params of parametrized fixtures & by scope nodes of broad scoped fixtures the provider
+    requests (directly or through other fixtures). Values of providers that request other function scoped fixtures (or
+    `request`) differ between tests, so they are built for each test. Provider's teardown (e.g. generator code after
+    `yield`) runs right after the snapshot is taken. Immutable values (numbers, strings, bytes & tuples / frozensets of
+    them) are provided as is.
+    """
+
+    def __init__(self, func: CaseProviderFunc[t.Any, V_co]) -> None:
+        super().__init__(func)
+        self.__snapshots = dict[t.Hashable, t.Callable[[], V_co]]()
+
+    @override
+    @contextmanager
+    def provide_sync(self, request: SubRequest) -> t.Iterator[V_co]:
+        key = self.__get_key(request)
+        if key is None:
+            with super().provide_sync(request) as value:
+                yield value
+
+            return
+
+        if key not in self.__snapshots:
+            with super().provide_sync(request) as value:
+                self.__snapshots[key] = _take_snapshot(value)
+
+        yield self.__snapshots[key]()
+
+    @override
+    @asynccontextmanager
+    async def provide_async(self, request: SubRequest) -> t.AsyncIterator[V_co]:
+        key = self.__get_key(request)
+        if key is None:
+            async with super().provide_async(request) as value:
+                yield value
+
+            return
+
+        if key not in self.__snapshots:
+            async with super().provide_async(request) as value:
+                self.__snapshots[key] = _take_snapshot(value)
+
+        yield self.__snapshots[key]()
+
+    def __get_key(self, request: SubRequest) -> t.Optional[t.Hashable]:
+        # NOTE: `self` of case provider methods is not a fixture.
+        params = list(self.signature.parameters)[int(request.instance is not None) :]
+        return _find_snapshot_key(request, params)
+
+
+def is_immutable(value: object) -> bool:
+    """Check if value is verifiably immutable, i.e. it's a builtin immutable value or a tuple / frozenset of them."""
+    if isinstance(value, (tuple, frozenset)) and type(value) in {tuple, frozenset}:
+        return all(is_immutable(item) for item in value)
+
+    return type(value) in _IMMUTABLE_TYPES
+
+
+def _find_snapshot_key(request: SubRequest, names: t.Sequence[str]) -> t.Optional[t.Hashable]:
+    fixture_manager = request.session._fixturemanager  # noqa: SLF001
+    callspec = getattr(request.node, "callspec", None)
+    indices: t.Mapping[str, int] = callspec.indices if callspec is not None else {}
+    queue = list(names)
+    seen = set[str]()
+    key = set[tuple[str, object]]()
+
+    while queue:
+        name = queue.pop()
+        if name in seen:
+            continue
+
+        seen.add(name)
+        fixture_defs = fixture_manager.getfixturedefs(name, request.node)
+        parametrized = name in indices
+        if parametrized:
+            # NOTE: parametrized fixtures & direct parameters of the test are keyed by the param.
+            key.add((name, indices[name]))
+
+        elif not fixture_defs:
+            # NOTE: `request` differs between tests.
+            return None
+
+        for fixture_def in fixture_defs[-1:] if fixture_defs else ():
+            scope = Scope(fixture_def.scope)
+            if scope is not Scope.Function:
+                key.add((name, _get_scope_node_id(request, scope)))
+
+            elif not parametrized:
+                return None
+
+            # NOTE: parametrized fixtures get the param with `request`.
+            queue.extend(arg for arg in fixture_def.argnames if not parametrized or arg != "request")
+
+    return frozenset(key)
+
+
+def _get_scope_node_id(request: SubRequest, scope: Scope) -> str:
+    node = get_scope_node(request.node, scope)
+    while node is None and scope is not Scope.Session:
+        # NOTE: e.g. class scope of a module level test function.
+        scope = scope.next_higher()
+        node = get_scope_node(request.node, scope)
+
+    return node.nodeid if node is not None else ""
+
+
+def _take_snapshot(value: T) -> t.Callable[[], T]:
+    if is_immutable(value):
+        return lambda: value
+
+    return CaseSnapshot(value).restore
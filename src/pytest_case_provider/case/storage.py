@@ -1,16 +1,27 @@
 import typing as t
 from itertools import chain
+from pathlib import Path
 
 from _pytest.mark import MarkDecorator
 from _pytest.mark.structures import Mark, get_unpacked_marks
 from typing_extensions import ParamSpec, Self, override
 
 from pytest_case_provider.abc import CaseCollector
+from pytest_case_provider.case.derive import DerivedCaseCollector, DeriveFunc
+from pytest_case_provider.case.directory import DirectoryCaseCollector
 from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.lazy import LazyCaseProvider
 from pytest_case_provider.case.provider import CaseProvider, CaseProviderFunc
+from pytest_case_provider.case.snapshot import CaseIsolation, SnapshotCaseProvider
 
 U = ParamSpec("U")
 V_co = t.TypeVar("V_co", covariant=True)
+R = t.TypeVar("R")
+T = t.TypeVar("T")
+
+_ISOLATED_PROVIDER_TYPES: t.Final[t.Mapping[str, type[CaseProvider[t.Any]]]] = {
+    "snapshot": SnapshotCaseProvider,
+}
 
 
 class CaseStorage(CaseCollector[V_co]):
@@ -21,28 +32,48 @@ class CaseStorage(CaseCollector[V_co]):
     def collect_cases(self) -> t.Iterable[CaseInfo[V_co]]:
         return iter(self.__cases)
 
+    @classmethod
+    def from_directory(
+        cls,
+        path: t.Union[str, Path],
+        pattern: str,
+        loader: t.Callable[[Path], T],
+        marks: t.Optional[t.Sequence[t.Union[Mark, MarkDecorator]]] = None,
+    ) -> DirectoryCaseCollector[T]:
+        """Create collector of a case for each data file in the directory tree, see `DirectoryCaseCollector`."""
+        return DirectoryCaseCollector(path, pattern, loader, marks)
+
     def case(
         self,
         name: t.Optional[str] = None,
         marks: t.Optional[t.Sequence[MarkDecorator]] = None,
+        timeout: t.Optional[float] = None,
+        isolation: t.Optional[CaseIsolation] = None,
+        *,
+        lazy: bool = False,
     ) -> t.Callable[[CaseProviderFunc[U, V_co]], CaseProviderFunc[U, V_co]]:
         def inner(provider: CaseProviderFunc[U, V_co]) -> CaseProviderFunc[U, V_co]:
-            self.append(provider, name=name, marks=marks)
+            self.append(provider, name=name, marks=marks, timeout=timeout, isolation=isolation, lazy=lazy)
             return provider
 
         return inner
 
-    def append(
+    def append(  # noqa: PLR0913
         self,
         provider: CaseProviderFunc[U, V_co],
         name: t.Optional[str] = None,
         marks: t.Optional[t.Sequence[t.Union[Mark, MarkDecorator]]] = None,
+        timeout: t.Optional[float] = None,
+        isolation: t.Optional[CaseIsolation] = None,
+        *,
+        lazy: bool = False,
     ) -> Self:
         self.__cases.append(
             CaseInfo(
                 name=name or provider.__name__,
-                provider=CaseProvider(provider),
+                provider=build_case_provider(provider, isolation, lazy=lazy),
                 marks=marks if marks is not None else get_unpacked_marks(provider),
+                timeout=timeout,
             )
         )
         return self
@@ -56,6 +87,20 @@ class CaseStorage(CaseCollector[V_co]):
 
         return self
 
+    @t.overload
+    def derive(
+        self,
+        func: t.Callable[[V_co], t.Awaitable[R]],
+        name: t.Optional[str] = None,
+    ) -> DerivedCaseCollector[R]: ...
+
+    @t.overload
+    def derive(self, func: t.Callable[[V_co], R], name: t.Optional[str] = None) -> DerivedCaseCollector[R]: ...
+
+    def derive(self, func: DeriveFunc[V_co, R], name: t.Optional[str] = None) -> DerivedCaseCollector[R]:
+        """Create collector of cases derived from cases of this storage, see `DerivedCaseCollector`."""
+        return DerivedCaseCollector(self, func, name)
+
 
 class CompositeCaseStorage(CaseCollector[V_co]):
     def __init__(self, *substores: CaseCollector[V_co]) -> None:
@@ -63,6 +108,11 @@ class CompositeCaseStorage(CaseCollector[V_co]):
         self.__inner = CaseStorage[V_co]()
         self.__substores.append(self.__inner)
 
+    @property
+    def includes(self) -> t.Sequence[CaseCollector[V_co]]:
+        """Included collectors (without own cases of this storage)."""
+        return [store for store in self.__substores if store is not self.__inner]
+
     @override
     def collect_cases(self) -> t.Iterable[CaseInfo[V_co]]:
         return chain.from_iterable(store.collect_cases() for store in self.__substores)
@@ -71,16 +121,24 @@ class CompositeCaseStorage(CaseCollector[V_co]):
         self,
         name: t.Optional[str] = None,
         marks: t.Optional[t.Sequence[MarkDecorator]] = None,
+        timeout: t.Optional[float] = None,
+        isolation: t.Optional[CaseIsolation] = None,
+        *,
+        lazy: bool = False,
     ) -> t.Callable[[CaseProviderFunc[U, V_co]], CaseProviderFunc[U, V_co]]:
-        return self.__inner.case(name=name, marks=marks)
+        return self.__inner.case(name=name, marks=marks, timeout=timeout, isolation=isolation, lazy=lazy)
 
-    def append(
+    def append(  # noqa: PLR0913
         self,
         provider: CaseProviderFunc[U, V_co],
         name: t.Optional[str] = None,
         marks: t.Optional[t.Sequence[MarkDecorator]] = None,
+        timeout: t.Optional[float] = None,
+        isolation: t.Optional[CaseIsolation] = None,
+        *,
+        lazy: bool = False,
     ) -> Self:
-        self.__inner.append(provider, name=name, marks=marks)
+        self.__inner.append(provider, name=name, marks=marks, timeout=timeout, isolation=isolation, lazy=lazy)
         return self
 
     def extend(self, *stores: t.Union[t.Sequence[CaseInfo[V_co]], CaseCollector[V_co]]) -> Self:
@@ -90,3 +148,39 @@ class CompositeCaseStorage(CaseCollector[V_co]):
     def include(self, *others: CaseCollector[V_co]) -> Self:
         self.__substores.extend(others)
         return self
+
+    @t.overload
+    def derive(
+        self,
+        func: t.Callable[[V_co], t.Awaitable[R]],
+        name: t.Optional[str] = None,
+    ) -> DerivedCaseCollector[R]: ...
+
+    @t.overload
+    def derive(self, func: t.Callable[[V_co], R], name: t.Optional[str] = None) -> DerivedCaseCollector[R]: ...
+
+    def derive(self, func: DeriveFunc[V_co, R], name: t.Optional[str] = None) -> DerivedCaseCollector[R]:
+        """Create collector of cases derived from cases of this storage, see `DerivedCaseCollector`."""
+        return DerivedCaseCollector(self, func, name)
+
+
+def build_case_provider(
+    func: CaseProviderFunc[t.Any, V_co],
+    isolation: t.Optional[CaseIsolation] = None,
+    *,
+    lazy: bool = False,
+) -> CaseProvider[V_co]:
+    provider: CaseProvider[V_co]
+
+    if isolation is None:
+        provider = CaseProvider(func)
+
+    else:
+        provider_type = _ISOLATED_PROVIDER_TYPES.get(isolation)
+        if provider_type is None:
+            msg = f"unknown case isolation: {isolation!r}"
+            raise ValueError(msg)
+
+        provider = provider_type(func)
+
+    return LazyCaseProvider(provider) if lazy else provider
@@ -0,0 +1,180 @@
+import typing as t
+
+from _pytest.mark import Mark, MarkDecorator
+from typing_extensions import override
+
+from pytest_case_provider.abc import CaseCollector
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.provider import CaseProvider, CaseProviderFunc
+
+
+class CaseTableColumn(t.Protocol):
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int, /) -> object: ...
+
+
+class CaseTableRow:
+    """A lightweight view of the table row, values are read from table columns on access (no data is copied)."""
+
+    __slots__ = ("__index", "__table")
+
+    def __init__(self, table: "CaseTable", index: int) -> None:
+        self.__table = table
+        self.__index = index
+
+    @override
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={self[name]!r}" for name in self.__table.column_names)
+        return f"{self.__class__.__name__}({self.__index}: {values})"
+
+    # NOTE: column values are typed as `Any`, so tests can use them without casts.
+    def __getattr__(self, name: str) -> t.Any:
+        # NOTE: private & special attributes are not columns (e.g. slots may not be set yet during unpickling).
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        try:
+            return self.__table.get_value(name, self.__index)
+
+        except KeyError:
+            msg = f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg) from None
+
+    def __getitem__(self, key: t.Union[str, int]) -> t.Any:
+        name = self.__table.column_names[key] if isinstance(key, int) else key
+        return self.__table.get_value(name, self.__index)
+
+    def __len__(self) -> int:
+        return len(self.__table.column_names)
+
+    def __iter__(self) -> t.Iterator[object]:
+        return (self.__table.get_value(name, self.__index) for name in self.__table.column_names)
+
+    @property
+    def index(self) -> int:
+        return self.__index
+
+    def as_tuple(self) -> tuple[object, ...]:
+        return tuple(self)
+
+    def as_dict(self) -> dict[str, object]:
+        return {name: self.__table.get_value(name, self.__index) for name in self.__table.column_names}
+
+
+class CaseTable(CaseCollector[CaseTableRow]):
+    """
+    Column oriented case collector, each row of the table is a case.
+
+    Columns are kept as is and accessed by index without copying: `array.array`, `bytes`, `bytearray`, numpy arrays and
+    other buffers are wrapped with `memoryview`, other sequences (e.g. `list`) are used directly. Case names are built
+    lazily during collection, row values are read from columns only when test accesses them.
+
+    Usage:
+
+    >>> table = CaseTable(
+    ...     {"x": array("d", [1.0, 2.0]), "expected": array("d", [2.0, 4.0])},
+    ...     name="x={x}",
+    ... )
+    ...
+    >>> @inject_cases_func().include(table)
+    ... def test_double(row: CaseTableRow) -> None:
+    ...     assert row.x * 2 == row.expected
+    """
+
+    def __init__(
+        self,
+        columns: t.Mapping[str, CaseTableColumn],
+        name: t.Union[str, t.Callable[[CaseTableRow], str], None] = None,
+        marks: t.Optional[t.Sequence[t.Union[Mark, MarkDecorator]]] = None,
+    ) -> None:
+        self.__columns = {key: self.__wrap_column(column) for key, column in columns.items()}
+        self.__column_names = list(self.__columns)
+        self.__name = name
+        self.__marks = tuple(marks or ())
+
+        sizes = {len(column) for column in self.__columns.values()}
+        if len(sizes) > 1:
+            msg = f"all table columns must have the same length, got: {sorted(sizes)}"
+            raise ValueError(msg)
+
+        self.__size = sizes.pop() if sizes else 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    @property
+    def column_names(self) -> t.Sequence[str]:
+        return self.__column_names
+
+    def column(self, name: str) -> CaseTableColumn:
+        return self.__columns[name]
+
+    def get_value(self, name: str, index: int) -> object:
+        return self.__columns[name][index]
+
+    def row(self, index: int) -> CaseTableRow:
+        if not 0 <= index < self.__size:
+            msg = f"row index out of range: {index}"
+            raise IndexError(msg)
+
+        return CaseTableRow(self, index)
+
+    @override
+    def collect_cases(self) -> t.Iterable[CaseInfo[CaseTableRow]]:
+        for index in range(self.__size):
+            yield CaseInfo(
+                name=self.__build_name(index),
+                provider=CaseProvider(self.__build_provider(index)),
+                marks=self.__marks,
+            )
+
+    def __build_provider(self, index: int) -> CaseProviderFunc[[], CaseTableRow]:
+        def provide_row() -> CaseTableRow:
+            return CaseTableRow(self, index)
+
+        return provide_row
+
+    def __build_name(self, index: int) -> str:
+        if self.__name is None:
+            return f"row{index}"
+
+        row = CaseTableRow(self, index)
+        if isinstance(self.__name, str):
+            return self.__name.format_map(_RowNameValues(row))
+
+        return self.__name(row)
+
+    def __wrap_column(self, column: CaseTableColumn) -> CaseTableColumn:
+        try:
+            view = memoryview(column)  # type: ignore[arg-type]
+
+        except TypeError:
+            # NOTE: not a buffer (e.g. `list`), use as is.
+            return column
+
+        if view.ndim != 1:
+            msg = f"table column must be one dimensional, got: {view.ndim}"
+            raise ValueError(msg)
+
+        return view
+
+
+class _RowNameValues(t.Mapping[str, object]):
+    def __init__(self, row: CaseTableRow) -> None:
+        self.__row = row
+
+    @override
+    def __getitem__(self, key: str) -> object:
+        if key == "index":
+            return self.__row.index
+
+        return self.__row[key]
+
+    @override
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self.__row.as_dict())
+
+    @override
+    def __len__(self) -> int:
+        return len(self.__row)
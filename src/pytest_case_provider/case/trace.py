@@ -0,0 +1,148 @@
+import json
+import time
+import typing as t
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config
+from _pytest.nodes import Item
+from _pytest.python import FunctionDefinition
+from _pytest.terminal import TerminalReporter
+
+from pytest_case_provider.case.info import CaseInfo
+
+_TRACE_WORKER_OUTPUT_KEY: t.Final[str] = "case_trace"
+_COLLECTION_TID: t.Final[int] = 1
+_TEST_CALL_TID: t.Final[int] = 2
+_SYNC_PROVIDER_TID: t.Final[int] = 3
+_ASYNC_PROVIDER_FIRST_TID: t.Final[int] = 10
+_THREAD_NAMES: t.Final[t.Mapping[int, str]] = {
+    _COLLECTION_TID: "case collection",
+    _TEST_CALL_TID: "test calls",
+    _SYNC_PROVIDER_TID: "sync case providers",
+}
+
+TraceEvent = dict[str, object]
+
+
+class CaseTraceRecorder:
+    """
+    Records timeline of case collection, case provision & test calls in Chrome Trace Event Format.
+
+    The trace can be loaded by chrome://tracing or Perfetto. Each pytest-xdist worker gets its own track (process),
+    workers pass their events to the controller which writes the trace file. Overlapping async provider spans are
+    placed on separate lanes.
+    """
+
+    def __init__(self, config: Config, path: Path) -> None:
+        self.__path = path
+        self.__events = list[TraceEvent]()
+        self.__async_lane_ends = list[float]()
+
+        workerinput = getattr(config, "workerinput", None)
+        self.__worker_id: t.Optional[str] = workerinput["workerid"] if workerinput is not None else None
+        self.__workeroutput: t.Optional[dict[str, object]] = getattr(config, "workeroutput", None)
+        self.__pid = _get_worker_pid(self.__worker_id)
+
+    @property
+    def events(self) -> t.Sequence[TraceEvent]:
+        return self.__events
+
+    def pytest_case_collect(
+        self,
+        definition: FunctionDefinition,
+        cases: t.Sequence[CaseInfo[object]],
+        duration: float,
+    ) -> None:
+        end = time.perf_counter()
+        self.__add_span(definition.nodeid, "collection", _COLLECTION_TID, end - duration, end, cases=len(cases))
+
+    def pytest_case_provide_finish(self, item: Item, case_info: CaseInfo[object], duration: float) -> None:
+        self.__add_provider_span(f"provide {case_info.name}", item, case_info, duration)
+
+    def pytest_case_teardown(self, item: Item, case_info: CaseInfo[object], duration: float) -> None:
+        self.__add_provider_span(f"teardown {case_info.name}", item, case_info, duration)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: Item) -> t.Generator[None, None, None]:
+        start = time.perf_counter()
+        try:
+            return (yield)
+
+        finally:
+            self.__add_span(item.nodeid, "test", _TEST_CALL_TID, start, time.perf_counter())
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        # NOTE: pytest-xdist controller receives events of the worker when it's finished.
+        workeroutput = getattr(node, "workeroutput", None) or {}
+        self.__events.extend(workeroutput.get(_TRACE_WORKER_OUTPUT_KEY, ()))
+
+    def pytest_sessionfinish(self) -> None:
+        events = [*self.__build_metadata(), *self.__events]
+        if self.__workeroutput is not None:
+            self.__workeroutput[_TRACE_WORKER_OUTPUT_KEY] = events
+            return
+
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        with self.__path.open("w") as fd:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fd)
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        terminalreporter.write_line(f"case trace: {self.__path}")
+
+    def __add_provider_span(self, name: str, item: Item, case: CaseInfo[object], duration: float) -> None:
+        end = time.perf_counter()
+        start = end - duration
+
+        if case.provider.is_async:
+            self.__add_span(name, "async provider", self.__get_async_lane(start, end), start, end, item=item.nodeid)
+        else:
+            self.__add_span(name, "sync provider", _SYNC_PROVIDER_TID, start, end, item=item.nodeid)
+
+    def __add_span(self, name: str, category: str, tid: int, start: float, end: float, **args: object) -> None:
+        self.__events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": self.__pid,
+                "tid": tid,
+                "args": args,
+            }
+        )
+
+    def __get_async_lane(self, start: float, end: float) -> int:
+        # NOTE: place the span on the first lane that is free since span start, so overlapping spans don't stack.
+        for i, lane_end in enumerate(self.__async_lane_ends):
+            if lane_end <= start:
+                self.__async_lane_ends[i] = end
+                return _ASYNC_PROVIDER_FIRST_TID + i
+
+        self.__async_lane_ends.append(end)
+        return _ASYNC_PROVIDER_FIRST_TID + len(self.__async_lane_ends) - 1
+
+    def __build_metadata(self) -> t.Iterable[TraceEvent]:
+        yield self.__build_metadata_event("process_name", 0, self.__worker_id or "main")
+
+        for tid, name in _THREAD_NAMES.items():
+            yield self.__build_metadata_event("thread_name", tid, name)
+
+        for i in range(len(self.__async_lane_ends)):
+            yield self.__build_metadata_event(
+                "thread_name", _ASYNC_PROVIDER_FIRST_TID + i, f"async case providers #{i}"
+            )
+
+    def __build_metadata_event(self, name: str, tid: int, value: str) -> TraceEvent:
+        return {"name": name, "ph": "M", "pid": self.__pid, "tid": tid, "args": {"name": value}}
+
+
+def _get_worker_pid(worker_id: t.Optional[str]) -> int:
+    # NOTE: pytest-xdist worker ids look like `gw0`, `gw1`, ...; the main process gets track 0.
+    if worker_id is None:
+        return 0
+
+    digits = "".join(char for char in worker_id if char.isdigit())
+    return int(digits) + 1 if digits else abs(hash(worker_id)) % 10_000 + 1
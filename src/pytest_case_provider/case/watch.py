@@ -0,0 +1,396 @@
+import ast
+import inspect
+import sys
+import time
+import types
+import typing as t
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+from _pytest.assertion.rewrite import rewrite_asserts
+from _pytest.config import Config
+from _pytest.main import Session
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+from _pytest.terminal import TerminalReporter
+
+from pytest_case_provider.case.batch import CaseBatch
+from pytest_case_provider.case.info import CaseInfo
+
+T = t.TypeVar("T")
+
+# NOTE: code flag of function bodies, class bodies don't have it.
+_CO_NEWLOCALS: t.Final[int] = inspect.CO_NEWLOCALS
+_MODULE_CODE: t.Final[str] = "<module>"
+
+
+@dataclass(frozen=True)
+class CaseSourceChanges:
+    """
+    Changes of functions of the source file (by qualified names).
+
+    :param patched: functions whose body changed only, their code can be replaced in place.
+    :param restart: functions that were added, removed or whose signature / decorators changed.
+    :param module: module level code besides functions (e.g. constants) changed, all items of the file are affected.
+    """
+
+    patched: t.Sequence[str] = field(default_factory=tuple)
+    restart: t.Sequence[str] = field(default_factory=tuple)
+    module: bool = False
+
+
+class CaseWatchIndex(t.Generic[T]):
+    """Maps functions (by source file & qualified name) to the items that run them & reloads changed functions."""
+
+    def __init__(self) -> None:
+        self.__functions = dict[tuple[Path, str], list[types.FunctionType]]()
+        self.__owners = dict[tuple[Path, str], list[T]]()
+        self.__rewrite = set[Path]()
+
+    @property
+    def paths(self) -> t.Collection[Path]:
+        return {path for path, _ in self.__functions}
+
+    def add(self, func: object, owner: T, *, rewritten: bool = False) -> None:
+        func = inspect.unwrap(t.cast("t.Callable[..., object]", func))
+        if not isinstance(func, types.FunctionType):
+            return
+
+        key = (Path(func.__code__.co_filename).resolve(), func.__qualname__)
+        functions = self.__functions.setdefault(key, [])
+        if func not in functions:
+            functions.append(func)
+
+        owners = self.__owners.setdefault(key, [])
+        if owner not in owners:
+            owners.append(owner)
+
+        if rewritten:
+            self.__rewrite.add(key[0])
+
+    def reload(self, path: Path, old_source: str, new_source: str) -> tuple[CaseSourceChanges, t.Sequence[T]]:
+        """
+        Replace code of the changed functions of the file, returns changes & owners of the patched functions.
+
+        Changed module level assignments are run again in the module namespace & all owners of the file are returned
+        then, other module level changes (e.g. imports or class attributes) require a restart.
+        """
+        changes = find_changed_functions(old_source, new_source)
+        if not changes.patched and not changes.module:
+            return changes, []
+
+        codes = _find_function_codes(self.__compile(path, new_source))
+        owners = list[T]()
+        restart = list(changes.restart)
+        patched = list[str]()
+
+        if changes.module:
+            if not _assign_module_globals(path, old_source, new_source):
+                restart.append(_MODULE_CODE)
+
+            for (file, _), file_owners in self.__owners.items():
+                owners.extend(owner for owner in file_owners if file == path and owner not in owners)
+
+        for qualname in changes.patched:
+            key = (path, qualname)
+            try:
+                for func in self.__functions.get(key) or _find_module_functions(path, qualname):
+                    func.__code__ = codes[qualname]
+
+            # NOTE: code with other free variables (e.g. closures) can't replace the function code.
+            except (KeyError, ValueError):
+                restart.append(qualname)
+                continue
+
+            patched.append(qualname)
+            owners.extend(owner for owner in self.__owners.get(key, []) if owner not in owners)
+
+        return CaseSourceChanges(patched, restart, module=changes.module), owners
+
+    def __compile(self, path: Path, source: str) -> types.CodeType:
+        tree = ast.parse(source, str(path))
+        if path in self.__rewrite:
+            # NOTE: pytest rewrites asserts of test modules, so patched tests report assertion details as usual.
+            rewrite_asserts(tree, source.encode(), str(path))
+
+        return compile(tree, str(path), "exec", dont_inherit=True)
+
+
+class CaseWatcher:
+    """
+    Keeps the session alive after the test run, watches source files of tests & case providers and re-runs items
+    affected by edits.
+
+    Files are polled for modifications. The code of a function whose body changed is replaced in place, so the imported
+    modules & collected items are reused, and only items whose test function or case provider changed are run again.
+    Changed module level assignments (e.g. constants) are run again & all items of the file are re-run. Added & removed
+    functions, changes of function signatures or decorators, and other module level changes require a restart.
+    """
+
+    def __init__(self, config: Config, interval: float = 0.5) -> None:
+        self.__config = config
+        self.__interval = interval
+        self.__rounds = 0
+        self.__reports: t.Optional[list[TestReport]] = None
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtestloop(self, session: Session) -> t.Generator[None, object, object]:
+        result = yield
+        if session.config.option.collectonly or not session.items:
+            return result
+
+        try:
+            self.__watch(session)
+
+        except KeyboardInterrupt:
+            self.__write_line("case watch: stopped")
+
+        return result
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        if self.__reports is not None and (report.when == "call" or not report.passed):
+            self.__reports.append(report)
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        if self.__rounds:
+            terminalreporter.write_line(f"case watch: {self.__rounds} re-runs")
+
+    def __watch(self, session: Session) -> None:
+        index = build_case_watch_index(session.items)
+        sources = {path: _read_source(path) for path in index.paths}
+        stamps = {path: _stat(path) for path in sources}
+
+        self.__write_sep(f"case watch: watching {len(sources)} files, press Ctrl+C to stop")
+
+        while True:
+            time.sleep(self.__interval)
+
+            items = list[Item]()
+            for path, stamp in stamps.items():
+                new_stamp = _stat(path)
+                if new_stamp == stamp:
+                    continue
+
+                stamps[path] = new_stamp
+                source = _read_source(path)
+                items.extend(item for item in self.__reload(index, path, sources[path], source) if item not in items)
+                sources[path] = source
+
+            if items:
+                # NOTE: items are re-run in the collection order.
+                affected = set(items)
+                self.__run(session, [item for item in session.items if item in affected])
+
+    def __reload(self, index: CaseWatchIndex[Item], path: Path, old: str, new: str) -> t.Sequence[Item]:
+        try:
+            changes, items = index.reload(path, old, new)
+
+        except SyntaxError as err:
+            self.__write_line(f"case watch: {path}:{err.lineno}: syntax error: {err.msg}")
+            return []
+
+        if changes.restart:
+            self.__write_line(f"case watch: {path}: restart to apply changes of {', '.join(changes.restart)}")
+
+        if changes.patched or changes.module:
+            changed = [*changes.patched, *([_MODULE_CODE] if changes.module else [])]
+            self.__write_line(f"case watch: {path}: {', '.join(changed)} changed, {len(items)} affected items")
+
+        return items
+
+    def __run(self, session: Session, items: t.Sequence[Item]) -> None:
+        self.__rounds += 1
+        self.__write_sep(f"case watch: re-running {len(items)} items")
+
+        # NOTE: `--maxfail` counts failures of the session, each re-run starts the count over.
+        session.testsfailed = 0
+        self.__reports = []
+        try:
+            # NOTE: items keep their fixture info & callspecs, the run protocol sets up their requests again.
+            for i, item in enumerate(items):
+                item.ihook.pytest_runtest_protocol(item=item, nextitem=items[i + 1] if i + 1 < len(items) else None)
+                if session.shouldstop or session.shouldfail:
+                    break
+
+        finally:
+            reports, self.__reports = self.__reports, None
+            session.shouldstop = session.shouldfail = False
+
+        # NOTE: the session summary is shown at exit only, so failures of each re-run are shown right after it.
+        for report in reports:
+            if report.failed:
+                self.__write_sep(report.head_line or report.nodeid, "_")
+                self.__write_line(report.longreprtext)
+
+        outcomes = Counter(report.outcome for report in reports)
+        self.__write_sep(
+            f"case watch: {', '.join(f'{count} {outcome}' for outcome, count in sorted(outcomes.items()))}, "
+            "watching for changes"
+        )
+
+    def __write_sep(self, title: str, sep: str = "-") -> None:
+        reporter = self.__config.pluginmanager.getplugin("terminalreporter")
+        if reporter is not None:
+            reporter.write_sep(sep, title)
+
+    def __write_line(self, line: str) -> None:
+        reporter = self.__config.pluginmanager.getplugin("terminalreporter")
+        if reporter is not None:
+            reporter.write_line(line)
+
+
+def build_case_watch_index(items: t.Sequence[Item]) -> CaseWatchIndex[Item]:
+    """Index test functions & case providers of the items."""
+    index = CaseWatchIndex[Item]()
+
+    for item in items:
+        func = getattr(item, "obj", None)
+        if func is None:
+            continue
+
+        module = getattr(item, "module", None)
+        index.add(func, item, rewritten=module is not None and "@pytest_ar" in vars(module))
+
+        callspec = getattr(item, "callspec", None)
+        for param in callspec.params.values() if callspec is not None else ():
+            cases = param.cases if isinstance(param, CaseBatch) else [param] if isinstance(param, CaseInfo) else []
+            for case in cases:
+                index.add(case.provider.func, item)
+
+    return index
+
+
+def find_changed_functions(old_source: str, new_source: str) -> CaseSourceChanges:
+    """Compare module level functions & methods of module level classes of two versions of the source."""
+    old_tree = ast.parse(old_source)
+    new_tree = ast.parse(new_source)
+    old = _dump_functions(old_tree)
+    new = _dump_functions(new_tree)
+
+    patched = list[str]()
+    restart = sorted(set(old) ^ set(new))
+
+    for qualname, (old_head, old_body) in old.items():
+        if qualname not in new:
+            continue
+
+        new_head, new_body = new[qualname]
+        if old_head != new_head:
+            restart.append(qualname)
+
+        elif old_body != new_body:
+            patched.append(qualname)
+
+    return CaseSourceChanges(patched, restart, module=_dump_module(old_tree) != _dump_module(new_tree))
+
+
+def _dump_functions(tree: ast.Module) -> dict[str, tuple[str, str]]:
+    dumps = dict[str, tuple[str, str]]()
+
+    def visit(body: t.Sequence[ast.stmt], prefix: str) -> None:
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                visit(node.body, f"{prefix}{node.name}.")
+
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                # NOTE: the head (signature & decorators) is evaluated at definition, the body is the function code.
+                head = [type(node).__name__, ast.dump(node.args), *(ast.dump(dec) for dec in node.decorator_list)]
+                if node.returns is not None:
+                    head.append(ast.dump(node.returns))
+
+                dumps[f"{prefix}{node.name}"] = ("|".join(head), "|".join(ast.dump(stmt) for stmt in node.body))
+
+    visit(tree.body, "")
+    return dumps
+
+
+def _dump_module(tree: ast.Module) -> t.Sequence[str]:
+    # NOTE: functions are compared by `_dump_functions`, the rest of module level & class level code is compared here.
+    return [ast.dump(node) for node in _strip_functions(tree.body)]
+
+
+def _strip_functions(body: t.Sequence[ast.stmt]) -> list[ast.stmt]:
+    return [
+        ast.ClassDef(**{**vars(node), "body": _strip_functions(node.body)}) if isinstance(node, ast.ClassDef) else node
+        for node in body
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+
+
+def _assign_module_globals(path: Path, old_source: str, new_source: str) -> bool:
+    old = set(_dump_module(ast.parse(old_source)))
+    changed = [node for node in _strip_functions(ast.parse(new_source).body) if ast.dump(node) not in old]
+    if not all(isinstance(node, (ast.Assign, ast.AnnAssign)) for node in changed):
+        return False
+
+    module = _find_module(path)
+    if module is None:
+        return False
+
+    # NOTE: functions & items keep the module namespace, so they see the new values on the next run.
+    code = compile(ast.Module(body=changed, type_ignores=[]), str(path), "exec")
+    try:
+        exec(code, vars(module))  # noqa: S102
+
+    except Exception:  # noqa: BLE001
+        return False
+
+    return True
+
+
+def _find_module(path: Path) -> t.Optional[types.ModuleType]:
+    for module in list(sys.modules.values()):
+        filename = getattr(module, "__file__", None)
+        if filename is not None and Path(filename).resolve() == path:
+            return module
+
+    return None
+
+
+def _find_module_functions(path: Path, qualname: str) -> t.Sequence[types.FunctionType]:
+    # NOTE: functions that are not indexed (e.g. helpers of case providers) are patched too, but no items are re-run.
+    obj: object = _find_module(path)
+    if obj is None:
+        return []
+
+    for name in qualname.split("."):
+        obj = getattr(obj, name, None)
+
+    func = inspect.unwrap(obj) if callable(obj) else None
+    return [func] if isinstance(func, types.FunctionType) else []
+
+
+def _find_function_codes(code: types.CodeType, prefix: str = "") -> dict[str, types.CodeType]:
+    codes = dict[str, types.CodeType]()
+
+    for const in code.co_consts:
+        if not isinstance(const, types.CodeType) or const.co_name.startswith("<"):
+            continue
+
+        if const.co_flags & _CO_NEWLOCALS:
+            codes[f"{prefix}{const.co_name}"] = const
+
+        else:
+            codes.update(_find_function_codes(const, f"{prefix}{const.co_name}."))
+
+    return codes
+
+
+def _read_source(path: Path) -> str:
+    try:
+        return path.read_text()
+
+    except OSError:
+        return ""
+
+
+def _stat(path: Path) -> tuple[int, int]:
+    try:
+        stat = path.stat()
+
+    except OSError:
+        return 0, 0
+
+    return stat.st_mtime_ns, stat.st_size
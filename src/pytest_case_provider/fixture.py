@@ -19,7 +19,15 @@ def parametrize_metafunc_with_fixture_params(
     scope: t.Optional[_ScopeName] = None,
 ) -> None:
     metafunc.parametrize(name, params, scope=scope, indirect=True)
+    register_metafunc_fixture_def(metafunc, name, fixture_func, scope)
 
+
+def register_metafunc_fixture_def(
+    metafunc: Metafunc,
+    name: str,
+    fixture_func: t.Callable[Concatenate[SubRequest, U], V_co],
+    scope: t.Optional[_ScopeName] = None,
+) -> None:
     # NOTE: repeat FixtureManager._register_fixture logic
     fixture_defs = metafunc._arg2fixturedefs[name] = list(metafunc._arg2fixturedefs.get(name, []))  # noqa: SLF001
     fixture_defs.append(
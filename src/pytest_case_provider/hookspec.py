@@ -0,0 +1,49 @@
+"""Hooks of case collection & provision, plugins and `conftest.py` files may implement them to observe the cases."""
+
+import typing as t
+
+import pytest
+
+if t.TYPE_CHECKING:
+    from _pytest.nodes import Item
+    from _pytest.python import FunctionDefinition
+
+    from pytest_case_provider.abc import CaseParametrizer
+    from pytest_case_provider.case.info import CaseInfo
+
+
+@pytest.hookspec
+def pytest_case_collect(
+    definition: "FunctionDefinition",
+    storage: "CaseParametrizer[object]",
+    cases: "t.Sequence[CaseInfo[object]]",
+    duration: float,
+) -> None:
+    """
+    Called after cases of the test function were collected from the storage (before they are reordered).
+
+    :param duration: time spent on case collection in seconds.
+    """
+
+
+@pytest.hookspec
+def pytest_case_provide_start(item: "Item", case_info: "CaseInfo[object]") -> None:
+    """Called before the case provider builds the case value for the item."""
+
+
+@pytest.hookspec
+def pytest_case_provide_finish(item: "Item", case_info: "CaseInfo[object]", duration: float) -> None:
+    """
+    Called after the case provider built the case value for the item.
+
+    :param duration: time spent on case value construction in seconds.
+    """
+
+
+@pytest.hookspec
+def pytest_case_teardown(item: "Item", case_info: "CaseInfo[object]", duration: float) -> None:
+    """
+    Called after the case provider finalized the case value of the item.
+
+    :param duration: time spent on case value finalization in seconds.
+    """
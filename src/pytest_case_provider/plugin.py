@@ -1,14 +1,371 @@
-from functools import cache
+import typing as t
+from pathlib import Path
 
+import pytest
+from _pytest.config import Config, PytestPluginManager
+from _pytest.config.argparsing import Parser
+from _pytest.nodes import Item
 from _pytest.python import Metafunc
+from _pytest.reports import TestReport
 
+from pytest_case_provider import hookspec
+from pytest_case_provider.abc import CaseReorderer
+from pytest_case_provider.case.batch import CaseBatchReporter
+from pytest_case_provider.case.benchmark import CaseBenchmark
+from pytest_case_provider.case.budget import CASE_PROVISION_BUDGET_KEY, CaseProvisionBudget
+from pytest_case_provider.case.collection import CaseCollectStatsRecorder
 from pytest_case_provider.case.generator import CaseParametrizedTestGenerator
+from pytest_case_provider.case.info import find_item_case_info, get_item_definition_id, set_report_case
+from pytest_case_provider.case.items import CaseItemGenerator
+from pytest_case_provider.case.maxfail import CaseMaxFailGuard
+from pytest_case_provider.case.memory import CaseMemoryRecorder
+from pytest_case_provider.case.order import FailedFirstCaseReorderer
+from pytest_case_provider.case.outcome import CaseOutcomeRecorder, CaseOutcomeStore
+from pytest_case_provider.case.pool import CasePoolReporter
+from pytest_case_provider.case.profile import CaseProfiler
+from pytest_case_provider.case.result import CaseFingerprinter, CaseResultCache
+from pytest_case_provider.case.runner import CASE_ASYNC_RUNNER_KEY, CaseAsyncRunner, load_event_loop_factory
+from pytest_case_provider.case.trace import CaseTraceRecorder
+from pytest_case_provider.case.watch import CaseWatcher
+
+T = t.TypeVar("T")
+
+_CASE_TEST_GENERATOR_KEY = pytest.StashKey[CaseParametrizedTestGenerator]()
+
+
+def pytest_addhooks(pluginmanager: PytestPluginManager) -> None:
+    pluginmanager.add_hookspecs(hookspec)
+
+
+def pytest_addoption(parser: Parser) -> None:
+    group = parser.getgroup("case-provider")
+    group.addoption(
+        "--case-failed-first",
+        action="store_true",
+        default=False,
+        dest="case_failed_first",
+        help="run cases that failed last time (then flaky cases) first within each case parametrized test.",
+    )
+    group.addoption(
+        "--case-timeout",
+        type=float,
+        default=None,
+        dest="case_timeout",
+        help="default timeout of case providers in seconds (overrides `case_timeout` ini option).",
+    )
+    group.addoption(
+        "--case-async-concurrency",
+        type=int,
+        default=None,
+        dest="case_async_concurrency",
+        help="max number of async case providers running at once (overrides `case_async_concurrency` ini option).",
+    )
+    group.addoption(
+        "--case-async-runner",
+        choices=("native", "plugin"),
+        default=None,
+        dest="case_async_runner",
+        help="how async case providers of sync tests are run: on plugin's own session event loop (native) or by an "
+        "async pytest plugin, e.g. pytest-asyncio (overrides `case_async_runner` ini option, default: native).",
+    )
+    group.addoption(
+        "--case-loop-factory",
+        default=None,
+        dest="case_loop_factory",
+        help="event loop factory of the native async runner: asyncio, uvloop, auto or 'module:attribute' path "
+        "(overrides `case_loop_factory` ini option, default: asyncio).",
+    )
+    group.addoption(
+        "--case-trace",
+        default=None,
+        dest="case_trace",
+        metavar="PATH",
+        help="write timeline of case collection, case provision & test calls to the file in Chrome Trace Event Format.",
+    )
+    group.addoption(
+        "--case-memory",
+        action="store_true",
+        default=False,
+        dest="case_memory",
+        help="record memory allocated by case providers with tracemalloc, report the heaviest ones & possible leaks.",
+    )
+    group.addoption(
+        "--case-memory-top",
+        type=int,
+        default=10,
+        dest="case_memory_top",
+        help="number of the heaviest case providers to report (default: 10).",
+    )
+    group.addoption(
+        "--case-profile",
+        default=None,
+        dest="case_profile",
+        metavar="DIR",
+        help="profile case construction & test call of each case with cProfile, write profiles of the slowest cases "
+        "& merged profile of each case provider to the directory.",
+    )
+    group.addoption(
+        "--case-profile-top",
+        type=int,
+        default=10,
+        dest="case_profile_top",
+        help="number of the slowest cases to keep profiles of (default: 10).",
+    )
+    group.addoption(
+        "--case-cache-results",
+        action="store_true",
+        default=False,
+        dest="case_cache_results",
+        help="skip cases that passed last time & whose test, provider, fixtures & their dependencies are unchanged.",
+    )
+    group.addoption(
+        "--case-cache-mode",
+        choices=("skip", "verify"),
+        default="skip",
+        dest="case_cache_mode",
+        help="mode of the case result cache: skip all cached cases or verify (also rerun a rotating part of cached "
+        "cases), default: skip.",
+    )
+    group.addoption(
+        "--case-cache-verify-ratio",
+        type=float,
+        default=0.1,
+        dest="case_cache_verify_ratio",
+        help="part of cached cases rerun by each run in verify mode (default: 0.1).",
+    )
+    group.addoption(
+        "--case-benchmark",
+        action="store_true",
+        default=False,
+        dest="case_benchmark",
+        help="benchmark the test body of each case parametrized item (warmup, adaptive repetition, median & MAD).",
+    )
+    group.addoption(
+        "--case-benchmark-time",
+        type=float,
+        default=0.5,
+        dest="case_benchmark_time",
+        help="time budget of measurement rounds of each case in seconds (default: 0.5).",
+    )
+    group.addoption(
+        "--case-benchmark-json",
+        default=None,
+        dest="case_benchmark_json",
+        metavar="PATH",
+        help="write case benchmark results to the JSON file (can be used as a baseline later).",
+    )
+    group.addoption(
+        "--case-benchmark-compare",
+        default=None,
+        dest="case_benchmark_compare",
+        metavar="PATH",
+        help="compare case benchmark results with the baseline JSON file, warn about regressed cases.",
+    )
+    group.addoption(
+        "--case-benchmark-threshold",
+        type=float,
+        default=0.1,
+        dest="case_benchmark_threshold",
+        help="relative slowdown of the median at which a case is regressed (default: 0.1).",
+    )
+    group.addoption(
+        "--case-benchmark-fail",
+        action="store_true",
+        default=False,
+        dest="case_benchmark_fail",
+        help="fail regressed cases instead of warning.",
+    )
+    group.addoption(
+        "--case-collect-stats",
+        action="store_true",
+        default=False,
+        dest="case_collect_stats",
+        help="report collection time, memory, number of cases & include graph of each case parametrized test.",
+    )
+    group.addoption(
+        "--case-collect-stats-json",
+        default=None,
+        dest="case_collect_stats_json",
+        metavar="PATH",
+        help="write case collection stats to the JSON file.",
+    )
+    group.addoption(
+        "--case-direct-items",
+        action="store_true",
+        default=False,
+        dest="case_direct_items",
+        help="generate items of case parametrized tests directly instead of `metafunc.parametrize` (cheaper item "
+        "generation of huge case sets).",
+    )
+    group.addoption(
+        "--case-watch",
+        action="store_true",
+        default=False,
+        dest="case_watch",
+        help="keep the session alive after the run, watch sources of tests & case providers and re-run items affected "
+        "by edits.",
+    )
+    group.addoption(
+        "--case-watch-interval",
+        type=float,
+        default=0.5,
+        dest="case_watch_interval",
+        help="interval of polling watched files for modifications in seconds (default: 0.5).",
+    )
+    group.addoption(
+        "--case-maxfail-per-test",
+        type=int,
+        default=None,
+        dest="case_maxfail_per_test",
+        metavar="K",
+        help="skip remaining cases of a case parametrized test after K of its cases failed (other tests keep running).",
+    )
+    parser.addini("case_timeout", help="default timeout of case providers in seconds.", default=None)
+    parser.addini("case_async_concurrency", help="max number of async case providers running at once.", default=None)
+    parser.addini("case_async_runner", help="how async case providers of sync tests are run: native or plugin.")
+    parser.addini("case_loop_factory", help="event loop factory of the native async runner.")
+
+
+def pytest_configure(config: Config) -> None:
+    reorderers = list[CaseReorderer]()
+
+    result_cache: t.Optional[CaseResultCache] = None
+
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        if config.getoption("case_failed_first"):
+            store = CaseOutcomeStore(cache)
+            reorderers.append(FailedFirstCaseReorderer(store))
+
+            # NOTE: pytest-xdist workers send reports to the controller, outcomes are recorded by the controller only.
+            if not _is_xdist_worker(config):
+                # NOTE: test functions of modules are partially collected with selected node ids & `--lf`.
+                partial = config.getoption("lf", default=False) or any("::" in arg for arg in config.args)
+                recorder = CaseOutcomeRecorder(store, config.rootpath, prune_modules=not partial)
+                config.pluginmanager.register(recorder, "case-provider-outcome-recorder")
+
+        if config.getoption("case_cache_results"):
+            result_cache = CaseResultCache(
+                cache,
+                CaseFingerprinter(config.rootpath),
+                config.getoption("case_cache_mode"),
+                config.getoption("case_cache_verify_ratio"),
+                getattr(config, "workeroutput", None),
+            )
+            config.pluginmanager.register(result_cache, "case-provider-result-cache")
+
+    collect_stats: t.Optional[CaseCollectStatsRecorder] = None
+    if config.getoption("case_collect_stats"):
+        collect_stats_path = config.getoption("case_collect_stats_json")
+        collect_stats = CaseCollectStatsRecorder(
+            config,
+            Path(config.invocation_params.dir, collect_stats_path) if collect_stats_path else None,
+        )
+        config.pluginmanager.register(collect_stats, "case-provider-collect-stats")
+
+    config.pluginmanager.register(CaseBatchReporter(), "case-provider-batch-reporter")
+    config.pluginmanager.register(CasePoolReporter(), "case-provider-pool-reporter")
+    _register_modes(config)
+    _register_diagnostics(config)
+
+    config.stash[_CASE_TEST_GENERATOR_KEY] = CaseParametrizedTestGenerator(reorderers, result_cache, collect_stats)
+    config.stash[CASE_PROVISION_BUDGET_KEY] = CaseProvisionBudget(
+        timeout=_get_option_or_ini(config, "case_timeout", float),
+        concurrency=_get_option_or_ini(config, "case_async_concurrency", int),
+    )
+
+    async_runner = _get_option_or_ini(config, "case_async_runner", str) or "native"
+    if async_runner not in {"native", "plugin"}:
+        msg = f"invalid case_async_runner: {async_runner!r}, expected native or plugin"
+        raise pytest.UsageError(msg)
+
+    if async_runner == "native":
+        runner = CaseAsyncRunner(
+            load_event_loop_factory(_get_option_or_ini(config, "case_loop_factory", str) or "asyncio")
+        )
+        config.add_cleanup(runner.close)
+        config.stash[CASE_ASYNC_RUNNER_KEY] = runner
 
 
 def pytest_generate_tests(metafunc: Metafunc) -> None:
-    _get_case_test_generator().generate(metafunc)
+    metafunc.config.stash[_CASE_TEST_GENERATOR_KEY].generate(metafunc)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item: Item) -> t.Generator[None, TestReport, TestReport]:
+    report = yield
+
+    case = find_item_case_info(item)
+    if case is not None:
+        set_report_case(report, get_item_definition_id(item), case.name)
+
+    return report
+
+
+def _register_modes(config: Config) -> None:
+    maxfail_per_test = config.getoption("case_maxfail_per_test")
+    if maxfail_per_test is not None:
+        if maxfail_per_test < 1:
+            msg = f"--case-maxfail-per-test should be a positive number, got: {maxfail_per_test}"
+            raise pytest.UsageError(msg)
+
+        config.pluginmanager.register(CaseMaxFailGuard(maxfail_per_test), "case-provider-maxfail-guard")
+
+    if config.getoption("case_direct_items"):
+        config.pluginmanager.register(CaseItemGenerator(), "case-provider-item-generator")
+
+    if config.getoption("case_watch"):
+        if config.getoption("dist", "no") != "no":
+            msg = "--case-watch can't be used with distributed test runs (pytest-xdist)"
+            raise pytest.UsageError(msg)
+
+        config.pluginmanager.register(
+            CaseWatcher(config, config.getoption("case_watch_interval")),
+            "case-provider-watcher",
+        )
+
+
+def _register_diagnostics(config: Config) -> None:
+    if config.getoption("case_memory"):
+        memory = CaseMemoryRecorder(config.getoption("case_memory_top"))
+        config.pluginmanager.register(memory, "case-provider-memory-recorder")
+
+    profile_path = config.getoption("case_profile")
+    if profile_path:
+        profiler = CaseProfiler(
+            config,
+            Path(config.invocation_params.dir, profile_path),
+            config.getoption("case_profile_top"),
+        )
+        config.pluginmanager.register(profiler, "case-provider-profiler")
+
+    if config.getoption("case_benchmark"):
+        benchmark_path = config.getoption("case_benchmark_json")
+        baseline_path = config.getoption("case_benchmark_compare")
+        benchmark = CaseBenchmark(
+            config,
+            time_budget=config.getoption("case_benchmark_time"),
+            path=Path(config.invocation_params.dir, benchmark_path) if benchmark_path else None,
+            baseline_path=Path(config.invocation_params.dir, baseline_path) if baseline_path else None,
+            threshold=config.getoption("case_benchmark_threshold"),
+            fail_on_regression=config.getoption("case_benchmark_fail"),
+        )
+        config.pluginmanager.register(benchmark, "case-provider-benchmark")
+
+    trace_path = config.getoption("case_trace")
+    if trace_path:
+        trace = CaseTraceRecorder(config, Path(config.invocation_params.dir, trace_path))
+        config.pluginmanager.register(trace, "case-provider-trace-recorder")
+
+
+def _get_option_or_ini(config: Config, name: str, parse: t.Callable[[str], T]) -> t.Optional[T]:
+    value = config.getoption(name)
+    if value is not None:
+        return t.cast("T", value)
+
+    raw = config.getini(name)
+    return parse(raw) if raw else None
 
 
-@cache
-def _get_case_test_generator() -> CaseParametrizedTestGenerator:
-    return CaseParametrizedTestGenerator()
+def _is_xdist_worker(config: Config) -> bool:
+    return hasattr(config, "workerinput")
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+@pytest.mark.parametrize("loop_factory", ["asyncio", "auto", "asyncio:new_event_loop"])
+def test_native_runner_shares_loop_across_items(
+    pytester: Pytester,
+    async_runner_testfile: Path,
+    loop_factory: str,
+) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "--asyncio-mode=auto", f"--case-loop-factory={loop_factory}")
+
+    result.assert_outcomes(passed=3)
+
+
+def test_plugin_runner_uses_loop_per_item(pytester: Pytester, async_runner_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "--asyncio-mode=auto", "--case-async-runner=plugin", "-k", "shared")
+
+    result.assert_outcomes(passed=1, failed=1)
+
+
+def test_native_runner_runs_batched_async_cases(pytester: Pytester, async_batch_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv")
+
+    result.assert_outcomes(passed=1)
+
+
+def test_plugin_runner_rejects_batched_async_cases(pytester: Pytester, async_batch_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--asyncio-mode=auto", "--case-async-runner=plugin")
+
+    result.stdout.fnmatch_lines(["*TypeError: batched sync test function can't use async case providers*"])
+
+
+def test_invalid_loop_factory(pytester: Pytester, async_runner_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--case-loop-factory=unknown")
+
+    result.stderr.fnmatch_lines(["*invalid event loop factory: 'unknown'*"])
+
+
+@pytest.fixture
+def async_runner_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "async_runner_testfile.py").read_text())
+
+
+@pytest.fixture
+def async_batch_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "async_batch_testfile.py").read_text())
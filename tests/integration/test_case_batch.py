@@ -0,0 +1,137 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_batch_runs_cases_within_one_item(pytester: Pytester, batch_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "-k", "not positive_subtests")
+
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_number_is_positive[[]case_one..case_minus_two[]] FAILED*",
+            "*::test_number_is_positive[[]case_skipped..case_four[]] PASSED*",
+            "*::test_number_is_positive[[]case_five[]] PASSED*",
+            "*CaseBatchError: 1 of 2 cases failed*",
+            "*[[]case_minus_two[]] AssertionError: assert -2 > 0",
+        ]
+    )
+
+
+def test_batch_reports_each_case_with_subtests(pytester: Pytester, batch_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "-k", "positive_subtests")
+
+    result.stdout.fnmatch_lines_random(
+        [
+            "*::test_number_is_positive_subtests[[]case_one..case_minus_two[]][[]case_one[]] PASSED*",
+            "*::test_number_is_positive_subtests[[]case_one..case_minus_two[]][[]case_minus_two[]] FAILED*",
+            "*::test_number_is_positive_subtests[[]case_skipped..case_four[]][[]case_skipped[]] SKIPPED*",
+            "*::test_number_is_positive_subtests[[]case_skipped..case_four[]][[]case_four[]] PASSED*",
+            "*::test_number_is_positive_subtests[[]case_five[]][[]case_five[]] PASSED*",
+            "*1 failed, 3 passed, 1 skipped, 3 deselected*",
+        ]
+    )
+    assert "CaseBatchError" not in result.stdout.str()
+
+
+def test_batch_cases_are_selected_by_keyword(pytester: Pytester, batch_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "-k", "positive_subtests and case_minus")
+
+    result.assert_outcomes(failed=1, deselected=3)
+    result.stdout.fnmatch_lines(["*::test_number_is_positive_subtests[[]case_minus_two[]][[]case_minus_two[]] FAILED*"])
+
+
+def test_batch_last_failed_cases_are_rerun(pytester: Pytester, batch_testfile: Path) -> None:
+    pytester.runpytest_subprocess("-k", "positive_subtests")
+    result = pytester.runpytest_subprocess("-vvv", "--lf", "-k", "positive_subtests")
+
+    result.assert_outcomes(failed=1, deselected=3)
+    result.stdout.fnmatch_lines(["*::test_number_is_positive_subtests[[]case_minus_two[]][[]case_minus_two[]] FAILED*"])
+
+
+def test_batch_cases_are_selected_without_cache_provider(pytester: Pytester, batch_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider", "-k", "not positive_subtests")
+
+    result.assert_outcomes(passed=2, failed=1)
+
+
+def test_batch_reports_explicitly_failed_cases(pytester: Pytester, batch_fail_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv")
+
+    result.assert_outcomes(passed=2, failed=2)
+    result.stdout.fnmatch_lines_random(
+        [
+            "*::test_number_is_positive[[]case_one..case_three[]] FAILED*",
+            "*::test_number_is_positive_subtests[[]case_one..case_three[]][[]case_one[]] PASSED*",
+            "*::test_number_is_positive_subtests[[]case_one..case_three[]][[]case_minus_two[]] FAILED*",
+            "*::test_number_is_positive_subtests[[]case_one..case_three[]][[]case_three[]] PASSED*",
+            "*CaseBatchError: 1 of 3 cases failed*",
+            "*[[]case_minus_two[]] Failed: negative number: -2",
+        ]
+    )
+
+
+def test_batch_evaluates_xfail_of_each_case(pytester: Pytester, batch_xfail_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "-rxX", "-k", "not positive_batch")
+
+    result.assert_outcomes(passed=1, failed=2, xfailed=2, xpassed=1)
+    result.stdout.fnmatch_lines_random(
+        [
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_minus_one[]] XFAIL*",
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_two[]] XPASS*",
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_three[]] FAILED*",
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_minus_four[]] FAILED*",
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_five[]] XFAIL*",
+            "*[[]XPASS(strict)[]] number must be negative*",
+            "XFAIL *[[]case_five[]] - [[]NOTRUN[]] number is not checked",
+        ]
+    )
+
+
+def test_batch_reports_failures_of_xfail_cases(pytester: Pytester, batch_xfail_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-k", "positive_batch")
+
+    result.assert_outcomes(failed=1, deselected=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*CaseBatchError: 2 of 6 cases failed*",
+            "*[[]case_three[]] Failed: [[]XPASS(strict)[]] number must be negative",
+            "*[[]case_minus_four[]] AssertionError: assert -4 > 0",
+        ]
+    )
+
+
+def test_batch_case_reports_have_epoch_times(pytester: Pytester, batch_testfile: Path) -> None:
+    pytester.makeconftest(
+        """
+        import time
+
+
+        def pytest_runtest_logreport(report):
+            if report.when == "call":
+                assert abs(report.start - time.time()) < 60
+                assert report.stop >= report.start
+        """
+    )
+
+    result = pytester.runpytest_subprocess("-k", "positive_subtests")
+
+    result.assert_outcomes(passed=3, failed=1, skipped=1, deselected=3)
+
+
+@pytest.fixture
+def batch_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "batch_testfile.py").read_text())
+
+
+@pytest.fixture
+def batch_xfail_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "batch_xfail_testfile.py").read_text())
+
+
+@pytest.fixture
+def batch_fail_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "batch_fail_testfile.py").read_text())
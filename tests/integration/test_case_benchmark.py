@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+BENCHMARK_OPTIONS = ("--case-benchmark", "--case-benchmark-time=0.01")
+
+
+def test_benchmark_writes_results(pytester: Pytester, benchmark_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess(*BENCHMARK_OPTIONS, "--case-benchmark-json=bench.json")
+
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*= case benchmark =*",
+            "* ±* *::test_sum_of_squares[[]case_small[]]",
+            "* ±* *::test_sum_of_squares[[]case_big[]]",
+            "case benchmark results: *bench.json",
+        ]
+    )
+
+    results = json.loads((pytester.path / "bench.json").read_text())["benchmarks"]
+    cases = results[f"{benchmark_testfile.name}::test_sum_of_squares"]
+    assert set(cases) == {"case_small", "case_big"}
+    assert cases["case_big"]["median"] > cases["case_small"]["median"]
+    assert cases["case_big"]["rounds"] >= 5  # noqa: PLR2004
+
+
+def test_benchmark_warns_about_regression(pytester: Pytester, benchmark_testfile: Path) -> None:
+    write_fast_baseline(pytester, benchmark_testfile)
+
+    result = pytester.runpytest_subprocess(*BENCHMARK_OPTIONS, "--case-benchmark-compare=baseline.json")
+
+    result.assert_outcomes(passed=2, warnings=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*CaseBenchmarkWarning: case case_big regressed: median * vs baseline 1.0ns*",
+            "*::test_sum_of_squares[[]case_big[]]  REGRESSED",
+        ]
+    )
+
+
+def test_benchmark_fails_regressed_case(pytester: Pytester, benchmark_testfile: Path) -> None:
+    write_fast_baseline(pytester, benchmark_testfile)
+
+    result = pytester.runpytest_subprocess(
+        *BENCHMARK_OPTIONS,
+        "--case-benchmark-compare=baseline.json",
+        "--case-benchmark-fail",
+    )
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*_ test_sum_of_squares[[]case_big[]] _*",
+            "case case_big regressed: median * vs baseline 1.0ns*",
+        ]
+    )
+
+
+def write_fast_baseline(pytester: Pytester, testfile: Path) -> None:
+    stats = {"median": 1e-9, "mad": 0.0, "min": 1e-9, "rounds": 5, "loops": 1}
+    (pytester.path / "baseline.json").write_text(
+        json.dumps({"benchmarks": {f"{testfile.name}::test_sum_of_squares": {"case_big": stats}}})
+    )
+
+
+@pytest.fixture
+def benchmark_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "benchmark_testfile.py").read_text())
@@ -0,0 +1,34 @@
+import json
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_collect_stats_are_reported(pytester: Pytester, collect_stats_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--case-collect-stats", "--case-collect-stats-json=stats.json")
+
+    result.assert_outcomes(passed=203)
+    result.stdout.fnmatch_lines(
+        [
+            "*= case collection stats =*",
+            "*total*collect*param*fixture*memory*cases*depth*fanout  test",
+            "case collection stats: *stats.json",
+        ]
+    )
+
+    stats = {entry["nodeid"].split("::")[-1]: entry for entry in json.loads((pytester.path / "stats.json").read_text())}
+    assert {name: (entry["cases"], entry["depth"], entry["fanout"]) for name, entry in stats.items()} == {
+        "test_few": (1, 1, 0),
+        "test_many": (101, 2, 2),
+        "test_nested": (101, 3, 2),
+    }
+    assert stats["test_many"]["memory"] > stats["test_few"]["memory"]
+    assert all(entry["total"] >= entry["collect"] for entry in stats.values())
+
+
+@pytest.fixture
+def collect_stats_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "collect_stats_testfile.py").read_text())
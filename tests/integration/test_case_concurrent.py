@@ -0,0 +1,76 @@
+import re
+import sys
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+requires_async_storage = pytest.mark.skipif(
+    sys.version_info < (3, 12),
+    reason="case storages of async test functions require `inspect.markcoroutinefunction`",
+)
+
+
+@requires_async_storage
+def test_concurrent_cases_run_within_one_item(pytester: Pytester, concurrent_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "--asyncio-mode=auto", "-k", "not batches")
+
+    result.assert_outcomes(passed=4, failed=1)
+    result.stdout.fnmatch_lines_random(
+        [
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_one[]] PASSED*",
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_two[]] PASSED*",
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_minus_three[]] FAILED*",
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_four[]] PASSED*",
+            "*::test_number_is_positive[[]case_one..case_five[]][[]case_five[]] PASSED*",
+            "FAILED *::test_number_is_positive[[]case_one..case_five[]][[]case_minus_three[]] - assert -3 > 0",
+        ]
+    )
+
+    # NOTE: cases sleep for 0.5s each, they overlap when run concurrently.
+    duration = re.search(r"in (?P<seconds>[\d.]+)s", result.outlines[-1])
+    assert duration is not None
+    assert float(duration.group("seconds")) < 2.5  # noqa: PLR2004
+
+
+@requires_async_storage
+def test_concurrent_cases_run_in_batches(pytester: Pytester, concurrent_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "--asyncio-mode=auto", "-k", "batches")
+
+    result.assert_outcomes(passed=4, failed=1)
+    result.stdout.fnmatch_lines_random(
+        [
+            "*::test_number_is_positive_in_batches[[]case_one..case_two[]][[]case_two[]] PASSED*",
+            "*::test_number_is_positive_in_batches[[]case_minus_three..case_four[]][[]case_minus_three[]] FAILED*",
+            "*::test_number_is_positive_in_batches[[]case_five[]][[]case_five[]] PASSED*",
+        ]
+    )
+
+
+def test_concurrent_sync_test_is_rejected(pytester: Pytester) -> None:
+    pytester.makepyfile(
+        """
+        from pytest_case_provider import inject_cases_func
+
+
+        @inject_cases_func(concurrent=2)
+        def test_sync(number: int) -> None:
+            assert number
+
+
+        @test_sync.case()
+        def case_one() -> int:
+            return 1
+        """
+    )
+
+    result = pytester.runpytest_subprocess()
+
+    result.stdout.fnmatch_lines(["*TypeError: only async test functions can run cases concurrently*"])
+
+
+@pytest.fixture
+def concurrent_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "concurrent_testfile.py").read_text())
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_derived_cases_are_memoized(pytester: Pytester, derive_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv")
+
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_parsed_items_are_positive[[]parsed_case_numbers[]] PASSED*",
+            "*::test_parsed_items_are_sorted[[]parsed_case_numbers[]] PASSED*",
+            "*::test_total[[]total_parsed_case_numbers[]] PASSED*",
+            "*::test_each_stage_is_computed_once PASSED*",
+        ]
+    )
+
+
+def test_derived_cases_are_memoized_per_fixture_scope(pytester: Pytester, derive_scope_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv")
+
+    result.assert_outcomes(passed=4)
+
+
+@pytest.fixture
+def derive_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "derive_testfile.py").read_text())
+
+
+@pytest.fixture
+def derive_scope_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "derive_scope_testfile.py").read_text())
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_direct_items_are_same_as_parametrized(pytester: Pytester, direct_items_testfile: Path) -> None:
+    expected = pytester.runpytest_subprocess("--collect-only", "-q").outlines
+    result = pytester.runpytest_subprocess("--collect-only", "-q", "--case-direct-items")
+
+    assert _get_item_lines(result.outlines) == _get_item_lines(expected)
+    result.stdout.fnmatch_lines(["case items: 2 tests generated directly, 1 parametrized by pytest"])
+
+
+def test_direct_items_run(pytester: Pytester, direct_items_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "--case-direct-items")
+
+    result.assert_outcomes(passed=6, failed=1, skipped=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_number_is_below_limit[[]case_one[]] PASSED*",
+            "*::test_number_is_below_limit[[]case_two[]] SKIPPED*",
+            "*::test_number_is_below_limit[[]case_limit[]] FAILED*",
+        ]
+    )
+
+
+def test_direct_items_can_be_selected_by_case_name(pytester: Pytester, direct_items_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--case-direct-items", "-k", "case_one and below")
+
+    result.assert_outcomes(passed=1)
+
+
+@pytest.fixture
+def direct_items_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "direct_items_testfile.py").read_text())
+
+
+def _get_item_lines(lines: list[str]) -> list[str]:
+    return [line for line in lines if "::" in line]
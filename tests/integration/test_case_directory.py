@@ -0,0 +1,39 @@
+import json
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_directory_cases_are_collected(pytester: Pytester, directory_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv")
+
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_data_has_name[[]a.json[]] PASSED*",
+            "*::test_data_has_name[[]nested/b.json[]] PASSED*",
+        ]
+    )
+
+
+def test_directory_index_is_cached(pytester: Pytester, directory_testfile: Path) -> None:
+    pytester.runpytest_subprocess().assert_outcomes(passed=2)
+
+    indexes = list((pytester.path / ".pytest_cache" / "v" / "case_provider" / "directory").iterdir())
+    assert len(indexes) == 1
+    assert json.loads(indexes[0].read_text())["files"] == ["a.json", "nested/b.json"]
+
+    (pytester.path / "data" / "nested" / "c.json").write_text('{"name": "c"}')
+
+    pytester.runpytest_subprocess().assert_outcomes(passed=3)
+
+
+@pytest.fixture
+def directory_testfile(pytester: Pytester) -> Path:
+    (pytester.path / "data" / "nested").mkdir(parents=True)
+    (pytester.path / "data" / "a.json").write_text('{"name": "a"}')
+    (pytester.path / "data" / "nested" / "b.json").write_text('{"name": "b"}')
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "directory_testfile.py").read_text())
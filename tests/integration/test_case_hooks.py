@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_hooks_are_called_for_sync_providers(pytester: Pytester, hooks_conftest: Path) -> None:
+    pytester.makepyfile((Path(__file__).parent.parent / "stub" / "simple_testfile.py").read_text())
+
+    result = pytester.runpytest_subprocess("-s")
+
+    result.assert_outcomes(passed=1, errors=1)
+    result.stdout.fnmatch_lines_random(
+        [
+            "collect test_ok_42_injected: ['case_42'] True",
+            "collect test_error_injected: ['case_raises_error'] True",
+            "provide start test_ok_42_injected[[]case_42[]]: case_42",
+            "provide finish test_ok_42_injected[[]case_42[]]: case_42 True",
+            "teardown test_ok_42_injected[[]case_42[]]: case_42 True",
+            "provide start test_error_injected[[]case_raises_error[]]: case_raises_error",
+        ]
+    )
+    result.stdout.no_fnmatch_line("provide finish test_error_injected*")
+
+
+def test_hooks_are_called_for_async_providers(pytester: Pytester, hooks_conftest: Path) -> None:
+    pytester.makepyfile((Path(__file__).parent.parent / "stub" / "async_runner_testfile.py").read_text())
+
+    result = pytester.runpytest_subprocess("-s", "--asyncio-mode=auto", "-k", "shared")
+
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines_random(
+        [
+            "collect test_loop_is_shared: ['case_first', 'case_second'] True",
+            "provide finish test_loop_is_shared[[]case_first[]]: case_first True",
+            "teardown test_loop_is_shared[[]case_first[]]: case_first True",
+            "provide finish test_loop_is_shared[[]case_second[]]: case_second True",
+            "teardown test_loop_is_shared[[]case_second[]]: case_second True",
+        ]
+    )
+
+
+@pytest.fixture
+def hooks_conftest(pytester: Pytester) -> Path:
+    return pytester.makeconftest((Path(__file__).parent.parent / "stub" / "hooks_conftest.py").read_text())
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_lazy_cases_are_built_on_access(pytester: Pytester, lazy_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv")
+
+    result.assert_outcomes(passed=2, skipped=2)
+
+
+@pytest.fixture
+def lazy_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "lazy_testfile.py").read_text())
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_maxfail_per_test_skips_remaining_cases(pytester: Pytester, maxfail_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-v", "-rs", "--case-maxfail-per-test=2")
+
+    result.assert_outcomes(passed=5, failed=3, skipped=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_broken[[]case_two[]] FAILED*",
+            "*::test_broken[[]case_three[]] SKIPPED*",
+            "*::test_broken[[]case_four[]] SKIPPED*",
+            "*::test_number_is_positive[[]case_negative[]] FAILED*",
+            "*- case maxfail -*",
+            "*::test_broken: 2 cases skipped after 2 failures",
+            "SKIPPED [[]2[]] *: case maxfail: 2 cases of the test failed, remaining cases are skipped",
+        ]
+    )
+
+
+def test_maxfail_per_test_keeps_session_maxfail(pytester: Pytester, maxfail_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--case-maxfail-per-test=1", "--maxfail=4")
+
+    result.assert_outcomes(failed=3, skipped=7)
+    result.stdout.no_fnmatch_line("*stopping after*")
+
+    result = pytester.runpytest_subprocess("--case-maxfail-per-test=1", "--maxfail=2")
+
+    result.assert_outcomes(failed=2, skipped=3)
+    result.stdout.fnmatch_lines(["*stopping after 2 failures*"])
+
+
+def test_maxfail_per_test_should_be_positive(pytester: Pytester, maxfail_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--case-maxfail-per-test=0")
+
+    result.stderr.fnmatch_lines(["*--case-maxfail-per-test should be a positive number, got: 0"])
+
+
+@pytest.fixture
+def maxfail_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "maxfail_testfile.py").read_text())
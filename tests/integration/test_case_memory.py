@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_case_memory_reports_heaviest_providers_and_leaks(pytester: Pytester, memory_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--case-memory", "--case-memory-top=2")
+
+    result.assert_outcomes(passed=9)
+    result.stdout.fnmatch_lines(
+        [
+            "*= case memory =*",
+            "*MiB peak*retained*growth  case_heavy (3 provisions)",
+            "*KiB peak*retained*growth  case_leaky (3 provisions)",
+            "possible leak: case_leaky retained * KiB after 3 teardowns",
+        ]
+    )
+    result.stdout.no_fnmatch_line("*case_light (3 provisions)")
+    result.stdout.no_fnmatch_line("possible leak: case_heavy*")
+
+
+def test_case_memory_is_disabled_by_default(pytester: Pytester, memory_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess()
+
+    result.assert_outcomes(passed=9)
+    result.stdout.no_fnmatch_line("*= case memory =*")
+
+
+@pytest.fixture
+def memory_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "memory_testfile.py").read_text())
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_case_modules_are_not_imported_on_collection(pytester: Pytester, module_cases_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--collect-only", "-q")
+
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_number_is_positive[[]case_local[]]",
+            "*::test_number_is_positive[[]case_one[]]",
+            "*::test_number_is_positive[[]case_two[]]",
+            "*::test_number_is_positive[[]case_three[]]",
+            "*::test_number_is_positive[[]case_four[]]",
+        ]
+    )
+    assert not (pytester.path / "imported").exists()
+
+
+def test_case_modules_are_imported_on_setup(pytester: Pytester, module_cases_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv")
+
+    result.assert_outcomes(passed=4, skipped=1)
+    assert sorted((pytester.path / "imported").read_text().split()) == ["lazycases.first", "lazycases.second"]
+
+
+def test_case_modules_of_deselected_cases_are_not_imported(
+    pytester: Pytester,
+    module_cases_testfile: Path,
+) -> None:
+    result = pytester.runpytest_subprocess("-k", "case_one or case_local")
+
+    result.assert_outcomes(passed=2)
+    assert (pytester.path / "imported").read_text().split() == ["lazycases.first"]
+
+
+def test_case_modules_are_included_into_test_methods(pytester: Pytester) -> None:
+    pytester.mkpydir("lazycases")
+    (pytester.path / "lazycases" / "first.py").write_text(
+        "def case_one(self: object) -> int:\n    return 1\n\n\ndef case_two(self: object) -> int:\n    return 2\n"
+    )
+    pytester.makepyfile((Path(__file__).parent.parent / "stub" / "method_module_cases_testfile.py").read_text())
+
+    result = pytester.runpytest_subprocess("-vvv")
+
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(["*::TestNumbers::test_number_is_positive[[]case_one[]] PASSED*"])
+
+
+@pytest.fixture
+def module_cases_testfile(pytester: Pytester) -> Path:
+    # NOTE: case modules record their import, so tests can check when they are imported.
+    record = "from pathlib import Path\n\nwith Path('imported').open('a') as fd:\n    fd.write(__name__ + '\\n')\n\n"
+    pytester.mkpydir("lazycases")
+    (pytester.path / "lazycases" / "first.py").write_text(
+        f"{record}def case_one() -> int:\n    return 1\n\n\ndef case_two() -> int:\n    return 2\n"
+    )
+    (pytester.path / "lazycases" / "second.py").write_text(
+        f"import pytest\n\n{record}"
+        "@pytest.mark.skip(reason='not ready')\ndef case_three() -> int:\n    return -3\n\n\n"
+        "def case_four() -> int:\n    return 4\n"
+    )
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "module_cases_testfile.py").read_text())
@@ -0,0 +1,62 @@
+import re
+import typing as t
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+CASE_RESULT_PATTERN = re.compile(r"^.*::test_number_is_positive\[(?P<case>[\w-]+)\]\s+(?:PASSED|FAILED)")
+
+
+def parse_case_order(outlines: t.Sequence[str]) -> t.Sequence[str]:
+    return [match.group("case") for match in map(CASE_RESULT_PATTERN.match, outlines) if match is not None]
+
+
+def test_cases_run_in_definition_order_by_default(pytester: Pytester, failing_case_testfile: Path) -> None:
+    pytester.runpytest_subprocess("-vvv")
+    result = pytester.runpytest_subprocess("-vvv")
+
+    assert parse_case_order(result.outlines) == ["case_one", "case_two", "case_minus_three", "case_four"]
+
+
+def test_failed_first_runs_failed_cases_first(pytester: Pytester, failing_case_testfile: Path) -> None:
+    pytester.runpytest_subprocess("-vvv", "--case-failed-first")
+    result = pytester.runpytest_subprocess("-vvv", "--case-failed-first")
+
+    assert parse_case_order(result.outlines) == ["case_minus_three", "case_one", "case_two", "case_four"]
+
+
+def test_failed_first_stops_on_first_failure(pytester: Pytester, failing_case_testfile: Path) -> None:
+    pytester.runpytest_subprocess("-vvv", "--case-failed-first")
+    result = pytester.runpytest_subprocess("-vvv", "--case-failed-first", "-x")
+
+    assert parse_case_order(result.outlines) == ["case_minus_three"]
+
+
+def test_failed_first_runs_quick_to_fail_cases_first(pytester: Pytester, slow_failing_case_testfile: Path) -> None:
+    pytester.runpytest_subprocess("-vvv", "--case-failed-first")
+    result = pytester.runpytest_subprocess("-vvv", "--case-failed-first")
+
+    assert parse_case_order(result.outlines) == ["case_minus_three", "case_minus_two", "case_one"]
+
+
+def test_case_outcomes_are_recorded_with_failed_first_only(pytester: Pytester, failing_case_testfile: Path) -> None:
+    pytester.runpytest_subprocess()
+
+    assert not (pytester.path / ".pytest_cache" / "v" / "case_provider" / "outcomes").exists()
+
+    pytester.runpytest_subprocess("--case-failed-first")
+
+    assert (pytester.path / ".pytest_cache" / "v" / "case_provider" / "outcomes").exists()
+
+
+@pytest.fixture
+def failing_case_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "failing_case_testfile.py").read_text())
+
+
+@pytest.fixture
+def slow_failing_case_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "slow_failing_case_testfile.py").read_text())
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_pool_resource_is_reused_by_cases(pytester: Pytester, pool_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-v")
+
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*- case pools -*",
+            "create_store: 3 acquisitions of 1 created resources (peak 1 in use, 0 discarded), *, 0 waits *",
+        ]
+    )
+
+
+def test_pool_is_not_reported_without_acquisitions(pytester: Pytester, pool_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--collect-only")
+
+    result.stdout.no_fnmatch_line("*case pools*")
+
+
+@pytest.fixture
+def pool_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "pool_testfile.py").read_text())
@@ -0,0 +1,32 @@
+import pstats
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_case_profile_keeps_slowest_cases_and_merges_providers(pytester: Pytester, profile_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--case-profile=prof", "--case-profile-top=1")
+
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(["*= case profile: */prof =*", "*s  *::test_number_is_positive[[]case_slow-*[]]"])
+
+    profiles = sorted(path.name for path in (pytester.path / "prof").iterdir())
+    assert len(profiles) == 3  # noqa: PLR2004
+    assert profiles[:2] == ["provider-case_fast.prof", "provider-case_slow.prof"]
+    assert profiles[2].startswith(f"{profile_testfile.name}_test_number_is_positive[case_slow-")
+
+    assert get_call_count(pytester.path / "prof" / "provider-case_slow.prof", "build_slow_value") == 2  # noqa: PLR2004
+    assert get_call_count(pytester.path / "prof" / profiles[2], "build_slow_value") == 1
+
+
+def get_call_count(path: Path, func_name: str) -> int:
+    profile = pstats.Stats(str(path)).get_stats_profile().func_profiles[func_name]
+    return int(profile.ncalls)
+
+
+@pytest.fixture
+def profile_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "profile_testfile.py").read_text())
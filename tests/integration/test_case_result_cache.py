@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_cases_run_without_result_cache(pytester: Pytester, result_cache_testfile: Path) -> None:
+    pytester.runpytest_subprocess()
+    result = pytester.runpytest_subprocess()
+
+    result.assert_outcomes(passed=2, failed=1)
+
+
+def test_passed_cases_are_skipped(pytester: Pytester, result_cache_testfile: Path) -> None:
+    pytester.runpytest_subprocess("--case-cache-results").assert_outcomes(passed=2, failed=1)
+    result = pytester.runpytest_subprocess("-vvv", "--case-cache-results")
+
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_number_is_small[[]case_big[]] FAILED*",
+            "case result cache: 2 cases skipped as passed & unchanged since last run",
+        ]
+    )
+
+
+def test_changed_provider_case_is_rerun(pytester: Pytester, result_cache_testfile: Path) -> None:
+    pytester.runpytest_subprocess("--case-cache-results")
+    result_cache_testfile.write_text(result_cache_testfile.read_text().replace("return 2", "return 3"))
+    result = pytester.runpytest_subprocess("-vvv", "--case-cache-results")
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*::test_number_is_small[[]case_two[]] PASSED*"])
+
+
+def test_changed_dependency_cases_are_rerun(pytester: Pytester, result_cache_testfile: Path) -> None:
+    pytester.runpytest_subprocess("--case-cache-results")
+    result_cache_testfile.write_text(result_cache_testfile.read_text().replace("LIMIT = 10", "LIMIT = 1000"))
+
+    pytester.runpytest_subprocess("--case-cache-results").assert_outcomes(passed=3)
+    pytester.runpytest_subprocess("--case-cache-results").assert_outcomes(deselected=1)
+
+
+def test_verify_mode_reruns_cached_cases(pytester: Pytester, result_cache_testfile: Path) -> None:
+    pytester.runpytest_subprocess("--case-cache-results")
+    result = pytester.runpytest_subprocess(
+        "--case-cache-results",
+        "--case-cache-mode=verify",
+        "--case-cache-verify-ratio=1",
+    )
+
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(["case result cache: 0 cases skipped *, 2 cached cases verified"])
+
+
+def test_cache_results_flag_keeps_positional_args(pytester: Pytester, result_cache_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--case-cache-results", str(result_cache_testfile))
+
+    result.assert_outcomes(passed=2, failed=1)
+
+
+def test_changed_data_cases_are_rerun(pytester: Pytester, result_cache_data_testfile: Path) -> None:
+    pytester.runpytest_subprocess("--case-cache-results").assert_outcomes(passed=6)
+    result = pytester.runpytest_subprocess("--case-cache-results")
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["case result cache: 5 cases skipped *, 1 uncacheable cases run"])
+
+    source = result_cache_data_testfile.read_text()
+    source = source.replace('EXPECTED = {"one": 1, "two": 2}', 'EXPECTED = {"one": 1}')
+    source = source.replace('CaseTable({"x": [1, 2]})', 'CaseTable({"x": [1, 5]})')
+    source = source.replace("MAX = 10", "MAX = 3")
+    result_cache_data_testfile.write_text(source)
+    result = pytester.runpytest_subprocess("-vvv", "--case-cache-results")
+
+    result.assert_outcomes(passed=3, failed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_name_is_expected[[]case_two[]] FAILED*",
+            "*::test_row_is_small[[]row1[]] FAILED*",
+            "*::test_number_is_below_limit[[]case_five[]] FAILED*",
+        ]
+    )
+
+
+@pytest.fixture
+def result_cache_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "result_cache_testfile.py").read_text())
+
+
+@pytest.fixture
+def result_cache_data_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "result_cache_data_testfile.py").read_text())
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_snapshots_are_kept_by_fixture_params(pytester: Pytester, snapshot_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-k", "items")
+
+    result.assert_outcomes(passed=6)
+    assert sorted((pytester.path / "built").read_text().split()) == ["1", "2", "3"]
+
+
+def test_snapshots_are_not_shared_by_function_scoped_fixtures(
+    pytester: Pytester,
+    snapshot_testfile: Path,
+) -> None:
+    result = pytester.runpytest_subprocess("-k", "label")
+
+    result.assert_outcomes(passed=2)
+
+
+@pytest.fixture
+def snapshot_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "snapshot_testfile.py").read_text())
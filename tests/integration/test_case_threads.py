@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_threaded_cases_are_reported_separately(pytester: Pytester, threads_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv")
+
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines_random(
+        [
+            "*::test_number_is_positive[[]case_one..case_three[]][[]case_one[]] PASSED*",
+            "*::test_number_is_positive[[]case_one..case_three[]][[]case_minus_two[]] FAILED*",
+            "*::test_number_is_positive[[]case_one..case_three[]][[]case_three[]] PASSED*",
+            "FAILED *::test_number_is_positive[[]case_one..case_three[]][[]case_minus_two[]] - assert -2 > 0",
+        ]
+    )
+
+
+def test_threads_with_concurrent_are_rejected(pytester: Pytester) -> None:
+    pytester.makepyfile(
+        """
+        from pytest_case_provider import inject_cases_func
+
+
+        @inject_cases_func(threads=2, concurrent=2)
+        def test_number(number: int) -> None:
+            assert number
+        """
+    )
+
+    result = pytester.runpytest_subprocess()
+
+    result.stdout.fnmatch_lines(["*ValueError: cases can't be run both concurrently & in threads*"])
+
+
+def test_threads_with_function_scoped_fixtures_are_rejected(pytester: Pytester) -> None:
+    pytester.makepyfile(
+        """
+        from pathlib import Path
+
+        from pytest_case_provider import inject_cases_func
+
+
+        @inject_cases_func(threads=2)
+        def test_number(number: int, tmp_path: Path) -> None:
+            assert number
+        """
+    )
+
+    result = pytester.runpytest_subprocess()
+
+    result.stdout.fnmatch_lines(["*TypeError: cases running in threads can't share function scoped fixtures tmp_path*"])
+
+
+def test_threads_with_autouse_function_scoped_fixtures_are_allowed(pytester: Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+
+        from pytest_case_provider import inject_cases_func
+
+
+        @pytest.fixture(autouse=True)
+        def env(monkeypatch: pytest.MonkeyPatch) -> None:
+            monkeypatch.setenv("MODE", "test")
+
+
+        @inject_cases_func(threads=2)
+        def test_number(number: int) -> None:
+            assert number
+
+
+        @test_number.case()
+        def case_one() -> int:
+            return 1
+        """
+    )
+
+    result = pytester.runpytest_subprocess()
+
+    result.assert_outcomes(passed=1)
+
+
+@pytest.fixture
+def threads_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "threads_testfile.py").read_text())
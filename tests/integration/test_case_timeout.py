@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+
+def test_case_timeout_surfaces_as_setup_error(pytester: Pytester, timeout_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "--asyncio-mode=auto")
+
+    result.assert_outcomes(passed=1, errors=2)
+    result.stdout.fnmatch_lines_random(
+        [
+            "*::test_number_is_positive[[]case_fast[]] PASSED*",
+            "*::test_number_is_positive[[]case_hung[]] ERROR*",
+            "*::test_number_is_positive[[]case_slow_sync[]] ERROR*",
+            "*CaseProviderTimeoutError: case 'case_hung' provider setup timed out: elapsed 0.1*s, timeout 0.100s",
+            "*CaseProviderTimeoutError: case 'case_slow_sync' provider setup timed out: elapsed 0.0*s, timeout 0.010s",
+        ]
+    )
+
+
+def test_global_case_timeout(pytester: Pytester, timeout_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("-vvv", "--asyncio-mode=auto", "--case-timeout=0.000001", "-k", "fast")
+
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(["*CaseProviderTimeoutError: case 'case_fast' provider setup timed out*"])
+
+
+@pytest.fixture
+def timeout_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "timeout_testfile.py").read_text())
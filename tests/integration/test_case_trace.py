@@ -0,0 +1,55 @@
+import json
+import typing as t
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from _pytest.pytester import Pytester
+
+from pytest_case_provider.case.trace import CaseTraceRecorder
+
+pytest_plugins = "pytester"
+
+
+def test_trace_contains_collection_provision_and_test_call_spans(pytester: Pytester) -> None:
+    pytester.makepyfile(
+        test_sync=(Path(__file__).parent.parent / "stub" / "simple_testfile.py").read_text(),
+        test_async=(Path(__file__).parent.parent / "stub" / "async_runner_testfile.py").read_text(),
+    )
+
+    result = pytester.runpytest_subprocess("--asyncio-mode=auto", "--case-trace=trace/out.json", "-k", "not error")
+
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(["case trace: */trace/out.json"])
+
+    events = load_trace_events(pytester.path / "trace" / "out.json")
+    spans = {(event["cat"], event["name"]) for event in events if event["ph"] == "X"}
+    assert {
+        ("collection", "test_sync.py::test_ok_42_injected"),
+        ("collection", "test_async.py::test_loop_is_shared"),
+        ("sync provider", "provide case_42"),
+        ("sync provider", "teardown case_42"),
+        ("async provider", "provide case_first"),
+        ("async provider", "provide case_second"),
+        ("async provider", "provide case_with_async_fixture"),
+        ("test", "test_sync.py::test_ok_42_injected[case_42]"),
+        ("test", "test_async.py::test_loop_is_shared[case_first]"),
+    } <= spans
+
+    thread_names = {event["args"]["name"] for event in events if event["name"] == "thread_name"}
+    assert "async case providers #0" in thread_names
+
+
+def test_trace_merges_worker_events(request: pytest.FixtureRequest, tmp_path: Path) -> None:
+    recorder = CaseTraceRecorder(request.config, tmp_path / "out.json")
+    worker_event = {"name": "test", "cat": "test", "ph": "X", "ts": 0.0, "dur": 1.0, "pid": 1, "tid": 2, "args": {}}
+
+    recorder.pytest_testnodedown(SimpleNamespace(workeroutput={"case_trace": [worker_event]}))
+    recorder.pytest_sessionfinish()
+
+    assert worker_event in load_trace_events(tmp_path / "out.json")
+
+
+def load_trace_events(path: Path) -> t.Sequence[t.Any]:
+    with path.open() as fd:
+        return t.cast("t.Sequence[t.Any]", json.load(fd)["traceEvents"])
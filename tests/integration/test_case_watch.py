@@ -0,0 +1,120 @@
+import fnmatch
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+import pytest
+from _pytest.pytester import Pytester
+
+pytest_plugins = "pytester"
+
+_TIMEOUT: t.Final[float] = 30.0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the watch session is stopped with SIGINT")
+def test_watch_reruns_items_affected_by_edits(
+    pytester: Pytester,
+    monkeypatch: pytest.MonkeyPatch,
+    watch_testfile: Path,
+) -> None:
+    monkeypatch.setenv("PYTHONUNBUFFERED", "1")
+    process = pytester.popen(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-p",
+            "no:cacheprovider",
+            "--case-watch",
+            "--case-watch-interval=0.1",
+            "--maxfail=2",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    output = _OutputReader(process)
+
+    try:
+        output.wait_for("*case watch: watching 1 files*")
+
+        _edit(watch_testfile, "return 2", "return -2")
+        output.wait_for("*: case_two changed, 1 affected items")
+        output.wait_for("*test_number_is_positive[[]case_two[]]*")
+        output.wait_for("*case watch: 1 failed, watching for changes*")
+
+        _edit(watch_testfile, "def case_one() -> int:", "def case_one(*args: int) -> int:")
+        output.wait_for("*: restart to apply changes of case_one")
+
+        _edit(watch_testfile, "number > MINIMUM", "number != MINIMUM")
+        output.wait_for("*: test_number_is_positive changed, 2 affected items")
+        output.wait_for("*case watch: 2 passed, watching for changes*")
+        assert not any("test_plain" in line for line in output.lines)
+
+        # NOTE: all items of the module are re-run, failures of the previous runs don't count for `--maxfail`.
+        _edit(watch_testfile, "MINIMUM = 0", "MINIMUM = 1")
+        output.wait_for("*: <module> changed, 3 affected items")
+        output.wait_for("*.py F..")
+        output.wait_for("*case watch: 1 failed, 2 passed, watching for changes*")
+
+        process.send_signal(signal.SIGINT)
+        output.wait_for("case watch: stopped")
+        output.wait_for("case watch: 3 re-runs")
+
+    finally:
+        process.kill()
+        process.wait(_TIMEOUT)
+
+
+def test_watch_is_skipped_on_collect_only(pytester: Pytester, watch_testfile: Path) -> None:
+    result = pytester.runpytest_subprocess("--case-watch", "--collect-only", timeout=_TIMEOUT)
+
+    result.stdout.no_fnmatch_line("*case watch*")
+
+
+@pytest.fixture
+def watch_testfile(pytester: Pytester) -> Path:
+    return pytester.makepyfile((Path(__file__).parent.parent / "stub" / "watch_testfile.py").read_text())
+
+
+class _OutputReader:
+    def __init__(self, process: "subprocess.Popen[str]") -> None:
+        self.lines = list[str]()
+        self.__queue = queue.Queue[str]()
+        self.__thread = threading.Thread(target=self.__read, args=(process,), daemon=True)
+        self.__thread.start()
+
+    def wait_for(self, pattern: str) -> str:
+        deadline = time.monotonic() + _TIMEOUT
+        while (timeout := deadline - time.monotonic()) > 0:
+            try:
+                line = self.__queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if fnmatch.fnmatch(line, pattern):
+                return line
+
+        pytest.fail(f"{pattern!r} was not found in the output:\n" + "\n".join(self.lines))
+
+    def __read(self, process: "subprocess.Popen[str]") -> None:
+        assert process.stdout is not None
+        for line in process.stdout:
+            self.lines.append(line.rstrip("\n"))
+            self.__queue.put(line.rstrip("\n"))
+
+
+def _edit(path: Path, old: str, new: str) -> None:
+    source = path.read_text()
+    assert old in source
+    path.write_text(source.replace(old, new))
+
+    # NOTE: make sure the modification is noticed even on file systems with coarse timestamps.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
@@ -1,10 +1,11 @@
 import asyncio
 import typing as t
+from array import array
 from dataclasses import dataclass, replace
 
 import pytest
 
-from pytest_case_provider import inject_cases_func, inject_cases_method
+from pytest_case_provider import CaseTable, CaseTableRow, inject_cases_func, inject_cases_method
 from tests.stub.feature import FEATURE_PYTHON_3
 
 
@@ -126,6 +127,21 @@ def case_parametrize_foo(foo: int) -> MyCase:
     return MyCase(foo=foo)
 
 
+DOUBLES_TABLE = CaseTable(
+    {
+        "value": array("i", [1, 2, 3]),
+        "expected": array("i", [2, 4, 6]),
+    },
+    name="double_{value}",
+)
+
+
+@inject_cases_func().include(DOUBLES_TABLE)  # include cases from table rows
+def test_table_cases_injected(row: CaseTableRow) -> None:
+    assert isinstance(row, CaseTableRow), f"row: {type(row)}"
+    assert row.value * 2 == row.expected
+
+
 class TestClass:
     def test_without_case_injection(self) -> None:
         assert True
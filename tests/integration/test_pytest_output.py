@@ -79,6 +79,9 @@ def parse_report(prefix: str, outlines: t.Sequence[str]) -> Report:
                     "::test_parametrized_foo_case_injected[case_parametrize_foo-1]",
                     "::test_parametrized_foo_case_injected[case_parametrize_foo-2]",
                     "::test_parametrized_foo_case_injected[case_parametrize_foo-3]",
+                    "::test_table_cases_injected[double_1]",
+                    "::test_table_cases_injected[double_2]",
+                    "::test_table_cases_injected[double_3]",
                     "::test_without_case_injection",
                 },
                 skipped={
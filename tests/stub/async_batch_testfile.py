@@ -0,0 +1,23 @@
+# NOTE: this file should not run by original pytest.
+
+
+import asyncio
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func(batch=2)
+def test_batched_async_cases(number: int) -> None:
+    assert number > 0
+
+
+@test_batched_async_cases.case()
+async def case_one() -> int:
+    await asyncio.sleep(0)
+    return 1
+
+
+@test_batched_async_cases.case()
+async def case_two() -> int:
+    await asyncio.sleep(0)
+    return 2
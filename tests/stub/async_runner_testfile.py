@@ -0,0 +1,44 @@
+# NOTE: this file should not run by original pytest.
+
+
+import asyncio
+
+import pytest
+
+from pytest_case_provider import inject_cases_func
+
+OFFSET = 10
+LOOPS = set[asyncio.AbstractEventLoop]()
+
+
+@pytest.fixture
+async def offset() -> int:
+    await asyncio.sleep(0)
+    return OFFSET
+
+
+@inject_cases_func()
+def test_loop_is_shared(loop: asyncio.AbstractEventLoop) -> None:
+    LOOPS.add(loop)
+    assert len(LOOPS) == 1
+
+
+@test_loop_is_shared.case()
+async def case_first() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+@test_loop_is_shared.case()
+async def case_second() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+@inject_cases_func()
+def test_async_fixture_is_resolved(number: int) -> None:
+    assert number == OFFSET + 1
+
+
+@test_async_fixture_is_resolved.case()
+async def case_with_async_fixture(offset: int) -> int:
+    await asyncio.sleep(0)
+    return offset + 1
@@ -0,0 +1,33 @@
+# NOTE: this file should not run by original pytest.
+
+
+import pytest
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func(batch=3)
+def test_number_is_positive(number: int) -> None:
+    if number < 0:
+        pytest.fail(f"negative number: {number}")
+
+
+@inject_cases_func(batch=3, subtests=True).include(test_number_is_positive)
+def test_number_is_positive_subtests(number: int) -> None:
+    if number < 0:
+        pytest.fail(f"negative number: {number}")
+
+
+@test_number_is_positive.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_positive.case()
+def case_minus_two() -> int:
+    return -2
+
+
+@test_number_is_positive.case()
+def case_three() -> int:
+    return 3
@@ -0,0 +1,42 @@
+# NOTE: this file should not run by original pytest.
+
+
+import pytest
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func(batch=2)
+def test_number_is_positive(number: int) -> None:
+    assert number > 0
+
+
+@inject_cases_func(batch=2, subtests=True).include(test_number_is_positive)
+def test_number_is_positive_subtests(number: int) -> None:
+    assert number > 0
+
+
+@test_number_is_positive.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_positive.case()
+def case_minus_two() -> int:
+    return -2
+
+
+@test_number_is_positive.case()
+@pytest.mark.skip(reason="case is skipped")
+def case_skipped() -> int:
+    return 0
+
+
+@test_number_is_positive.case()
+def case_four() -> int:
+    return 4
+
+
+@test_number_is_positive.case()
+def case_five() -> int:
+    return 5
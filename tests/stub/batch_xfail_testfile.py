@@ -0,0 +1,51 @@
+# NOTE: this file should not run by original pytest.
+
+
+import pytest
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func(batch=10, subtests=True)
+def test_number_is_positive(number: int) -> None:
+    assert number > 0
+
+
+@inject_cases_func(batch=10).include(test_number_is_positive)
+def test_number_is_positive_batch(number: int) -> None:
+    assert number > 0
+
+
+@test_number_is_positive.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_positive.case()
+@pytest.mark.xfail(reason="number is negative")
+def case_minus_one() -> int:
+    return -1
+
+
+@test_number_is_positive.case()
+@pytest.mark.xfail(reason="number may be negative")
+def case_two() -> int:
+    return 2
+
+
+@test_number_is_positive.case()
+@pytest.mark.xfail(reason="number must be negative", strict=True)
+def case_three() -> int:
+    return 3
+
+
+@test_number_is_positive.case()
+@pytest.mark.xfail(raises=TypeError)
+def case_minus_four() -> int:
+    return -4
+
+
+@test_number_is_positive.case()
+@pytest.mark.xfail(run=False, reason="number is not checked")
+def case_five() -> int:
+    return 5
@@ -0,0 +1,19 @@
+# NOTE: this file should not run by original pytest.
+
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func()
+def test_sum_of_squares(size: int) -> None:
+    assert sum(i * i for i in range(size)) >= 0
+
+
+@test_sum_of_squares.case()
+def case_small() -> int:
+    return 10
+
+
+@test_sum_of_squares.case()
+def case_big() -> int:
+    return 10_000
@@ -0,0 +1,38 @@
+# NOTE: this file should not run by original pytest.
+
+
+import typing as t
+
+from pytest_case_provider import CaseStorage, inject_cases_func
+
+
+def build_case(value: int) -> t.Callable[[], int]:
+    def case() -> int:
+        return value
+
+    return case
+
+
+NUMBERS = CaseStorage[int]()
+for i in range(100):
+    NUMBERS.append(build_case(i), name=f"case_{i}")
+
+
+@inject_cases_func()
+def test_few(number: int) -> None:
+    assert number >= 0
+
+
+@test_few.case()
+def case_one() -> int:
+    return 1
+
+
+@inject_cases_func().include(NUMBERS, test_few)
+def test_many(number: int) -> None:
+    assert number >= 0
+
+
+@inject_cases_func().include(test_many)
+def test_nested(number: int) -> None:
+    assert number >= 0
@@ -0,0 +1,44 @@
+# NOTE: this file should not run by original pytest.
+
+
+import asyncio
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func(concurrent=5)
+async def test_number_is_positive(number: int) -> None:
+    await asyncio.sleep(0.5)
+    assert number > 0
+
+
+@test_number_is_positive.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_positive.case()
+async def case_two() -> int:
+    await asyncio.sleep(0)
+    return 2
+
+
+@test_number_is_positive.case()
+def case_minus_three() -> int:
+    return -3
+
+
+@test_number_is_positive.case()
+def case_four() -> int:
+    return 4
+
+
+@test_number_is_positive.case()
+def case_five() -> int:
+    return 5
+
+
+@inject_cases_func(concurrent=2, batch=2).include(test_number_is_positive)
+async def test_number_is_positive_in_batches(number: int) -> None:
+    await asyncio.sleep(0)
+    assert number > 0
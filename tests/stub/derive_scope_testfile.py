@@ -0,0 +1,66 @@
+# NOTE: this file should not run by original pytest.
+
+
+import typing as t
+from pathlib import Path
+
+from pytest_case_provider import CaseStorage, inject_cases_func
+
+CALLS = list[str]()
+
+path_cases = CaseStorage[Path]()
+connection_cases = CaseStorage["Connection"]()
+
+
+class Connection:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+@path_cases.case()
+def case_file(tmp_path: Path) -> t.Iterator[Path]:
+    path = tmp_path / "data.txt"
+    path.write_text("data")
+    CALLS.append("create")
+    yield path
+    # NOTE: teardown runs while `tmp_path` of the test still exists.
+    CALLS.append(f"remove:{path.exists()}")
+
+
+@connection_cases.case()
+async def case_connection() -> t.AsyncIterator[Connection]:
+    connection = Connection()
+    yield connection
+    connection.closed = True
+
+
+def read_text(path: Path) -> str:
+    CALLS.append("read")
+    return path.read_text()
+
+
+def is_open(connection: Connection) -> bool:
+    return not connection.closed
+
+
+text_cases = path_cases.derive(read_text, name="text_{case}")
+open_cases = connection_cases.derive(is_open, name="open_{case}")
+
+
+@inject_cases_func().include(text_cases)
+def test_text_of_first_test(text: str) -> None:
+    assert text == "data"
+
+
+@inject_cases_func().include(text_cases)
+def test_text_of_second_test(text: str) -> None:
+    assert text == "data"
+
+
+@inject_cases_func().include(open_cases)
+def test_upstream_connection_is_open(is_open: bool) -> None:  # noqa: FBT001
+    assert is_open
+
+
+def test_values_are_built_for_each_test() -> None:
+    assert CALLS == ["create", "read", "remove:True", "create", "read", "remove:True"]
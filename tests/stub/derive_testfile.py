@@ -0,0 +1,52 @@
+# NOTE: this file should not run by original pytest.
+
+
+import asyncio
+import typing as t
+
+from pytest_case_provider import CaseStorage, inject_cases_func
+
+CALLS = list[str]()
+
+raw_cases = CaseStorage[str]()
+
+
+@raw_cases.case()
+def case_numbers() -> t.Iterator[str]:
+    CALLS.append("load")
+    yield "1,2,3"
+    CALLS.append("unload")
+
+
+def parse(raw: str) -> list[int]:
+    CALLS.append("parse")
+    return [int(item) for item in raw.split(",")]
+
+
+async def total(items: list[int]) -> int:
+    await asyncio.sleep(0)
+    CALLS.append("total")
+    return sum(items)
+
+
+parsed_cases = raw_cases.derive(parse, name="parsed_{case}")
+total_cases = parsed_cases.derive(total, name="total_{case}")
+
+
+@inject_cases_func().include(parsed_cases)
+def test_parsed_items_are_positive(items: list[int]) -> None:
+    assert all(item > 0 for item in items)
+
+
+@inject_cases_func().include(parsed_cases)
+def test_parsed_items_are_sorted(items: list[int]) -> None:
+    assert items == sorted(items)
+
+
+@inject_cases_func().include(total_cases)
+def test_total(value: int) -> None:
+    assert value == 6  # noqa: PLR2004
+
+
+def test_each_stage_is_computed_once() -> None:
+    assert CALLS == ["load", "parse", "total"]
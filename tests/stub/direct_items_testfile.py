@@ -0,0 +1,50 @@
+# NOTE: this file should not run by original pytest.
+
+
+import pytest
+
+from pytest_case_provider import inject_cases_func, inject_cases_method
+
+
+@pytest.fixture(scope="module")
+def limit() -> int:
+    return 100
+
+
+@inject_cases_func()
+def test_number_is_below_limit(number: int, limit: int) -> None:
+    assert number < limit
+
+
+@test_number_is_below_limit.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_below_limit.case(marks=[pytest.mark.skip(reason="not ready")])
+def case_two() -> int:
+    return 2
+
+
+@test_number_is_below_limit.case()
+def case_limit(limit: int) -> int:
+    return limit
+
+
+@inject_cases_func()
+@pytest.mark.parametrize("factor", [1, 2])
+def test_scaled_number_is_positive(number: int, factor: int) -> None:
+    assert number * factor > 0
+
+
+test_scaled_number_is_positive.include(test_number_is_below_limit)
+
+
+class TestClass:
+    @inject_cases_method()
+    def test_text_is_lower(self, text: str) -> None:
+        assert text.islower()
+
+    @test_text_is_lower.case()
+    def case_foo(self) -> str:
+        return "foo"
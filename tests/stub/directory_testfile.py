@@ -0,0 +1,20 @@
+# NOTE: this file should not run by original pytest.
+
+
+import json
+import typing as t
+from pathlib import Path
+
+from pytest_case_provider import CaseStorage, inject_cases_func
+
+
+def load_data(path: Path) -> dict[str, str]:
+    return t.cast("dict[str, str]", json.loads(path.read_text()))
+
+
+DATA_CASES = CaseStorage.from_directory(Path(__file__).parent / "data", "*.json", load_data)
+
+
+@inject_cases_func().include(DATA_CASES)
+def test_data_has_name(data: dict[str, str]) -> None:
+    assert data["name"]
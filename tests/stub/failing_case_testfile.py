@@ -0,0 +1,29 @@
+# NOTE: this file should not run by original pytest.
+
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func()
+def test_number_is_positive(number: int) -> None:
+    assert number > 0
+
+
+@test_number_is_positive.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_positive.case()
+def case_two() -> int:
+    return 2
+
+
+@test_number_is_positive.case()
+def case_minus_three() -> int:
+    return -3
+
+
+@test_number_is_positive.case()
+def case_four() -> int:
+    return 4
@@ -0,0 +1,31 @@
+# NOTE: this file should not run by original pytest.
+
+
+import typing as t
+
+from _pytest.nodes import Item
+from _pytest.python import FunctionDefinition
+
+from pytest_case_provider.abc import CaseParametrizer
+from pytest_case_provider.case.info import CaseInfo
+
+
+def pytest_case_collect(
+    definition: FunctionDefinition,
+    storage: CaseParametrizer[object],
+    cases: t.Sequence[CaseInfo[object]],
+    duration: float,
+) -> None:
+    print(f"\ncollect {definition.name}: {[case.name for case in cases]} {duration >= 0}")  # noqa: T201
+
+
+def pytest_case_provide_start(item: Item, case_info: CaseInfo[object]) -> None:
+    print(f"\nprovide start {item.name}: {case_info.name}")  # noqa: T201
+
+
+def pytest_case_provide_finish(item: Item, case_info: CaseInfo[object], duration: float) -> None:
+    print(f"\nprovide finish {item.name}: {case_info.name} {duration >= 0}")  # noqa: T201
+
+
+def pytest_case_teardown(item: Item, case_info: CaseInfo[object], duration: float) -> None:
+    print(f"\nteardown {item.name}: {case_info.name} {duration >= 0}")  # noqa: T201
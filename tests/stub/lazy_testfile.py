@@ -0,0 +1,49 @@
+# NOTE: this file should not run by original pytest.
+
+
+import asyncio
+import typing as t
+
+import pytest
+
+from pytest_case_provider import inject_cases_func
+
+EVENTS = list[str]()
+
+
+@inject_cases_func()
+def test_number_is_positive(number: int) -> None:
+    if not EVENTS:
+        pytest.skip("case value is not needed")
+
+    assert number > 0
+
+
+@test_number_is_positive.case(lazy=True)
+def case_never_touched() -> t.Iterator[int]:
+    EVENTS.append("never touched")
+    yield 1
+
+
+@test_number_is_positive.case(lazy=True)
+def case_sync() -> t.Iterator[int]:
+    yield 1
+
+
+@inject_cases_func()
+def test_events(number: int) -> None:
+    EVENTS.append("touched")
+    assert number > 0
+    assert EVENTS == ["touched", "async built"]
+
+
+@test_events.case(lazy=True)
+async def case_async() -> t.AsyncIterator[int]:
+    await asyncio.sleep(0)
+    EVENTS.append("async built")
+    yield 2
+    EVENTS.append("async teardown")
+
+
+def test_async_teardown_at_item_teardown() -> None:
+    assert EVENTS == ["touched", "async built", "async teardown"]
@@ -0,0 +1,52 @@
+# NOTE: this file should not run by original pytest.
+
+
+from pytest_case_provider import inject_cases_func
+
+PROVIDED = list[int]()
+
+
+@inject_cases_func()
+def test_broken(number: int) -> None:
+    assert number < 0
+
+
+@test_broken.case()
+def case_one() -> int:
+    PROVIDED.append(1)
+    return 1
+
+
+@test_broken.case()
+def case_two() -> int:
+    PROVIDED.append(2)
+    return 2
+
+
+@test_broken.case()
+def case_three() -> int:
+    PROVIDED.append(3)
+    return 3
+
+
+@test_broken.case()
+def case_four() -> int:
+    PROVIDED.append(4)
+    return 4
+
+
+@inject_cases_func()
+def test_number_is_positive(number: int) -> None:
+    assert number > 0
+
+
+test_number_is_positive.include(test_broken)
+
+
+@test_number_is_positive.case()
+def case_negative() -> int:
+    return -1
+
+
+def test_providers_of_skipped_cases_were_not_invoked() -> None:
+    assert PROVIDED == [1, 2, 1, 2, 3, 4]
@@ -0,0 +1,34 @@
+# NOTE: this file should not run by original pytest.
+
+
+import typing as t
+
+import pytest
+
+from pytest_case_provider import inject_cases_func
+
+LEAKED = list[bytes]()
+
+
+@pytest.mark.parametrize("attempt", range(3))
+@inject_cases_func()
+def test_payload_is_not_empty(payload: bytes, attempt: int) -> None:
+    assert payload
+    assert attempt >= 0
+
+
+@test_payload_is_not_empty.case()
+def case_heavy() -> bytes:
+    return b"x" * 4_000_000
+
+
+@test_payload_is_not_empty.case()
+def case_leaky() -> t.Iterator[bytes]:
+    payload = b"y" * 100_000
+    LEAKED.append(payload)
+    yield payload
+
+
+@test_payload_is_not_empty.case()
+def case_light() -> bytes:
+    return b"z"
@@ -0,0 +1,14 @@
+# NOTE: this file should not run by original pytest.
+
+
+from pytest_case_provider import inject_cases_method
+
+
+class TestNumbers:
+    @inject_cases_method(cases="lazycases.*")
+    def test_number_is_positive(self, number: int) -> None:
+        assert number > 0
+
+    @test_number_is_positive.case()
+    def case_local(self) -> int:
+        return 10
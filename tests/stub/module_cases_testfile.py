@@ -0,0 +1,14 @@
+# NOTE: this file should not run by original pytest.
+
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func(cases="lazycases.*")
+def test_number_is_positive(number: int) -> None:
+    assert number > 0
+
+
+@test_number_is_positive.case()
+def case_local() -> int:
+    return 10
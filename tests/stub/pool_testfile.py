@@ -0,0 +1,48 @@
+# NOTE: this file should not run by original pytest.
+
+
+import itertools
+import typing as t
+
+from pytest_case_provider import CasePool, inject_cases_func
+
+COUNTER = itertools.count()
+
+
+def create_store() -> dict[str, int]:
+    return {"id": next(COUNTER)}
+
+
+def reset_store(store: dict[str, int]) -> None:
+    for key in list(store):
+        if key != "id":
+            del store[key]
+
+
+store_pool = CasePool(create_store, reset=reset_store, warm=1)
+
+
+@inject_cases_func()
+def test_store_is_clean(store: dict[str, int]) -> None:
+    assert store == {"id": 0, "value": store["value"]}
+
+
+@test_store_is_clean.case()
+def case_one() -> t.Iterator[dict[str, int]]:
+    with store_pool.acquire() as store:
+        store["value"] = 1
+        yield store
+
+
+@test_store_is_clean.case()
+def case_two() -> t.Iterator[dict[str, int]]:
+    with store_pool.acquire() as store:
+        store["value"] = 2
+        yield store
+
+
+@test_store_is_clean.case()
+async def case_async() -> t.AsyncIterator[dict[str, int]]:
+    async with store_pool.acquire_async() as store:
+        store["value"] = 3
+        yield store
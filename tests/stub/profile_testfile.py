@@ -0,0 +1,30 @@
+# NOTE: this file should not run by original pytest.
+
+
+import time
+
+import pytest
+
+from pytest_case_provider import inject_cases_func
+
+
+def build_slow_value() -> int:
+    time.sleep(0.05)
+    return 2
+
+
+@pytest.mark.parametrize("attempt", range(2))
+@inject_cases_func()
+def test_number_is_positive(number: int, attempt: int) -> None:
+    assert number > 0
+    assert attempt >= 0
+
+
+@test_number_is_positive.case()
+def case_fast() -> int:
+    return 1
+
+
+@test_number_is_positive.case()
+def case_slow() -> int:
+    return build_slow_value()
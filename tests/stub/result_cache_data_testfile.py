@@ -0,0 +1,55 @@
+# NOTE: this file should not run by original pytest.
+
+
+import threading
+
+from pytest_case_provider import CaseTable, CaseTableRow, inject_cases_func
+
+EXPECTED = {"one": 1, "two": 2}
+LOCK = threading.Lock()
+TABLE = CaseTable({"x": [1, 2]})
+
+
+class Limits:
+    MAX = 10
+
+
+@inject_cases_func()
+def test_name_is_expected(name: str) -> None:
+    assert name in EXPECTED
+
+
+@test_name_is_expected.case()
+def case_one() -> str:
+    return "one"
+
+
+@test_name_is_expected.case()
+def case_two() -> str:
+    return "two"
+
+
+@inject_cases_func().include(TABLE)
+def test_row_is_small(row: CaseTableRow) -> None:
+    assert row.x < 3  # noqa: PLR2004
+
+
+@inject_cases_func()
+def test_number_is_positive_under_lock(number: int) -> None:
+    with LOCK:
+        assert number > 0
+
+
+@test_number_is_positive_under_lock.case()
+def case_positive() -> int:
+    return 1
+
+
+@inject_cases_func()
+def test_number_is_below_limit(number: int) -> None:
+    assert number < Limits.MAX
+
+
+@test_number_is_below_limit.case()
+def case_five() -> int:
+    return 5
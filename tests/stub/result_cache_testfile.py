@@ -0,0 +1,30 @@
+# NOTE: this file should not run by original pytest.
+
+
+from pytest_case_provider import inject_cases_func
+
+LIMIT = 10
+
+
+def is_small(number: int) -> bool:
+    return number < LIMIT
+
+
+@inject_cases_func()
+def test_number_is_small(number: int) -> None:
+    assert is_small(number)
+
+
+@test_number_is_small.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_small.case()
+def case_two() -> int:
+    return 2
+
+
+@test_number_is_small.case()
+def case_big() -> int:
+    return 100
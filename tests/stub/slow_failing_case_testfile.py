@@ -0,0 +1,27 @@
+# NOTE: this file should not run by original pytest.
+
+
+import time
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func()
+def test_number_is_positive(number: int) -> None:
+    assert number > 0
+
+
+@test_number_is_positive.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_positive.case()
+def case_minus_two() -> int:
+    time.sleep(0.2)
+    return -2
+
+
+@test_number_is_positive.case()
+def case_minus_three() -> int:
+    return -3
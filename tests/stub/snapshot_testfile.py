@@ -0,0 +1,54 @@
+# NOTE: this file should not run by original pytest.
+
+
+from pathlib import Path
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+from pytest_case_provider import inject_cases_func
+
+
+@pytest.fixture(params=[1, 2, 3])
+def size(request: SubRequest) -> int:
+    return int(request.param)
+
+
+@pytest.fixture
+def test_name(request: SubRequest) -> str:
+    return str(request.node.name)
+
+
+@inject_cases_func()
+def test_items_have_size(items: list[int], size: int) -> None:
+    assert len(items) == size
+    items.append(0)
+
+
+@inject_cases_func().include(test_items_have_size)
+def test_items_have_size_again(items: list[int], size: int) -> None:
+    assert len(items) == size
+    items.append(0)
+
+
+@test_items_have_size.case(isolation="snapshot")
+def case_items(size: int) -> list[int]:
+    with Path("built").open("a") as fd:
+        fd.write(f"{size}\n")
+
+    return list(range(size))
+
+
+@inject_cases_func()
+def test_label_is_test_name(label: list[str], test_name: str) -> None:
+    assert label == [test_name]
+
+
+@test_label_is_test_name.case(isolation="snapshot")
+def case_label(test_name: str) -> list[str]:
+    return [test_name]
+
+
+@inject_cases_func().include(test_label_is_test_name)
+def test_label_is_test_name_again(label: list[str], test_name: str) -> None:
+    assert label == [test_name]
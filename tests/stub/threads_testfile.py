@@ -0,0 +1,24 @@
+# NOTE: this file should not run by original pytest.
+
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func(threads=4)
+def test_number_is_positive(number: int) -> None:
+    assert number > 0
+
+
+@test_number_is_positive.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_positive.case()
+def case_minus_two() -> int:
+    return -2
+
+
+@test_number_is_positive.case()
+def case_three() -> int:
+    return 3
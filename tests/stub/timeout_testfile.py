@@ -0,0 +1,30 @@
+# NOTE: this file should not run by original pytest.
+
+
+import asyncio
+import time
+
+from pytest_case_provider import inject_cases_func
+
+
+@inject_cases_func()
+def test_number_is_positive(number: int) -> None:
+    assert number > 0
+
+
+@test_number_is_positive.case()
+async def case_fast() -> int:
+    await asyncio.sleep(0)
+    return 1
+
+
+@test_number_is_positive.case(timeout=0.1)
+async def case_hung() -> int:
+    await asyncio.sleep(60)
+    return 2
+
+
+@test_number_is_positive.case(timeout=0.01)
+def case_slow_sync() -> int:
+    time.sleep(0.05)
+    return 3
@@ -0,0 +1,25 @@
+# NOTE: this file should not run by original pytest.
+
+
+from pytest_case_provider import inject_cases_func
+
+MINIMUM = 0
+
+
+@inject_cases_func()
+def test_number_is_positive(number: int) -> None:
+    assert number > MINIMUM
+
+
+@test_number_is_positive.case()
+def case_one() -> int:
+    return 1
+
+
+@test_number_is_positive.case()
+def case_two() -> int:
+    return 2
+
+
+def test_plain() -> None:
+    assert True
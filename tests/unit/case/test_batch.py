@@ -0,0 +1,137 @@
+import asyncio
+import threading
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+from pytest_case_provider.case import batch
+from pytest_case_provider.case.batch import CaseBatch, CaseBatchError, CaseBatchRunner
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.options import CaseBatchOptions
+from pytest_case_provider.case.provider import CaseProvider
+
+
+@pytest.mark.parametrize(("concurrency", "expected_running"), [(1, 1), (3, 3), (10, 5)])
+async def test_batch_runs_async_cases_concurrently(
+    request: SubRequest,
+    concurrency: int,
+    expected_running: int,
+) -> None:
+    running = 0
+    max_running = 0
+
+    async def check_number(number: int) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        assert number % 2 == 0
+
+    runner = CaseBatchRunner(CaseBatch(build_cases(5), CaseBatchOptions(size=5, concurrency=concurrency)), request)
+
+    coro = runner.run(check_number, "number", [], {})
+    assert coro is not None
+
+    with pytest.raises(CaseBatchError) as err:
+        await coro
+
+    assert max_running == expected_running
+    assert err.value.total == 5  # noqa: PLR2004
+    assert [failure.case.name for failure in err.value.failures] == ["case_1", "case_3"]
+
+
+async def test_batch_records_explicitly_failed_async_cases(request: SubRequest) -> None:
+    finished = list[int]()
+
+    async def check_number(number: int) -> None:
+        await asyncio.sleep(0.01 * number)
+        finished.append(number)
+        if number % 2:
+            pytest.fail(f"odd number: {number}")
+
+    runner = CaseBatchRunner(CaseBatch(build_cases(5), CaseBatchOptions(size=5, concurrency=5)), request)
+
+    coro = runner.run(check_number, "number", [], {})
+    assert coro is not None
+
+    with pytest.raises(CaseBatchError) as err:
+        await coro
+
+    assert finished == [0, 1, 2, 3, 4]
+    assert [failure.case.name for failure in err.value.failures] == ["case_1", "case_3"]
+
+
+async def test_batch_cancels_async_cases_on_exit(request: SubRequest) -> None:
+    cancelled = list[int]()
+
+    async def check_number(number: int) -> None:
+        if number == 0:
+            pytest.exit("stop")
+
+        try:
+            await asyncio.sleep(10.0)
+
+        except asyncio.CancelledError:
+            cancelled.append(number)
+            raise
+
+    runner = CaseBatchRunner(CaseBatch(build_cases(3), CaseBatchOptions(size=3, concurrency=3)), request)
+
+    coro = runner.run(check_number, "number", [], {})
+    assert coro is not None
+
+    with pytest.raises(pytest.exit.Exception):
+        await coro
+
+    assert sorted(cancelled) == [1, 2]
+
+
+@pytest.mark.parametrize(("gil_enabled", "expected_threads"), [(True, 1), (False, 3)])
+def test_batch_runs_sync_cases_in_threads(
+    monkeypatch: pytest.MonkeyPatch,
+    request: SubRequest,
+    gil_enabled: bool,  # noqa: FBT001
+    expected_threads: int,
+) -> None:
+    monkeypatch.setattr(batch, "is_gil_enabled", lambda: gil_enabled)
+    barrier = threading.Barrier(expected_threads, timeout=5.0)
+    threads = set[str]()
+
+    def check_number(number: int) -> None:
+        # NOTE: cases wait for each other, so each of them runs in its own thread.
+        if number < expected_threads:
+            barrier.wait()
+
+        threads.add(threading.current_thread().name)
+        assert number % 2 == 0
+
+    runner = CaseBatchRunner(CaseBatch(build_cases(5), CaseBatchOptions(size=5, threads=3)), request)
+
+    with pytest.raises(CaseBatchError) as err:
+        runner.run(check_number, "number", [], {})
+
+    assert len(threads) == expected_threads
+    assert [failure.case.name for failure in err.value.failures] == ["case_1", "case_3"]
+
+
+@pytest.mark.parametrize(
+    ("concurrency", "threads", "error"),
+    [
+        (0, 1, "batch concurrency must be positive"),
+        (1, 0, "batch threads must be positive"),
+    ],
+)
+def test_batch_options_reject_non_positive_values(concurrency: int, threads: int, error: str) -> None:
+    with pytest.raises(ValueError, match=error):
+        CaseBatchOptions(size=1, concurrency=concurrency, threads=threads)
+
+
+def build_cases(count: int) -> list[CaseInfo[object]]:
+    def build_provider(number: int) -> CaseProvider[object]:
+        def provide_number() -> int:
+            return number
+
+        return CaseProvider(provide_number)
+
+    return [CaseInfo(f"case_{number}", build_provider(number)) for number in range(count)]
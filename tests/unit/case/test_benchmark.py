@@ -0,0 +1,28 @@
+import pytest
+
+from pytest_case_provider.case.benchmark import CaseBenchmarkStats
+
+
+def test_stats_are_robust_to_outliers() -> None:
+    stats = CaseBenchmarkStats.from_rounds([1.0, 1.1, 0.9, 1.0, 100.0], loops=10)
+
+    assert stats.median == pytest.approx(1.0)
+    assert stats.mad == pytest.approx(0.1)
+    assert stats.min == pytest.approx(0.9)
+    assert stats.rounds == 5  # noqa: PLR2004
+    assert stats.loops == 10  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("median", "mad", "expected"),
+    [
+        pytest.param(1.05, 0.01, False, id="within threshold"),
+        pytest.param(1.5, 0.01, True, id="past threshold"),
+        pytest.param(1.5, 0.5, False, id="within noise"),
+    ],
+)
+def test_stats_regression(median: float, mad: float, expected: bool) -> None:  # noqa: FBT001
+    baseline = CaseBenchmarkStats(median=1.0, mad=0.01, min=1.0, rounds=5, loops=1)
+    stats = CaseBenchmarkStats(median=median, mad=mad, min=median, rounds=5, loops=1)
+
+    assert stats.is_regressed(baseline, threshold=0.1) is expected
@@ -0,0 +1,86 @@
+import asyncio
+import time
+import typing as t
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+from pytest_case_provider.case.budget import CaseProviderTimeoutError, CaseProvisionBudget
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.provider import CaseProvider, CaseProviderFunc
+from tests.stub.provider_func import provide_int, provide_int_async, provide_int_async_iter
+
+_SIMPLE_INT_VALUE = 42
+
+
+@pytest.mark.parametrize("func", [provide_int_async, provide_int_async_iter])
+async def test_budget_provide_async(  # type: ignore[misc]
+    request: SubRequest,
+    func: CaseProviderFunc[t.Any, int],
+) -> None:
+    budget = CaseProvisionBudget(timeout=1.0, concurrency=1)
+
+    async with budget.provide_async(CaseInfo("case", CaseProvider(func)), request) as value:
+        assert value == _SIMPLE_INT_VALUE
+
+
+def test_budget_provide_sync(request: SubRequest) -> None:
+    budget = CaseProvisionBudget(timeout=1.0)
+
+    with budget.provide_sync(CaseInfo("case", CaseProvider(provide_int)), request) as value:
+        assert value == _SIMPLE_INT_VALUE
+
+
+async def test_budget_cancels_hung_async_provider(request: SubRequest) -> None:
+    async def case_hung() -> int:
+        await asyncio.sleep(60)
+        return 0
+
+    budget = CaseProvisionBudget(timeout=0.01)
+
+    with pytest.raises(CaseProviderTimeoutError) as err:
+        async with budget.provide_async(CaseInfo("case_hung", CaseProvider[int](case_hung)), request):
+            pytest.fail("should not provide value")
+
+    assert err.value.case == "case_hung"
+    assert err.value.elapsed >= err.value.timeout
+
+
+def test_budget_case_timeout_overrides_default(request: SubRequest) -> None:
+    def case_slow() -> int:
+        time.sleep(0.01)
+        return 0
+
+    budget = CaseProvisionBudget(timeout=60.0)
+
+    with pytest.raises(CaseProviderTimeoutError, match="case 'case_slow' provider setup timed out"):
+        with budget.provide_sync(CaseInfo("case_slow", CaseProvider[int](case_slow), timeout=0.001), request):
+            pytest.fail("should not provide value")
+
+
+async def test_budget_limits_async_provider_concurrency(request: SubRequest) -> None:
+    running = 0
+    max_running = 0
+
+    async def case_tracked() -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return 0
+
+    budget = CaseProvisionBudget(concurrency=2)
+
+    async def provide() -> None:
+        async with budget.provide_async(CaseInfo("case_tracked", CaseProvider[int](case_tracked)), request):
+            pass
+
+    await asyncio.gather(*(provide() for _ in range(5)))
+
+    assert max_running == 2  # noqa: PLR2004
+
+
+def test_budget_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="concurrency must be positive"):
+        CaseProvisionBudget(concurrency=0)
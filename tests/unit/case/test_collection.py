@@ -0,0 +1,12 @@
+from pytest_case_provider.case.collection import measure_include_graph
+from pytest_case_provider.case.storage import CaseStorage, CompositeCaseStorage
+
+
+def test_measure_include_graph() -> None:
+    leaf = CaseStorage[int]()
+    shared = CompositeCaseStorage[int](leaf)
+    root = CompositeCaseStorage[int](shared, CompositeCaseStorage(shared, leaf), leaf.derive(lambda value: value + 1))
+
+    assert measure_include_graph(leaf) == (1, 0)
+    assert measure_include_graph(shared) == (2, 1)
+    assert measure_include_graph(root) == (4, 3)
@@ -0,0 +1,84 @@
+import os
+import typing as t
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+from pytest_case_provider.case.directory import DirectoryCaseCollector, DirectoryIndex, scan_directory
+
+
+def test_scan_directory_finds_matching_files(data_dir: Path) -> None:
+    index = scan_directory(data_dir, "*.json", max_workers=2)
+
+    assert index.files == ["a.json", "nested/b.json", "nested/deeper/c.json"]
+    assert set(index.dirs) == {".", "nested", "nested/deeper"}
+    assert index.is_valid(data_dir)
+
+
+def test_directory_index_is_invalidated_by_new_file(data_dir: Path) -> None:
+    index = scan_directory(data_dir, "*.json")
+
+    (data_dir / "nested" / "deeper" / "d.json").write_text("{}")
+
+    assert not index.is_valid(data_dir)
+
+
+def test_directory_index_is_invalidated_by_file_added_during_scan(
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: Path,
+) -> None:
+    scandir = os.scandir
+    # NOTE: timestamps of the file system may be coarse, so the directory is made older than the change.
+    os.utime(data_dir, ns=(0, 0))
+
+    @contextmanager
+    def scandir_and_add_file(path: Path) -> t.Iterator[t.Iterator[os.DirEntry[str]]]:
+        with scandir(path) as entries:
+            yield entries
+
+        if Path(path) == data_dir:
+            (data_dir / "d.json").write_text("{}")
+
+    monkeypatch.setattr(os, "scandir", scandir_and_add_file)
+    index = scan_directory(data_dir, "*.json")
+
+    assert "d.json" not in index.files
+    assert not index.is_valid(data_dir)
+
+
+def test_directory_index_json_roundtrip(data_dir: Path) -> None:
+    index = scan_directory(data_dir, "*.json")
+
+    assert DirectoryIndex.from_json(index.to_json()) == DirectoryIndex(dirs=dict(index.dirs), files=list(index.files))
+    assert DirectoryIndex.from_json({"dirs": {}}) is None
+    assert DirectoryIndex.from_json({"dirs": {}, "files": [["a.json", 1, 2]]}) is None
+
+
+def test_directory_collector_loads_files_on_provision(request: SubRequest, data_dir: Path) -> None:
+    loaded = list[Path]()
+
+    def load(path: Path) -> str:
+        loaded.append(path)
+        return path.read_text()
+
+    cases = list(DirectoryCaseCollector(data_dir, "nested/*.json", load).collect_cases())
+
+    assert [case.name for case in cases] == ["nested/b.json", "nested/deeper/c.json"]
+    assert loaded == []
+
+    with cases[0].provider.provide_sync(request) as value:
+        assert value == '{"name": "b"}'
+
+    assert loaded == [data_dir / "nested" / "b.json"]
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    (tmp_path / "a.json").write_text('{"name": "a"}')
+    (tmp_path / "readme.txt").write_text("not a case")
+    (tmp_path / "nested" / "b.json").write_text('{"name": "b"}')
+    (tmp_path / "nested" / "deeper" / "c.json").write_text('{"name": "c"}')
+    return tmp_path
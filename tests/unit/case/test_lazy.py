@@ -0,0 +1,155 @@
+import typing as t
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+from pytest_case_provider.case.lazy import LazyCaseProvider, LazyCaseProxy, unwrap_lazy_case
+from pytest_case_provider.case.provider import CaseProvider
+
+
+def test_proxy_resolves_value_on_first_access() -> None:
+    calls = list[int]()
+
+    def resolve() -> list[int]:
+        calls.append(1)
+        return [1, 2]
+
+    proxy = t.cast("t.Any", LazyCaseProxy(resolve))
+    assert repr(proxy) == "<LazyCaseProxy: unresolved>"
+    assert calls == []
+
+    assert len(proxy) == 2  # noqa: PLR2004
+    assert proxy[0] == 1
+    assert list(proxy) == [1, 2]
+    assert proxy == [1, 2]
+    assert isinstance(proxy, list)
+    assert repr(proxy) == "[1, 2]"
+    assert calls == [1]
+
+
+def test_proxy_forwards_operators_and_attributes() -> None:
+    proxy = t.cast("t.Any", LazyCaseProxy(lambda: 10))
+
+    assert proxy + 1 == 11  # noqa: PLR2004
+    assert 1 + proxy == 11  # noqa: PLR2004
+    assert proxy * 2 == 20  # noqa: PLR2004
+    assert proxy > 5  # noqa: PLR2004
+    assert proxy.bit_length() == 4  # noqa: PLR2004
+    assert unwrap_lazy_case(proxy) == 10  # noqa: PLR2004
+    assert type(unwrap_lazy_case(proxy)) is int
+
+
+def test_proxy_forwards_unary_and_bitwise_operators() -> None:
+    proxy = t.cast("t.Any", LazyCaseProxy(lambda: -10))
+
+    assert (-proxy, +proxy, abs(proxy), ~proxy) == (10, -10, 10, 9)
+    assert (proxy << 1, proxy >> 1, 1 << t.cast("t.Any", LazyCaseProxy(lambda: 2))) == (-20, -5, 4)
+    assert (divmod(proxy, 3), round(proxy / 4), round(LazyCaseProxy(lambda: 1.25), 1)) == ((-4, 2), -2, 1.2)
+
+
+def test_proxy_forwards_matmul() -> None:
+    class Matrix:
+        def __matmul__(self, other: object) -> str:
+            return "matmul"
+
+        def __rmatmul__(self, other: object) -> str:
+            return "rmatmul"
+
+    proxy = t.cast("t.Any", LazyCaseProxy(Matrix))
+
+    assert (proxy @ 1, 1 @ proxy) == ("matmul", "rmatmul")
+
+
+def test_proxy_forwards_inplace_operators_to_value() -> None:
+    items = [1]
+    proxy = t.cast("t.Any", LazyCaseProxy(lambda: items))
+    alias = proxy
+
+    proxy += [2]
+    number = t.cast("t.Any", LazyCaseProxy(lambda: 1))
+    number += 1
+
+    assert proxy is alias
+    assert items == [1, 2]
+    assert (number, type(number)) == (2, int)
+
+
+def test_proxy_forwards_context_manager() -> None:
+    calls = list[str]()
+
+    class Resource:
+        def __enter__(self) -> str:
+            calls.append("enter")
+            return "resource"
+
+        def __exit__(self, *exc_info: object) -> None:
+            calls.append("exit")
+
+    with t.cast("t.Any", LazyCaseProxy(Resource)) as value:
+        assert value == "resource"
+
+    assert calls == ["enter", "exit"]
+
+
+async def test_proxy_forwards_async_protocols() -> None:
+    class Numbers:
+        def __init__(self) -> None:
+            self.left = [1, 2]
+
+        def __aiter__(self) -> "Numbers":
+            return self
+
+        async def __anext__(self) -> int:
+            if not self.left:
+                raise StopAsyncIteration
+
+            return self.left.pop(0)
+
+    async def compute() -> int:
+        return 42
+
+    assert [number async for number in t.cast("t.Any", LazyCaseProxy(Numbers))] == [1, 2]
+    assert await t.cast("t.Any", LazyCaseProxy(compute)) == 42  # noqa: PLR2004
+
+
+def test_lazy_provider_skips_untouched_value(request: SubRequest) -> None:
+    calls = list[str]()
+
+    def case_items() -> t.Iterator[list[int]]:
+        calls.append("setup")
+        yield [1]
+        calls.append("teardown")
+
+    provider = LazyCaseProvider(CaseProvider[list[int]](case_items))
+
+    with provider.provide_sync(request):
+        pass
+
+    assert calls == []
+
+
+def test_lazy_provider_tears_value_down_on_exit(request: SubRequest) -> None:
+    calls = list[str]()
+
+    def case_items() -> t.Iterator[list[int]]:
+        calls.append("setup")
+        yield [1]
+        calls.append("teardown")
+
+    provider = LazyCaseProvider(CaseProvider[list[int]](case_items))
+
+    with provider.provide_sync(request) as value:
+        assert value == [1]
+        assert calls == ["setup"]
+
+    assert calls == ["setup", "teardown"]
+
+
+async def test_lazy_async_provider_is_rejected_in_running_loop(request: SubRequest) -> None:
+    async def case_async() -> int:
+        return 1
+
+    provider = LazyCaseProvider(CaseProvider[int](case_async))
+
+    with provider.provide_sync(request) as value, pytest.raises(TypeError, match="lazy async case provider"):
+        unwrap_lazy_case(value)
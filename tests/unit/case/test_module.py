@@ -0,0 +1,97 @@
+import sys
+import typing as t
+from pathlib import Path
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+from pytest_case_provider.case.module import CaseModuleCollector, find_case_modules, scan_case_module
+
+
+def test_scan_case_module_finds_providers_with_marks(cases_dir: Path) -> None:
+    entries = scan_case_module(cases_dir / "lazycases" / "numbers.py")
+
+    assert entries is not None
+    assert [(entry.name, entry.is_async) for entry in entries] == [("case_one", False), ("case_two", True)]
+    assert [mark.name for mark in entries[1].marks] == ["skipif", "xfail"]
+    assert entries[1].marks[0].args == (False,)
+    assert entries[1].marks[0].kwargs == {"reason": "never"}
+
+
+def test_scan_case_module_returns_none_for_non_static_marks(cases_dir: Path) -> None:
+    assert scan_case_module(cases_dir / "lazycases" / "dynamic.py") is None
+
+
+def test_scan_case_module_returns_none_for_marks_with_unbuildable_literals(cases_dir: Path) -> None:
+    (cases_dir / "lazycases" / "unhashable.py").write_text(
+        "import pytest\n\n@pytest.mark.skipif({[1]: 2}, reason='never')\ndef case_four() -> int:\n    return 4\n"
+    )
+
+    assert scan_case_module(cases_dir / "lazycases" / "unhashable.py") is None
+
+
+def test_find_case_modules_matches_glob(cases_dir: Path) -> None:
+    assert find_case_modules("lazycases.*") == [
+        ("lazycases.dynamic", cases_dir / "lazycases" / "dynamic.py"),
+        ("lazycases.numbers", cases_dir / "lazycases" / "numbers.py"),
+    ]
+    assert find_case_modules("lazycases.num*") == [("lazycases.numbers", cases_dir / "lazycases" / "numbers.py")]
+    assert find_case_modules("lazycases.missing") == []
+
+
+def test_case_module_collector_imports_module_on_provision(request: SubRequest, cases_dir: Path) -> None:
+    cases = list(CaseModuleCollector[int]("lazycases.numbers").collect_cases())
+
+    assert [case.name for case in cases] == ["case_one", "case_two"]
+    assert [case.provider.is_async for case in cases] == [False, True]
+    assert "lazycases.numbers" not in sys.modules
+
+    with cases[0].provider.provide_sync(request) as value:
+        assert value == 1
+
+    assert "lazycases.numbers" in sys.modules
+
+
+def test_case_module_collector_imports_module_with_non_static_marks(cases_dir: Path) -> None:
+    cases = list(CaseModuleCollector[int]("lazycases.dynamic").collect_cases())
+
+    assert [case.name for case in cases] == ["case_three"]
+    assert "lazycases.dynamic" in sys.modules
+
+
+def test_case_module_collector_fails_when_no_modules_found(cases_dir: Path) -> None:
+    with pytest.raises(LookupError, match="no case modules found"):
+        list(CaseModuleCollector[int]("lazycases.missing").collect_cases())
+
+
+@pytest.fixture
+def cases_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> t.Iterator[Path]:
+    package = tmp_path / "lazycases"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "numbers.py").write_text(
+        "import pytest\n"
+        "\n"
+        "def case_one() -> int:\n"
+        "    return 1\n"
+        "\n"
+        "@pytest.mark.xfail\n"
+        "@pytest.mark.skipif(False, reason='never')\n"
+        "async def case_two() -> int:\n"
+        "    return 2\n"
+        "\n"
+        "def helper() -> int:\n"
+        "    return 0\n"
+    )
+    (package / "dynamic.py").write_text(
+        "def tagged(func):\n    return func\n\n@tagged\ndef case_three() -> int:\n    return 3\n"
+    )
+
+    monkeypatch.syspath_prepend(tmp_path)
+    for module in [name for name in sys.modules if name.startswith("lazycases")]:
+        monkeypatch.delitem(sys.modules, module)
+
+    yield tmp_path
+
+    for module in [name for name in sys.modules if name.startswith("lazycases")]:
+        del sys.modules[module]
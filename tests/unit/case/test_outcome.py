@@ -0,0 +1,83 @@
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from pytest_case_provider.case.outcome import CaseOutcome, CaseOutcomeRecorder, CaseOutcomeStore
+
+if t.TYPE_CHECKING:
+    from _pytest.cacheprovider import Cache
+    from _pytest.nodes import Item
+
+
+class DictCache:
+    def __init__(self) -> None:
+        self.values = dict[str, object]()
+
+    def get(self, key: str, default: object) -> object:
+        return self.values.get(key, default)
+
+    def set(self, key: str, value: object) -> None:
+        self.values[key] = value
+
+
+class FakeNode:
+    def __init__(self, nodeid: str, parent: t.Optional["FakeNode"] = None) -> None:
+        self.nodeid = nodeid
+        self.parent = parent
+        self.name = nodeid.rsplit("::", 1)[-1]
+        self.originalname = self.name.split("[", 1)[0]
+
+
+def test_outcome_store_skips_invalid_entries(cache: DictCache) -> None:
+    cache.values[CaseOutcomeStore.KEY] = {
+        "test_a.py::test_func": {
+            "case_one": {"failed": True, "failures": 2, "duration": 1},
+            "case_two": {"failed": "yes"},
+            "case_three": {"unknown": 1},
+            "case_four": "failed",
+        },
+        "test_a.py::test_other": ["case_one"],
+    }
+
+    store = CaseOutcomeStore(t.cast("Cache", cache))
+
+    assert store.get("test_a.py::test_func") == {"case_one": CaseOutcome(failed=True, failures=2, duration=1.0)}
+    assert store.get("test_a.py::test_other") == {}
+
+
+@pytest.mark.parametrize(
+    ("prune_modules", "expected"),
+    [
+        pytest.param(True, ["test_a.py::test_kept", "test_b.py::test_func"], id="modules"),
+        pytest.param(False, ["test_a.py::test_gone", "test_a.py::test_kept", "test_b.py::test_func"], id="files"),
+    ],
+)
+def test_outcome_recorder_drops_removed_tests(
+    tmp_path: Path,
+    cache: DictCache,
+    *,
+    prune_modules: bool,
+    expected: t.Sequence[str],
+) -> None:
+    (tmp_path / "test_a.py").touch()
+    (tmp_path / "test_b.py").touch()
+    outcome = {"failed": False, "failures": 0, "duration": 0.0}
+    cache.values[CaseOutcomeStore.KEY] = {
+        "test_a.py::test_kept": {"case_one": outcome},
+        "test_a.py::test_gone": {"case_one": outcome},
+        "test_b.py::test_func": {"case_one": outcome},
+        "test_removed.py::test_func": {"case_one": outcome},
+    }
+    recorder = CaseOutcomeRecorder(CaseOutcomeStore(t.cast("Cache", cache)), tmp_path, prune_modules=prune_modules)
+
+    module = FakeNode("test_a.py")
+    recorder.pytest_collection_modifyitems([t.cast("Item", FakeNode("test_a.py::test_kept[case_one]", module))])
+    recorder.pytest_sessionfinish()
+
+    assert sorted(t.cast("dict[str, object]", cache.values[CaseOutcomeStore.KEY])) == expected
+
+
+@pytest.fixture
+def cache() -> DictCache:
+    return DictCache()
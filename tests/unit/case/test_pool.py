@@ -0,0 +1,118 @@
+import asyncio
+import itertools
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pytest_case_provider.case.pool import CasePool
+
+
+class Resource:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.items = list[int]()
+        self.closed = False
+
+
+def test_pool_reuses_reset_resource(factory: t.Callable[[], Resource]) -> None:
+    pool = CasePool(factory, reset=lambda resource: resource.items.clear())
+
+    with pool.acquire() as first:
+        first.items.append(1)
+
+    with pool.acquire() as second:
+        pass
+
+    assert second is first
+    assert second.items == []
+    assert (pool.stats.created, pool.stats.acquisitions) == (1, 2)
+
+
+def test_pool_warmup_creates_resources_ahead(factory: t.Callable[[], Resource]) -> None:
+    pool = CasePool(factory, max_size=3, warm=2)
+
+    pool.warmup()
+
+    assert (pool.stats.size, pool.stats.created, pool.stats.acquisitions) == (2, 2, 0)
+
+
+def test_pool_grows_up_to_max_size(factory: t.Callable[[], Resource]) -> None:
+    pool = CasePool(factory, max_size=2)
+
+    def use() -> int:
+        with pool.acquire() as resource:
+            time.sleep(0.02)
+            return resource.index
+
+    with ThreadPoolExecutor(4) as executor:
+        indexes = set(executor.map(lambda _: use(), range(8)))
+
+    stats = pool.stats
+    assert indexes == {0, 1}
+    assert (stats.created, stats.peak, stats.acquisitions) == (2, 2, 8)
+    assert stats.waits > 0
+    assert stats.max_wait > 0
+    assert 0 < stats.utilization <= 1
+
+
+def test_pool_acquire_timeout(factory: t.Callable[[], Resource]) -> None:
+    pool = CasePool(factory)
+
+    with pool.acquire(), pytest.raises(TimeoutError), pool.acquire(timeout=0.01):
+        pass
+
+
+def test_pool_discards_resource_that_failed_to_reset(factory: t.Callable[[], Resource]) -> None:
+    def reset(resource: Resource) -> None:
+        if resource.items:
+            raise RuntimeError
+
+    pool = CasePool(factory, reset=reset, close=lambda resource: setattr(resource, "closed", True))
+
+    with pytest.raises(RuntimeError), pool.acquire() as broken:
+        broken.items.append(1)
+
+    with pool.acquire() as resource:
+        pass
+
+    assert broken.closed
+    assert resource is not broken
+    assert (pool.stats.size, pool.stats.created, pool.stats.discarded) == (1, 2, 1)
+
+
+def test_pool_close_closes_idle_resources(factory: t.Callable[[], Resource]) -> None:
+    pool = CasePool(factory, close=lambda resource: setattr(resource, "closed", True))
+
+    with pool.acquire() as resource:
+        pass
+
+    pool.close()
+
+    assert resource.closed
+    assert pool.stats.size == 0
+
+
+async def test_pool_acquire_async_waits_for_released_resource(factory: t.Callable[[], Resource]) -> None:
+    pool = CasePool(factory)
+
+    async def use() -> int:
+        async with pool.acquire_async() as resource:
+            await asyncio.sleep(0.01)
+            return resource.index
+
+    assert await asyncio.gather(*(use() for _ in range(3))) == [0, 0, 0]
+    assert (pool.stats.created, pool.stats.waits) == (1, 2)
+
+
+@pytest.mark.parametrize(("max_size", "warm"), [(0, 0), (1, 2), (1, -1)])
+def test_pool_invalid_size(factory: t.Callable[[], Resource], max_size: int, warm: int) -> None:
+    with pytest.raises(ValueError, match="should be"):
+        CasePool(factory, max_size=max_size, warm=warm)
+
+
+@pytest.fixture
+def factory() -> t.Callable[[], Resource]:
+    counter = itertools.count()
+    return lambda: Resource(next(counter))
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+from pytest_case_provider.case.info import CaseInfo
+from pytest_case_provider.case.resource import CaseResource
+
+
+def test_resource_view_is_read_only_slice(tmp_path: Path) -> None:
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"hello world")
+    resource = CaseResource(path)
+
+    view = resource.view(6)
+
+    assert view.readonly
+    assert view.tobytes() == b"world"
+    with pytest.raises(TypeError):
+        view[0] = 0
+
+
+def test_resource_view_of_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.bin"
+    path.touch()
+
+    assert CaseResource(path).view().tobytes() == b""
+
+
+def test_resource_records(tmp_path: Path) -> None:
+    path = tmp_path / "records.txt"
+    path.write_bytes(b"one\ntwo\nthree\n")
+
+    assert CaseResource(path).records(b"\n") == [(0, 3), (4, 7), (8, 13)]
+
+
+def test_resource_record_cases(request: SubRequest, tmp_path: Path) -> None:
+    path = tmp_path / "records.txt"
+    path.write_bytes(b"one\ntwo")
+
+    cases = list(CaseResource(path).cases(delimiter=b"\n").collect_cases())
+
+    assert [case.name for case in cases] == ["records.txt#0", "records.txt#1"]
+    assert [provide(case, request).tobytes() for case in cases] == [b"one", b"two"]
+
+
+def test_resource_directory_cases(request: SubRequest, tmp_path: Path) -> None:
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "a.bin").write_bytes(b"a")
+    (tmp_path / "nested" / "b.bin").write_bytes(b"b")
+    (tmp_path / "c.txt").write_bytes(b"c")
+
+    cases = list(CaseResource.directory(tmp_path, "**/*.bin").collect_cases())
+
+    assert [case.name for case in cases] == ["a.bin", "nested/b.bin"]
+    assert [provide(case, request).tobytes() for case in cases] == [b"a", b"b"]
+
+
+def provide(case: CaseInfo[memoryview], request: SubRequest) -> memoryview:
+    with case.provider.provide_sync(request) as value:
+        return value
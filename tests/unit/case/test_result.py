@@ -0,0 +1,69 @@
+import typing as t
+from pathlib import Path
+
+import pytest
+from _pytest.reports import TestReport
+
+from pytest_case_provider.case.info import set_report_case
+from pytest_case_provider.case.result import CaseFingerprinter, CaseResultCache
+
+if t.TYPE_CHECKING:
+    from _pytest.cacheprovider import Cache
+
+
+class DictCache:
+    def __init__(self) -> None:
+        self.values = dict[str, object]()
+
+    def get(self, key: str, default: object) -> object:
+        return self.values.get(key, default)
+
+    def set(self, key: str, value: object) -> None:
+        self.values[key] = value
+
+
+def test_result_cache_records_reports_sent_by_workers(cache: DictCache) -> None:
+    result_cache = CaseResultCache(t.cast("Cache", cache), CaseFingerprinter(Path.cwd()))
+
+    for when in ("setup", "call", "teardown"):
+        result_cache.pytest_runtest_logreport(build_report("case_one", when, "passed", fingerprint="one"))
+        result_cache.pytest_runtest_logreport(build_report("case_two", when, "failed", fingerprint="two"))
+
+    result_cache.pytest_sessionfinish()
+
+    assert cache.values[CaseResultCache.KEY] == {"run": 1, "passed": {"test.py::test_func": {"case_one": "one"}}}
+
+
+def test_result_cache_is_saved_by_controller_only(cache: DictCache) -> None:
+    workeroutput = dict[str, object]()
+    result_cache = CaseResultCache(t.cast("Cache", cache), CaseFingerprinter(Path.cwd()), workeroutput=workeroutput)
+
+    result_cache.pytest_runtest_logreport(build_report("case_one", "call", "passed", fingerprint="one"))
+    result_cache.pytest_sessionfinish()
+
+    assert cache.values == {}
+    assert workeroutput == {"case_result_cache": [0, 0, 0]}
+
+
+def build_report(
+    case_name: str,
+    when: t.Literal["setup", "call", "teardown"],
+    outcome: t.Literal["passed", "failed"],
+    fingerprint: str,
+) -> TestReport:
+    report = TestReport(
+        nodeid=f"test.py::test_func[{case_name}]",
+        location=("test.py", 0, f"test_func[{case_name}]"),
+        keywords={},
+        outcome=outcome,
+        longrepr=None,
+        when=when,
+    )
+    set_report_case(report, "test.py::test_func", case_name)
+    report.case_fingerprint = fingerprint  # type: ignore[attr-defined]
+    return report
+
+
+@pytest.fixture
+def cache() -> DictCache:
+    return DictCache()
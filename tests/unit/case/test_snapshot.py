@@ -0,0 +1,109 @@
+import asyncio
+import pickle
+import typing as t
+
+import pytest
+from _pytest.fixtures import SubRequest
+from typing_extensions import override
+
+from pytest_case_provider.case.snapshot import CaseSnapshot, SnapshotCaseProvider, is_immutable
+from pytest_case_provider.case.storage import build_case_provider
+
+
+class Frame:
+    """Uses the restored out of band buffer as is (like numpy arrays)."""
+
+    def __init__(self, data: t.Union[bytearray, memoryview]) -> None:
+        self.data = memoryview(data)
+
+    @override
+    def __reduce_ex__(self, protocol: t.SupportsIndex) -> tuple[type["Frame"], tuple[pickle.PickleBuffer]]:
+        return Frame, (pickle.PickleBuffer(self.data),)
+
+
+def test_snapshot_restores_independent_copies() -> None:
+    snapshot = CaseSnapshot({"items": [1, 2], "data": bytearray(b"abc")})
+
+    first = snapshot.restore()
+    first["items"].append(3)
+    first["data"][0] = 0
+
+    assert snapshot.restore() == {"items": [1, 2], "data": bytearray(b"abc")}
+
+
+def test_snapshot_restores_writable_out_of_band_buffers() -> None:
+    snapshot = CaseSnapshot(Frame(bytearray(b"abc")))
+
+    first = snapshot.restore()
+    first.data[0] = ord("x")
+
+    assert bytes(first.data) == b"xbc"
+    assert bytes(snapshot.restore().data) == b"abc"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param(42, True),
+        pytest.param("text", True),
+        pytest.param((1, ("nested", b"bytes")), True),
+        pytest.param(frozenset({1, 2}), True),
+        pytest.param((1, [2]), False),
+        pytest.param([1], False),
+        pytest.param({"key": 1}, False),
+    ],
+)
+def test_is_immutable(value: object, *, expected: bool) -> None:
+    assert is_immutable(value) is expected
+
+
+def test_snapshot_provider_builds_value_once(request: SubRequest) -> None:
+    calls = list[str]()
+
+    def case_items() -> t.Iterator[list[int]]:
+        calls.append("setup")
+        yield [1, 2]
+        calls.append("teardown")
+
+    provider = SnapshotCaseProvider[list[int]](case_items)
+
+    with provider.provide_sync(request) as first:
+        first.append(3)
+
+    with provider.provide_sync(request) as second:
+        assert second == [1, 2]
+
+    assert calls == ["setup", "teardown"]
+
+
+def test_snapshot_provider_returns_immutable_value_as_is(request: SubRequest) -> None:
+    value = (1, "two")
+    provider = SnapshotCaseProvider[tuple[int, str]](lambda: value)
+
+    with provider.provide_sync(request) as first, provider.provide_sync(request) as second:
+        assert first is value
+        assert second is value
+
+
+async def test_snapshot_provider_async(request: SubRequest) -> None:
+    calls = list[str]()
+
+    async def case_items() -> dict[str, int]:
+        await asyncio.sleep(0)
+        calls.append("setup")
+        return {"a": 1}
+
+    provider = SnapshotCaseProvider[dict[str, int]](case_items)
+
+    async with provider.provide_async(request) as first:
+        first["b"] = 2
+
+    async with provider.provide_async(request) as second:
+        assert second == {"a": 1}
+
+    assert calls == ["setup"]
+
+
+def test_build_case_provider_rejects_unknown_isolation() -> None:
+    with pytest.raises(ValueError, match="unknown case isolation: 'unknown'"):
+        build_case_provider(lambda: 1, t.cast("t.Any", "unknown"))
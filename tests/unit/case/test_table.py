@@ -0,0 +1,74 @@
+from array import array
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+from pytest_case_provider import CaseTable, CaseTableRow
+
+
+def test_case_table_collects_row_per_case(case_table: CaseTable) -> None:
+    assert [case.name for case in case_table.collect_cases()] == ["x=1-name=one", "x=2-name=two", "x=3-name=three"]
+
+
+def test_case_table_default_case_names() -> None:
+    table = CaseTable({"x": [1, 2]})
+
+    assert [case.name for case in table.collect_cases()] == ["row0", "row1"]
+
+
+def test_case_table_callable_case_names() -> None:
+    table = CaseTable({"x": [1, 2]}, name=lambda row: f"case_{row.index}_{row.x}")
+
+    assert [case.name for case in table.collect_cases()] == ["case_0_1", "case_1_2"]
+
+
+def test_case_table_provides_row_views(request: SubRequest, case_table: CaseTable) -> None:
+    rows = list[CaseTableRow]()
+    for case in case_table.collect_cases():
+        with case.provider.provide_sync(request) as row:
+            rows.append(row)
+
+    assert [row.as_dict() for row in rows] == [
+        {"x": 1, "y": 0.5, "name": "one"},
+        {"x": 2, "y": 1.5, "name": "two"},
+        {"x": 3, "y": 2.5, "name": "three"},
+    ]
+    assert rows[1].x == rows[1][0] == rows[1]["x"] == 2  # noqa: PLR2004
+    assert rows[2].as_tuple() == (3, 2.5, "three")
+
+
+def test_case_table_row_reads_columns_without_copy() -> None:
+    data = bytearray(b"\x01\x02")
+    table = CaseTable({"byte": data})
+    row = table.row(1)
+
+    data[1] = 42
+
+    assert row.byte == 42  # noqa: PLR2004
+
+
+def test_case_table_row_raises_attribute_error_for_unknown_column(case_table: CaseTable) -> None:
+    with pytest.raises(AttributeError):
+        _ = case_table.row(0).unknown
+
+
+def test_case_table_row_index_out_of_range(case_table: CaseTable) -> None:
+    with pytest.raises(IndexError):
+        case_table.row(len(case_table))
+
+
+def test_case_table_columns_must_have_same_length() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        CaseTable({"x": [1, 2], "y": [1]})
+
+
+@pytest.fixture
+def case_table() -> CaseTable:
+    return CaseTable(
+        {
+            "x": array("i", [1, 2, 3]),
+            "y": array("d", [0.5, 1.5, 2.5]),
+            "name": ["one", "two", "three"],
+        },
+        name="x={x}-name={name}",
+    )
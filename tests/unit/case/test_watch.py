@@ -0,0 +1,176 @@
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from pytest_case_provider.case.watch import CaseSourceChanges, CaseWatchIndex, find_changed_functions
+
+SOURCE = """
+import pytest
+
+OFFSET = 0
+
+
+def make_adder(n):
+    def add(value):
+        return value + n
+
+    return add
+
+
+def case_one() -> int:
+    return 1 + OFFSET
+
+
+@pytest.mark.skip
+def case_two() -> int:
+    return 2
+
+
+class TestClass:
+    def case_three(self) -> int:
+        return 3
+"""
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "expected"),
+    [
+        pytest.param(
+            "def case_one() -> int:\n    return 1\n",
+            "def case_one() -> int:\n    return 10\n",
+            CaseSourceChanges(patched=["case_one"], restart=[]),
+            id="body",
+        ),
+        pytest.param(
+            "def case_one() -> int:\n    return 1\n",
+            "\n\n# comment\ndef case_one() -> int:\n    return 1\n",
+            CaseSourceChanges(patched=[], restart=[]),
+            id="lines shifted",
+        ),
+        pytest.param(
+            "def case_one() -> int:\n    return 1\n",
+            "def case_one(value: int) -> int:\n    return value\n",
+            CaseSourceChanges(patched=[], restart=["case_one"]),
+            id="signature",
+        ),
+        pytest.param(
+            "def case_one() -> int:\n    return 1\n",
+            "@pytest.mark.skip\ndef case_one() -> int:\n    return 1\n",
+            CaseSourceChanges(patched=[], restart=["case_one"]),
+            id="decorators",
+        ),
+        pytest.param(
+            "def case_one() -> int:\n    return 1\n",
+            "def case_two() -> int:\n    return 1\n",
+            CaseSourceChanges(patched=[], restart=["case_one", "case_two"]),
+            id="renamed",
+        ),
+        pytest.param(
+            "class TestClass:\n    def case_one(self) -> int:\n        return 1\n",
+            "class TestClass:\n    def case_one(self) -> int:\n        return 2\n",
+            CaseSourceChanges(patched=["TestClass.case_one"], restart=[]),
+            id="method",
+        ),
+        pytest.param(
+            "LIMIT = 1\n\ndef case_one() -> int:\n    return LIMIT\n",
+            "LIMIT = 2\n\ndef case_one() -> int:\n    return LIMIT\n",
+            CaseSourceChanges(patched=[], restart=[], module=True),
+            id="constant",
+        ),
+        pytest.param(
+            "class TestClass:\n    limit = 1\n",
+            "class TestClass:\n    limit = 2\n",
+            CaseSourceChanges(patched=[], restart=[], module=True),
+            id="class attribute",
+        ),
+    ],
+)
+def test_find_changed_functions(old: str, new: str, expected: CaseSourceChanges) -> None:
+    assert find_changed_functions(old, new) == expected
+
+
+def test_watch_index_replaces_code_of_changed_functions(module_path: Path, module: types.ModuleType) -> None:
+    index = CaseWatchIndex[str]()
+    index.add(module.case_one, "item-1")
+    index.add(module.case_two, "item-2")
+    index.add(module.TestClass.case_three, "item-3")
+
+    new_source = SOURCE.replace("return 1", "return 10").replace("return 3", "return 30")
+    changes, owners = index.reload(module_path, SOURCE, new_source)
+
+    assert changes == CaseSourceChanges(patched=["case_one", "TestClass.case_three"], restart=[])
+    assert owners == ["item-1", "item-3"]
+    assert (module.case_one(), module.case_two(), module.TestClass().case_three()) == (10, 2, 30)
+
+
+def test_watch_index_patches_not_indexed_functions(module_path: Path, module: types.ModuleType) -> None:
+    index = CaseWatchIndex[str]()
+    index.add(module.case_one, "item-1")
+    adder = module.make_adder(1)
+
+    changes, owners = index.reload(module_path, SOURCE, SOURCE.replace("return value + n", "return value + n * 2"))
+
+    assert changes == CaseSourceChanges(patched=["make_adder"], restart=[])
+    assert owners == []
+    # NOTE: closures built before the change keep the old code.
+    assert (module.make_adder(1)(1), adder(1)) == (3, 2)
+
+
+def test_watch_index_requires_restart_when_code_does_not_fit(module_path: Path, module: types.ModuleType) -> None:
+    index = CaseWatchIndex[str]()
+    index.add(module.TestClass.case_three, "item-3")
+
+    # NOTE: `super()` adds `__class__` free variable to the method code, so the code can't replace the old one.
+    changes, owners = index.reload(module_path, SOURCE, SOURCE.replace("return 3", "return super().__sizeof__()"))
+
+    assert changes == CaseSourceChanges(patched=[], restart=["TestClass.case_three"])
+    assert owners == []
+    assert module.TestClass().case_three() == module.case_two() + 1
+
+
+def test_watch_index_assigns_changed_module_constants(module_path: Path, module: types.ModuleType) -> None:
+    index = CaseWatchIndex[str]()
+    index.add(module.case_one, "item-1")
+    index.add(module.case_two, "item-2")
+
+    changes, owners = index.reload(module_path, SOURCE, SOURCE.replace("OFFSET = 0", "OFFSET = 10"))
+
+    assert changes == CaseSourceChanges(patched=[], restart=[], module=True)
+    assert owners == ["item-1", "item-2"]
+    assert (module.case_one(), module.case_two()) == (11, 2)
+
+
+def test_watch_index_requires_restart_for_other_module_changes(module_path: Path, module: types.ModuleType) -> None:
+    index = CaseWatchIndex[str]()
+    index.add(module.TestClass.case_three, "item-3")
+
+    new_source = SOURCE.replace("class TestClass:", "class TestClass:\n    limit = 1\n").replace(
+        "return 1 +", "return 2 +"
+    )
+    changes, owners = index.reload(module_path, SOURCE, new_source)
+
+    assert changes == CaseSourceChanges(patched=["case_one"], restart=["<module>"], module=True)
+    assert owners == ["item-3"]
+    assert (module.case_one(), hasattr(module.TestClass, "limit")) == (2, False)
+
+
+@pytest.fixture
+def module_path(tmp_path: Path) -> Path:
+    path = tmp_path / "watched_cases.py"
+    path.write_text(SOURCE)
+    return path.resolve()
+
+
+@pytest.fixture
+def module(module_path: Path, monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    spec = importlib.util.spec_from_file_location("watched_cases", module_path)
+    assert spec is not None
+    assert spec.loader is not None
+
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "watched_cases", module)
+    spec.loader.exec_module(module)
+    return module